@@ -0,0 +1,268 @@
+# cython: language_level=3
+"""
+Offline end-to-end benchmark for transmeet.
+
+Generates a synthetic meeting, starts benchmarks/stub_server.py as a stand-in
+for the provider API, and runs the real pipeline against it:
+transcribe_audio_file (decode, split, parallel upload) and then the meeting
+minutes. Records wall time, per-stage time, peak RSS, bytes uploaded and
+requests per minute in benchmarks/results/, and can compare a run with an
+earlier result. The pipeline runs in a fresh child process, so peak RSS is
+its own and not that of the audio generator.
+
+Examples:
+    python benchmarks/run_benchmark.py --audio-minutes 30 --latency-ms 400 --rate-429 0.05
+    python benchmarks/run_benchmark.py --label after --compare benchmarks/results/<before>.json
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+ROOT_DIR = BENCHMARK_DIR.parent
+sys.path.insert(0, str(ROOT_DIR))
+sys.path.insert(0, str(BENCHMARK_DIR))
+
+# Metrics compared by --compare, and whether a higher value is better.
+COMPARED_METRICS = {
+    "wall_s": False,
+    "transcription_s": False,
+    "minutes_s": False,
+    "peak_rss_mb": False,
+    "bytes_uploaded": False,
+    "requests_per_minute": True,
+    "audio_minutes_per_wall_minute": True,
+}
+
+
+def start_stub_server(args):
+    command = [
+        sys.executable, str(BENCHMARK_DIR / "stub_server.py"), "--port", "0",
+        "--latency-ms", str(args.latency_ms), "--jitter-ms", str(args.jitter_ms),
+        "--rate-429", str(args.rate_429), "--error-rate", str(args.error_rate), "--seed", str(args.seed),
+    ]
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    address = json.loads(process.stdout.readline())
+    return process, f"http://{address['host']}:{address['port']}"
+
+
+def server_stats(base_url):
+    with urllib.request.urlopen(f"{base_url}/stats", timeout=10) as response:
+        return json.load(response)
+
+
+def peak_rss_mb():
+    """Lifetime peak of this process, so call it from the process being measured."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def code_version():
+    try:
+        return subprocess.run(["git", "describe", "--always", "--dirty"], cwd=ROOT_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def point_sdks_at(base_url):
+    os.environ["GROQ_BASE_URL"] = base_url
+    os.environ["OPENAI_BASE_URL"] = f"{base_url}/v1"
+    os.environ.setdefault("GROQ_API_KEY", "benchmark")
+    os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+
+
+def run(args):
+    from synthetic_audio import write_synthetic_meeting
+
+    workdir = Path(tempfile.mkdtemp(prefix="transmeet-bench-"))
+    audio_path = workdir / f"meeting.{args.audio_format}"
+    started = time.perf_counter()
+    write_synthetic_meeting(audio_path, args.audio_minutes, args.audio_format, seed=args.seed)
+    generate_s = time.perf_counter() - started
+
+    server, base_url = start_stub_server(args)
+    try:
+        point_sdks_at(base_url)
+        # A spawned interpreter starts without the generator's samples or imports.
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+            return pool.submit(measure, args, audio_path, base_url, generate_s).result()
+    finally:
+        server.terminate()
+        server.wait()
+        audio_path.unlink(missing_ok=True)
+        workdir.rmdir()
+
+
+def measure(args, audio_path, base_url, generate_s):
+    from transmeet import (
+        configure_response_cache,
+        configure_transcription_cache,
+        generate_meeting_minutes_from_transcript,
+        transcribe_audio_file,
+    )
+    from transmeet.llm.rate_limiter import configure_rate_limit
+    from transmeet.llm.token_tracker import reset_usage_stats
+    from transmeet.utils.tracing import reset_tracing, run_report
+
+    # Measure the pipeline, not the caches, and let the stub decide about 429s.
+    configure_transcription_cache(enabled=False)
+    configure_response_cache(None)
+    configure_rate_limit(args.provider, args.transcription_model, requests_per_minute=args.rpm)
+    configure_rate_limit(args.provider, args.llm_model, requests_per_minute=args.rpm)
+    reset_tracing()
+    reset_usage_stats()
+
+    started = time.perf_counter()
+    transcript = transcribe_audio_file(
+        str(audio_path),
+        llm_client=args.provider,
+        llm_model=args.transcription_model,
+        audio_chunk_size_mb=args.chunk_size_mb,
+        audio_chunk_overlap=args.chunk_overlap,
+        streaming=args.streaming,
+        upload_format=args.upload_format,
+        audio_chunk_seconds=args.chunk_seconds,
+    )
+    transcription_s = time.perf_counter() - started
+    transcription_ok = not transcript.startswith("Error:")
+
+    minutes_s, minutes_ok = 0.0, None
+    if args.with_minutes and transcription_ok:
+        minutes_started = time.perf_counter()
+        minutes = generate_meeting_minutes_from_transcript(
+            transcript, args.provider, args.llm_model, max_input_tokens=args.max_input_tokens
+        )
+        minutes_s = time.perf_counter() - minutes_started
+        minutes_ok = bool(minutes) and not minutes.startswith("Error:")
+    wall_s = time.perf_counter() - started
+
+    stats = server_stats(base_url)
+    report = run_report()
+    metrics = {
+        "wall_s": wall_s,
+        "transcription_s": transcription_s,
+        "minutes_s": minutes_s,
+        "audio_generation_s": generate_s,
+        "peak_rss_mb": peak_rss_mb(),
+        "bytes_uploaded": stats["bytes_uploaded_audio"],
+        "requests": stats["requests"],
+        "rate_limited": stats["rate_limited"],
+        "server_errors": stats["errors"],
+        "requests_per_minute": stats["requests"] / (wall_s / 60) if wall_s else 0.0,
+        "audio_minutes_per_wall_minute": args.audio_minutes / (wall_s / 60) if wall_s else 0.0,
+        "transcription_ok": transcription_ok,
+        "minutes_ok": minutes_ok,
+    }
+    return {
+        "label": args.label,
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "version": code_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": {k: v for k, v in vars(args).items() if k not in ("compare", "results_dir")},
+        "metrics": metrics,
+        "stages": report["stages"],
+        "usage": report["usage"],
+    }
+
+
+def save_result(result, results_dir):
+    results_dir = Path(results_dir)
+    results_dir.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    path = results_dir / f"{stamp}-{result['label']}.json"
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2)
+    return path
+
+
+def print_result(result):
+    metrics = result["metrics"]
+    print(f"\n{result['label']} @ {result['version']}")
+    for name, value in metrics.items():
+        print(f"  {name:<32} {value:.3f}" if isinstance(value, float) else f"  {name:<32} {value}")
+    print("  stages (total s / calls / max s):")
+    for name, stage in sorted(result["stages"].items(), key=lambda item: -item[1]["total_s"]):
+        print(f"    {name:<28} {stage['total_s']:9.3f} {stage['count']:6d} {stage['max_s']:8.3f}")
+
+
+def compare(result, baseline_path, max_regression):
+    """Print metric changes against a stored result; return the metrics that regressed."""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    def settings(params):
+        return {k: v for k, v in params.items() if k != "label"}
+
+    if settings(baseline["params"]) != settings(result["params"]):
+        print("⚠️ Baseline was recorded with different parameters; differences may not be meaningful.")
+
+    regressed = []
+    print(f"\nCompared with {baseline['label']} @ {baseline['version']} ({baseline_path}):")
+    for name, higher_is_better in COMPARED_METRICS.items():
+        before, after = baseline["metrics"].get(name), result["metrics"].get(name)
+        if not before or after is None:
+            continue
+        change = (after - before) / before
+        worse = -change if higher_is_better else change
+        flag = "  ← regression" if worse > max_regression else ""
+        if flag:
+            regressed.append(name)
+        print(f"  {name:<32} {before:12.3f} → {after:12.3f} ({change:+.1%}){flag}")
+    return regressed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Offline transmeet benchmark against a local stub provider.")
+    parser.add_argument("--label", default="run", help="Name stored with the result (default: run)")
+    parser.add_argument("--audio-minutes", type=float, default=10.0, help="Length of the synthetic meeting")
+    parser.add_argument("--audio-format", default="wav", help="Format of the synthetic recording (default: wav)")
+    parser.add_argument("--provider", choices=["groq", "openai"], default="groq")
+    parser.add_argument("--transcription-model", default="whisper-large-v3-turbo")
+    parser.add_argument("--llm-model", default="llama-3.3-70b-versatile")
+    parser.add_argument("--upload-format", default="flac")
+    parser.add_argument("--chunk-size-mb", type=float, default=18)
+    parser.add_argument("--chunk-overlap", type=float, default=2.0)
+    parser.add_argument("--chunk-seconds", type=float, default=None)
+    parser.add_argument("--streaming", action="store_true")
+    parser.add_argument("--with-minutes", action="store_true", help="Also generate meeting minutes")
+    parser.add_argument("--max-input-tokens", type=int, default=None)
+    parser.add_argument("--rpm", type=float, default=6000, help="Client-side requests per minute (default: 6000)")
+    parser.add_argument("--latency-ms", type=float, default=250.0)
+    parser.add_argument("--jitter-ms", type=float, default=50.0)
+    parser.add_argument("--rate-429", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--results-dir", default=str(BENCHMARK_DIR / "results"))
+    parser.add_argument("--compare", default=None, metavar="RESULT_JSON", help="Earlier result to compare with")
+    parser.add_argument("--max-regression", type=float, default=0.10,
+                        help="Fail when a compared metric is worse by more than this fraction (default: 0.10)")
+    args = parser.parse_args(argv)
+
+    result = run(args)
+    print_result(result)
+    path = save_result(result, args.results_dir)
+    print(f"\nSaved to {path}")
+
+    if not result["metrics"]["transcription_ok"]:
+        return 1
+    if args.compare and compare(result, args.compare, args.max_regression):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,191 @@
+# cython: language_level=3
+"""
+Local stand-in for the Groq and OpenAI HTTP APIs used by transmeet.
+
+Answers ``.../audio/transcriptions`` and ``.../chat/completions`` (including
+streamed completions) after a configurable latency, and rejects a configurable
+share of requests with 429 or 500. ``GET /stats`` returns request and byte
+counts. Point the SDKs at it with GROQ_BASE_URL=http://HOST:PORT and
+OPENAI_BASE_URL=http://HOST:PORT/v1.
+
+Usage: python benchmarks/stub_server.py --port 8765 --latency-ms 300 --rate-429 0.05
+"""
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+WORDS = ("we should ship the release on friday after the review and then plan the next "
+         "quarter budget with the team so that everyone agrees on the priorities").split()
+
+
+class StubState:
+    def __init__(self, latency_ms=250.0, jitter_ms=50.0, rate_429=0.0, error_rate=0.0,
+                 words_per_second=2.5, completion_words=300, seed=None):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.rate_429 = rate_429
+        self.error_rate = error_rate
+        self.words_per_second = words_per_second
+        self.completion_words = completion_words
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.counts = {"requests": 0, "transcriptions": 0, "completions": 0, "rate_limited": 0,
+                       "errors": 0, "bytes_received": 0, "bytes_uploaded_audio": 0}
+
+    def count(self, **increments):
+        with self.lock:
+            for key, value in increments.items():
+                self.counts[key] += value
+
+    def draw(self):
+        """Latency in seconds and the outcome (None, 429 or 500) for one request."""
+        with self.lock:
+            latency = max(0.0, self.random.gauss(self.latency_ms, self.jitter_ms)) / 1000
+            roll = self.random.random()
+        if roll < self.rate_429:
+            return latency, 429
+        if roll < self.rate_429 + self.error_rate:
+            return latency, 500
+        return latency, None
+
+    def text(self, words):
+        return " ".join(WORDS[i % len(WORDS)] for i in range(max(1, int(words))))
+
+    def stats(self):
+        with self.lock:
+            return {**self.counts, "uptime_s": time.time() - self.started}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "transmeet-stub/1.0"
+
+    @property
+    def state(self) -> StubState:
+        return self.server.state
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status, payload, headers=None):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path.rstrip("/") == "/stats":
+            self._send_json(200, self.state.stats())
+        else:
+            self._send_json(404, {"error": {"message": "not found"}})
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        is_audio = self.path.endswith("/audio/transcriptions")
+        is_chat = self.path.endswith("/chat/completions")
+        if not (is_audio or is_chat):
+            self._send_json(404, {"error": {"message": f"unknown endpoint {self.path}"}})
+            return
+
+        self.state.count(requests=1, bytes_received=len(body))
+        latency, failure = self.state.draw()
+        time.sleep(latency)
+        if failure == 429:
+            self.state.count(rate_limited=1)
+            self._send_json(429, {"error": {"message": "rate limited", "type": "rate_limit_exceeded"}},
+                            {"retry-after-ms": "200"})
+            return
+        if failure == 500:
+            self.state.count(errors=1)
+            self._send_json(500, {"error": {"message": "stub server error"}})
+            return
+
+        if is_audio:
+            self.state.count(transcriptions=1, bytes_uploaded_audio=len(body))
+            self._transcription(body)
+        else:
+            self.state.count(completions=1)
+            self._completion(json.loads(body or b"{}"))
+
+    def _transcription(self, body):
+        # 16 kHz mono 16-bit PCM is 32 kB/s; a rough duration for a plausible word count.
+        seconds = len(body) / 32000
+        self._send_json(200, {"text": self.state.text(seconds * self.state.words_per_second)})
+
+    def _completion(self, request):
+        content = self.state.text(self.state.completion_words)
+        prompt_tokens = sum(len(str(m.get("content", "")).split()) for m in request.get("messages", []))
+        usage = {"prompt_tokens": prompt_tokens, "completion_tokens": self.state.completion_words,
+                 "total_tokens": prompt_tokens + self.state.completion_words}
+        base = {"id": "chatcmpl-stub", "created": int(time.time()), "model": request.get("model", "stub")}
+        if not request.get("stream"):
+            self._send_json(200, {
+                **base, "object": "chat.completion",
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": content},
+                             "finish_reason": "stop"}],
+                "usage": usage,
+            })
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        words = content.split(" ")
+        for i in range(0, len(words), 20):
+            piece = " ".join(words[i:i + 20]) + " "
+            self._event({**base, "object": "chat.completion.chunk",
+                         "choices": [{"index": 0, "delta": {"content": piece}, "finish_reason": None}]})
+        self._event({**base, "object": "chat.completion.chunk", "choices": [], "usage": usage,
+                     "x_groq": {"usage": usage}})
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.close_connection = True
+
+    def _event(self, payload):
+        self.wfile.write(f"data: {json.dumps(payload)}\n\n".encode())
+        self.wfile.flush()
+
+
+def start_server(host="127.0.0.1", port=0, **options) -> ThreadingHTTPServer:
+    """Start the stub server on a background thread; ``server.server_port`` is the bound port."""
+    server = ThreadingHTTPServer((host, port), StubHandler)
+    server.daemon_threads = True
+    server.state = StubState(**options)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stand-in Groq/OpenAI server for offline benchmarks.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0, help="0 picks a free port (default)")
+    parser.add_argument("--latency-ms", type=float, default=250.0, help="Mean response latency")
+    parser.add_argument("--jitter-ms", type=float, default=50.0, help="Standard deviation of the latency")
+    parser.add_argument("--rate-429", type=float, default=0.0, help="Share of requests answered with 429")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with 500")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    server = start_server(args.host, args.port, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                          rate_429=args.rate_429, error_rate=args.error_rate, seed=args.seed)
+    # The first line tells a parent process where to connect.
+    print(json.dumps({"host": args.host, "port": server.server_port}), flush=True)
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
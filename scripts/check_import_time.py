@@ -0,0 +1,78 @@
+# cython: language_level=3
+"""
+Import-time regression check for `import transmeet` and the CLI entry point.
+
+Each import runs in a fresh interpreter in an empty directory and must:
+  * finish within the budget (best of several runs, in milliseconds),
+  * leave the audio libraries, provider SDKs and tokenizer unimported,
+  * create no files (e.g. log directories).
+
+Usage: python scripts/check_import_time.py [--budget-ms 150] [--runs 5]
+Exits with status 1 when a check fails.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+HEAVY_MODULES = ["pydub", "numpy", "speech_recognition", "groq", "openai", "tiktoken", "httpx"]
+
+TARGETS = {
+    "import transmeet": "import transmeet",
+    "transmeet.cli": "import transmeet.cli",
+}
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+exec({statement!r})
+elapsed_ms = (time.perf_counter() - start) * 1000
+print(json.dumps({{"ms": elapsed_ms, "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def measure(statement, runs):
+    env = dict(os.environ, PYTHONPATH=str(ROOT_DIR) + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    best_ms, loaded, created = float("inf"), [], []
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory() as workdir:
+            output = subprocess.run(
+                [sys.executable, "-c", PROBE.format(statement=statement, heavy=HEAVY_MODULES)],
+                cwd=workdir, env=env, capture_output=True, text=True, check=True,
+            ).stdout
+            created = created or os.listdir(workdir)
+        result = json.loads(output.strip().splitlines()[-1])
+        best_ms = min(best_ms, result["ms"])
+        loaded = loaded or result["loaded"]
+    return best_ms, loaded, created
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check transmeet import time and side effects.")
+    parser.add_argument("--budget-ms", type=float, default=150.0, help="Allowed import time (default: 150)")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per import; the fastest counts (default: 5)")
+    args = parser.parse_args(argv)
+
+    failed = False
+    for name, statement in TARGETS.items():
+        best_ms, loaded, created = measure(statement, args.runs)
+        problems = []
+        if best_ms > args.budget_ms:
+            problems.append(f"over budget ({args.budget_ms:.0f} ms)")
+        if loaded:
+            problems.append(f"imported {', '.join(loaded)}")
+        if created:
+            problems.append(f"created {', '.join(created)}")
+        failed = failed or bool(problems)
+        status = "FAIL: " + "; ".join(problems) if problems else "ok"
+        print(f"{name:<20} {best_ms:7.1f} ms  {status}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -44,6 +44,9 @@ setup(
         "transmeet": ["*.conf", "*.ini", "*.json", "prompts/**/*"],
     },
     install_requires= load_requirements("requirements.txt"),
+    extras_require={
+        "local": ["faster-whisper>=1.1"],
+    },
     python_requires= PYTHON_REQUIRES,
     classifiers=[
         "Development Status :: 3 - Alpha",
@@ -0,0 +1,76 @@
+import asyncio
+import threading
+
+import pytest
+
+from transmeet import processor
+from transmeet.llm import llm_tasks
+from transmeet.llm.map_reduce import MAP_SYSTEM_PROMPT, TASK_FOCUS, split_text_by_tokens
+
+
+class _WordEncoder:
+    def encode(self, text):
+        return text.split()
+
+    def decode(self, tokens):
+        return " ".join(tokens)
+
+
+class _Tracker:
+    encoder = _WordEncoder()
+
+
+class _RecordingManager:
+    """Answers map calls with short notes and records every request."""
+
+    token_tracker = _Tracker()
+
+    def __init__(self):
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def generate_response(self, system_prompt, user_prompt, use_cache=True, context=None):
+        with self.lock:
+            self.requests.append((system_prompt, user_prompt, context))
+        if context is None:
+            return "short notes."
+        return '{"topic": []}' if system_prompt == "mind_map system" else "done"
+
+    async def generate_response_async(self, system_prompt, user_prompt, use_cache=True, context=None):
+        return self.generate_response(system_prompt, user_prompt, use_cache, context)
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    manager = _RecordingManager()
+    monkeypatch.setattr(processor, "create_llm_manager", lambda provider, model_name: manager)
+    monkeypatch.setattr(llm_tasks, "load_prompt", lambda task_name, prompt_type: f"{task_name} {prompt_type}")
+    return manager
+
+
+TRANSCRIPT = " ".join(f"Point number {i} was raised." for i in range(200))
+ARTIFACTS = ["meeting_minutes", "mind_map", "podcast_script", "speaker_segmentation"]
+
+
+def _check_condensed_once(manager, results):
+    map_requests = [r for r in manager.requests if r[2] is None]
+    task_requests = [r for r in manager.requests if r[2] is not None]
+    sections = len(split_text_by_tokens(TRANSCRIPT, _WordEncoder(), 300))
+
+    assert "error" not in results["mind_map"] and results["meeting_minutes"] == "done"
+    assert len(map_requests) == sections
+    assert {r[0] for r in map_requests} == {MAP_SYSTEM_PROMPT.format(focus=TASK_FOCUS["artifacts"])}
+    contexts = {system: context for system, _, context in task_requests}
+    summarizing = {contexts[f"{task} system"] for task in ("meeting_minutes", "mind_map", "podcast_script")}
+    assert len(summarizing) == 1 and "short notes." in summarizing.pop()
+    assert TRANSCRIPT in contexts["speaker_segmentation system"]
+
+
+def test_artifacts_condense_the_transcript_once(manager):
+    results = processor.generate_artifacts(TRANSCRIPT, ARTIFACTS, max_input_tokens=300)
+    _check_condensed_once(manager, results)
+
+
+def test_async_artifacts_condense_the_transcript_once(manager):
+    results = asyncio.run(processor.generate_artifacts_async(TRANSCRIPT, ARTIFACTS, max_input_tokens=300))
+    _check_condensed_once(manager, results)
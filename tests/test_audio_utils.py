@@ -0,0 +1,106 @@
+import sys
+
+import pytest
+from pydub import AudioSegment
+from pydub.generators import Sine
+
+from transmeet.utils.audio_utils import (
+    compress_silences,
+    find_pause_boundary,
+    frame_levels_db,
+    map_to_source_ms,
+    silence_threshold_db,
+    slice_offset_map,
+    stream_audio_chunks,
+)
+
+FRAME_RATE = 16000
+
+
+def _recording(*parts):
+    """Tone for ("tone", ms) parts and digital silence for ("pause", ms) parts."""
+    audio = AudioSegment.empty().set_frame_rate(FRAME_RATE)
+    for kind, duration in parts:
+        if kind == "tone":
+            audio += Sine(440, sample_rate=FRAME_RATE).to_audio_segment(duration=duration, volume=-12)
+        else:
+            audio += AudioSegment.silent(duration=duration, frame_rate=FRAME_RATE)
+    return audio
+
+
+def _boundary(audio, start_ms=0, end_ms=None):
+    levels = frame_levels_db(audio)
+    return find_pause_boundary(levels, silence_threshold_db(levels), start_ms, end_ms or len(audio))
+
+
+@pytest.fixture
+def noisy_converter(tmp_path, monkeypatch):
+    """A stand-in for ffmpeg that logs far more than a pipe buffer before failing."""
+    script = tmp_path / "ffmpeg"
+    script.write_text(
+        f"#!{sys.executable}\n"
+        "import sys\n"
+        "sys.stderr.write('corrupt frame\\n' * 20000)\n"
+        "sys.stderr.flush()\n"
+        "sys.stdout.buffer.write(bytes(16000 * 2))\n"
+        "sys.exit(1)\n"
+    )
+    script.chmod(0o755)
+    monkeypatch.setattr(AudioSegment, "converter", str(script))
+
+
+def test_stream_reports_ffmpeg_errors_without_deadlocking(noisy_converter):
+    with pytest.raises(RuntimeError, match="corrupt frame"):
+        list(stream_audio_chunks("damaged.mp3", 500, 16000, 1))
+
+
+def test_boundary_lands_inside_the_pause():
+    audio = _recording(("tone", 31_000), ("pause", 1000), ("tone", 8000))
+
+    assert 31_000 < _boundary(audio) < 32_000
+
+
+def test_boundary_prefers_the_longest_pause():
+    audio = _recording(("tone", 20_000), ("pause", 400), ("tone", 8000), ("pause", 1200), ("tone", 6000))
+
+    assert 28_400 < _boundary(audio) < 29_600
+
+
+def test_boundary_ignores_pauses_in_the_first_half_of_the_chunk():
+    audio = _recording(("tone", 5000), ("pause", 1000), ("tone", 34_000))
+
+    assert _boundary(audio) > 20_000
+
+
+def test_compressed_positions_map_back_to_the_source():
+    audio = _recording(("tone", 2000), ("pause", 5000), ("tone", 2000), ("pause", 3000), ("tone", 1000))
+
+    compressed, offset_map = compress_silences(audio, max_silence_ms=1000, keep_ms=500)
+
+    assert len(compressed) == 2000 + 500 + 2000 + 500 + 1000
+    # Start of each tone, and a point inside each, in compressed -> source time.
+    for compressed_ms, source_ms in [(0, 0), (1000, 1000), (2500, 7000), (3500, 8000), (5000, 12_000), (5500, 12_500)]:
+        assert map_to_source_ms(offset_map, compressed_ms) == source_ms
+        assert compressed[compressed_ms:compressed_ms + 100].raw_data == audio[source_ms:source_ms + 100].raw_data
+
+
+def test_short_pauses_are_kept():
+    audio = _recording(("tone", 2000), ("pause", 800), ("tone", 2000))
+
+    compressed, offset_map = compress_silences(audio, max_silence_ms=1000)
+
+    assert compressed is audio
+    assert offset_map == [(0, 0)]
+
+
+def test_offset_map_slices_rebase_to_the_chunk():
+    audio = _recording(("tone", 2000), ("pause", 5000), ("tone", 2000), ("pause", 3000), ("tone", 1000))
+    _, offset_map = compress_silences(audio, max_silence_ms=1000, keep_ms=500)
+
+    chunk_map = slice_offset_map(offset_map, 2000, 6000)
+
+    # Half of the kept 500 ms of each pause sits on either side of the cut.
+    assert map_to_source_ms(chunk_map, 0) == 2000
+    assert map_to_source_ms(chunk_map, 250) == 6750
+    assert map_to_source_ms(chunk_map, 500) == 7000
+    assert map_to_source_ms(chunk_map, 3000) == 12_000
@@ -0,0 +1,87 @@
+import os
+
+import pytest
+from pydub import AudioSegment
+
+from transmeet import batch
+from transmeet.clients.transcription_client import TranscriptionResult
+
+
+@pytest.fixture
+def transcribed(monkeypatch):
+    """Lengths (ms) of the recordings sent for transcription, in place of the provider."""
+    lengths = []
+
+    def fake_transcription(audio, file_size_mb, **options):
+        lengths.append(len(audio))
+        return TranscriptionResult(text=f"{len(audio)} ms of audio", chunk_texts=[], failed_chunks={})
+
+    monkeypatch.setattr(batch, "process_audio_transcription", fake_transcription)
+    return lengths
+
+
+def _write(path, duration_ms):
+    AudioSegment.silent(duration=duration_ms, frame_rate=16000).export(path, format="wav")
+
+
+def _run(source, output):
+    return batch.run_batch(str(source), str(output), streaming=False, generate_minutes=False, max_workers=2)
+
+
+def test_resume_skips_unchanged_files_and_redoes_changed_ones(tmp_path, transcribed):
+    source, output = tmp_path / "recordings", tmp_path / "output"
+    source.mkdir()
+    _write(source / "a.wav", 1000)
+    _write(source / "b.wav", 2000)
+
+    first = _run(source, output)
+    assert (first["completed"], first["skipped"]) == (2, 0)
+    assert sorted(transcribed) == [1000, 2000]
+
+    transcribed.clear()
+    again = _run(source, output)
+    assert (again["completed"], again["skipped"]) == (0, 2)
+    assert transcribed == []
+
+    _write(source / "b.wav", 3000)  # new size
+    changed_size = _run(source, output)
+    assert (changed_size["completed"], changed_size["skipped"]) == (1, 1)
+    assert transcribed == [3000]
+
+    transcribed.clear()
+    stat = os.stat(source / "a.wav")
+    os.utime(source / "a.wav", (stat.st_atime, stat.st_mtime + 60))  # same size, new mtime
+    changed_mtime = _run(source, output)
+    assert (changed_mtime["completed"], changed_mtime["skipped"]) == (1, 1)
+    assert transcribed == [1000]
+
+
+def test_missing_outputs_are_redone(tmp_path, transcribed):
+    source, output = tmp_path / "recordings", tmp_path / "output"
+    source.mkdir()
+    _write(source / "a.wav", 1000)
+    _run(source, output)
+
+    (output / "transcript_a.txt").unlink()
+    transcribed.clear()
+    report = _run(source, output)
+
+    assert report["completed"] == 1
+    assert (output / "transcript_a.txt").read_text() == "1000 ms of audio"
+
+
+def test_failed_files_are_retried_on_the_next_run(tmp_path, transcribed, monkeypatch):
+    source, output = tmp_path / "recordings", tmp_path / "output"
+    source.mkdir()
+    _write(source / "a.wav", 1000)
+
+    def failing(audio, file_size_mb, **options):
+        return TranscriptionResult(text="", chunk_texts=[""], failed_chunks={0: "HTTP 500"})
+
+    with monkeypatch.context() as patch:
+        patch.setattr(batch, "process_audio_transcription", failing)
+        assert _run(source, output)["failed"] == 1
+
+    assert _run(source, output)["completed"] == 1
+    manifest = batch.load_manifest(output / batch.MANIFEST_FILENAME)
+    assert [entry["status"] for entry in manifest.values()] == ["completed"]
@@ -0,0 +1,51 @@
+import asyncio
+
+from transmeet.llm.client_pool import async_client_scope, closes_async_clients, get_pooled_async_client
+
+
+class _Client:
+    def __init__(self, **kwargs):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+def _client():
+    return get_pooled_async_client("fake", _Client, "FAKE_API_KEY")
+
+
+def test_clients_stay_open_until_the_last_scope_on_the_loop_exits():
+    async def scenario():
+        first_done = asyncio.Event()
+
+        async def first():
+            async with async_client_scope():
+                client = _client()
+            first_done.set()
+            return client
+
+        async def second():
+            async with async_client_scope():
+                client = _client()
+                await first_done.wait()
+                open_after_first = not client.closed
+            return client, open_after_first
+
+        (same, open_after_first), shared = await asyncio.gather(second(), first())
+        return shared is same, open_after_first, shared.closed
+
+    assert asyncio.run(scenario()) == (True, True, True)
+
+
+def test_entry_points_close_their_loops_clients():
+    @closes_async_clients
+    async def entry_point():
+        return _client()
+
+    async def scenario():
+        client = await entry_point()
+        # A later call on the same loop gets a fresh client.
+        return client.closed, await entry_point() is not client
+
+    assert asyncio.run(scenario()) == (True, True)
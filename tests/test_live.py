@@ -0,0 +1,64 @@
+import io
+
+import numpy as np
+from pydub import AudioSegment
+from pydub.generators import Sine
+
+from transmeet.live import _trailing_pause_cut, live_pcm_windows
+from transmeet.utils.audio_utils import SILENCE_FRAME_MS
+
+FRAME_RATE = 16000
+
+
+def _speech(*parts):
+    audio = AudioSegment.empty().set_frame_rate(FRAME_RATE)
+    for kind, duration in parts:
+        if kind == "tone":
+            audio += Sine(300, sample_rate=FRAME_RATE).to_audio_segment(duration=duration, volume=-12)
+        else:
+            audio += AudioSegment.silent(duration=duration, frame_rate=FRAME_RATE)
+    return audio
+
+
+def _windows(audio, **options):
+    return list(live_pcm_windows(io.BytesIO(audio.raw_data), frame_rate=FRAME_RATE, **options))
+
+
+def test_windows_cover_the_stream_without_gaps_or_overlap():
+    # Pauses every few seconds, then 20 s without one, so both kinds of cut happen.
+    audio = _speech(("tone", 3000), ("pause", 600), ("tone", 5000), ("pause", 600), ("tone", 2000),
+                    ("pause", 600), ("tone", 20_000), ("pause", 400), ("tone", 1500))
+
+    windows = _windows(audio, min_window_ms=4000, max_window_ms=12_000)
+
+    assert len(windows) >= 4
+    assert windows[0].start_ms == 0
+    assert windows[-1].end_ms == len(audio)
+    for previous, window in zip(windows, windows[1:]):
+        assert window.start_ms == previous.end_ms
+    assert b"".join(w.audio.raw_data for w in windows) == audio.raw_data
+    for window in windows[:-1]:
+        assert 4000 <= len(window.audio) <= 12_000
+        assert window.end_ms - window.start_ms == len(window.audio)
+
+
+def test_windows_are_cut_inside_pauses():
+    audio = _speech(("tone", 5000), ("pause", 800), ("tone", 5000), ("pause", 800), ("tone", 1000))
+
+    windows = _windows(audio, min_window_ms=4000, max_window_ms=12_000)
+
+    assert len(windows) == 3
+    assert 5000 < windows[0].end_ms < 5800
+    assert 10_800 < windows[1].end_ms < 11_600
+
+
+def test_silent_stream_sends_nothing():
+    assert _windows(_speech(("pause", 10_000))) == []
+
+
+def test_trailing_pause_cut():
+    speech, silence = np.full(50, -20.0), np.full(25, -90.0)
+
+    assert _trailing_pause_cut(np.concatenate([speech, silence]), -40.0) == (50 + 12) * SILENCE_FRAME_MS
+    assert _trailing_pause_cut(np.concatenate([speech, silence, speech[:3]]), -40.0) is None
+    assert _trailing_pause_cut(np.concatenate([speech, silence[:5]]), -40.0) is None
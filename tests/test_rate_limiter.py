@@ -0,0 +1,79 @@
+import pytest
+
+from transmeet.llm import rate_limiter
+from transmeet.llm.rate_limiter import RateLimiter, TokenBucket, configure_rate_limit, get_rate_limiter
+
+
+@pytest.fixture(autouse=True)
+def isolated_registry(monkeypatch):
+    monkeypatch.setattr(rate_limiter, "_overrides", {})
+    monkeypatch.setattr(rate_limiter, "_limiters", {})
+    monkeypatch.setattr(rate_limiter, "_state_path", None)
+    monkeypatch.delenv(rate_limiter.RATE_LIMIT_DB_ENV, raising=False)
+
+
+def test_reservations_go_negative_and_report_the_wait():
+    bucket = TokenBucket(capacity=60, period=60)  # one token per second
+    bucket.updated = 100.0
+
+    assert bucket.reserve(60, now=100.0) == 0.0
+    assert bucket.reserve(3, now=100.0) == pytest.approx(3.0)
+    assert bucket.tokens == pytest.approx(-3.0)
+    # A later caller queues behind the earlier reservation.
+    assert bucket.reserve(2, now=100.0) == pytest.approx(5.0)
+
+
+def test_bucket_refills_at_its_rate_up_to_capacity():
+    bucket = TokenBucket(capacity=10, period=10)
+    bucket.updated = 0.0
+    bucket.reserve(10, now=0.0)
+
+    assert bucket.wait_for(4, now=2.0) == pytest.approx(2.0)
+    bucket.refill(now=4.0)
+    assert bucket.tokens == pytest.approx(4.0)
+    bucket.refill(now=1000.0)
+    assert bucket.tokens == pytest.approx(10.0)
+
+
+def test_limiters_sharing_a_state_path_draw_from_one_budget(tmp_path):
+    path = str(tmp_path / "limits.sqlite3")
+    first = RateLimiter("groq", "model", state_path=path, requests_per_minute=2)
+    second = RateLimiter("groq", "model", state_path=path, requests_per_minute=2)
+
+    assert first.reserve() == 0.0
+    assert second.reserve() == 0.0
+    # The budget of two requests per minute is spent; the next caller waits ~30 s.
+    assert first.reserve() == pytest.approx(30.0, abs=0.5)
+
+
+def test_limiters_without_shared_state_keep_separate_budgets():
+    first = RateLimiter("groq", "model", requests_per_minute=1)
+    second = RateLimiter("groq", "model", requests_per_minute=1)
+
+    assert first.reserve() == 0.0
+    assert second.reserve() == 0.0
+
+
+def test_unknown_limits_are_rejected():
+    with pytest.raises(ValueError, match="requests_per_day"):
+        RateLimiter("groq", "model", requests_per_day=10)
+
+
+def test_configure_rate_limit_replaces_cached_limiters():
+    before = get_rate_limiter("groq", "model")
+    assert before.limits == rate_limiter.DEFAULT_RATE_LIMITS["groq"]
+
+    configure_rate_limit("groq", requests_per_minute=5, audio_seconds_per_hour=7200)
+    after = get_rate_limiter("groq", "model")
+
+    assert after is not before
+    assert after.limits == {"requests_per_minute": 5, "audio_seconds_per_hour": 7200}
+    assert get_rate_limiter("groq", "model") is after
+
+
+def test_model_overrides_apply_on_top_of_provider_overrides():
+    configure_rate_limit("groq", requests_per_minute=5)
+    configure_rate_limit("groq", "big-model", requests_per_minute=1, tokens_per_minute=1000)
+
+    assert get_rate_limiter("groq", "small-model").limits == {"requests_per_minute": 5}
+    assert get_rate_limiter("groq", "big-model").limits == {"requests_per_minute": 1, "tokens_per_minute": 1000}
@@ -0,0 +1,78 @@
+import pytest
+
+from transmeet.llm import response_cache
+from transmeet.llm.response_cache import (
+    MemoryResponseCache,
+    ResponseCache,
+    SQLiteResponseCache,
+    response_cache_key,
+)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(response_cache.time, "monotonic", clock)
+    return clock
+
+
+def test_response_cache_is_abstract():
+    with pytest.raises(TypeError):
+        ResponseCache()
+
+
+def test_memory_cache_evicts_the_least_recently_used_entry():
+    cache = MemoryResponseCache(max_entries=2)
+    cache.set("a", "A")
+    cache.set("b", "B")
+    assert cache.get("a") == "A"  # "b" is now the least recently used
+
+    cache.set("c", "C")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "A"
+    assert cache.get("c") == "C"
+
+
+def test_memory_cache_entries_expire_after_the_ttl(clock):
+    cache = MemoryResponseCache(ttl_s=60)
+    cache.set("key", "value")
+
+    clock.now += 59
+    assert cache.get("key") == "value"
+    clock.now += 2
+    assert cache.get("key") is None
+
+
+def test_memory_cache_without_ttl_keeps_entries(clock):
+    cache = MemoryResponseCache(ttl_s=None)
+    cache.set("key", "value")
+    clock.now += 10 ** 9
+    assert cache.get("key") == "value"
+
+
+def test_sqlite_cache_persists_across_instances(tmp_path):
+    path = tmp_path / "responses.sqlite3"
+    SQLiteResponseCache(path).set("key", "value")
+
+    reopened = SQLiteResponseCache(path)
+    assert reopened.get("key") == "value"
+
+    reopened.clear()
+    assert SQLiteResponseCache(path).get("key") is None
+
+
+def test_keys_separate_context_prompts_and_models():
+    base = response_cache_key("groq", "m", "system", "user")
+    assert response_cache_key("groq", "m", "system", "user", context="transcript") != base
+    assert response_cache_key("groq", "other", "system", "user") != base
+    assert response_cache_key("groq", "m", "system", "user 2") != base
+    assert response_cache_key("groq", "m", "system", "user") == base
@@ -0,0 +1,105 @@
+import time
+from email.utils import formatdate
+
+import httpx
+import pytest
+
+from transmeet.llm.retry import FATAL, RATE_LIMITED, TRANSIENT, RetryPolicy, classify_error, retry_after_seconds
+
+
+class APIStatusError(Exception):
+    """Shaped like the groq/openai SDK errors: the HTTP response hangs off the exception."""
+
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"HTTP {status_code}")
+        self.response = httpx.Response(status_code, headers=headers)
+        self.status_code = status_code
+
+
+class APITimeoutError(Exception):
+    pass
+
+
+class APIConnectionError(Exception):
+    pass
+
+
+class BadRequestError(Exception):
+    def __init__(self):
+        super().__init__("invalid audio")
+        self.response = httpx.Response(400)
+
+
+@pytest.mark.parametrize("error, kind", [
+    (APIStatusError(429), RATE_LIMITED),
+    (APIStatusError(500), TRANSIENT),
+    (APIStatusError(502), TRANSIENT),
+    (APIStatusError(503), TRANSIENT),
+    (APIStatusError(529), TRANSIENT),
+    (APIStatusError(408), TRANSIENT),
+    (APITimeoutError("timed out"), TRANSIENT),
+    (TimeoutError(), TRANSIENT),
+    (APIConnectionError("reset"), TRANSIENT),
+    (ConnectionResetError(), TRANSIENT),
+    (BadRequestError(), FATAL),
+    (APIStatusError(401), FATAL),
+    (APIStatusError(413), FATAL),
+    (ValueError("bad argument"), FATAL),
+])
+def test_classify_error(error, kind):
+    assert classify_error(error) == kind
+
+
+@pytest.mark.parametrize("headers, expected", [
+    ({"retry-after": "7"}, 7.0),
+    ({"Retry-After": "1.5"}, 1.5),
+    ({"retry-after-ms": "250", "retry-after": "9"}, 0.25),
+    ({"retry-after": "soon"}, None),
+    ({}, None),
+])
+def test_retry_after_seconds(headers, expected):
+    assert retry_after_seconds(APIStatusError(429, headers)) == expected
+
+
+def test_retry_after_as_http_date():
+    header = formatdate(time.time() + 30, usegmt=True)
+    assert retry_after_seconds(APIStatusError(503, {"retry-after": header})) == pytest.approx(30, abs=1.5)
+
+
+def test_retry_after_date_in_the_past_means_no_wait():
+    header = formatdate(time.time() - 60, usegmt=True)
+    assert retry_after_seconds(APIStatusError(503, {"retry-after": header})) == 0.0
+
+
+def test_errors_without_a_response_have_no_retry_after():
+    assert retry_after_seconds(APITimeoutError()) is None
+
+
+@pytest.mark.parametrize("error", [BadRequestError(), APIStatusError(401)])
+def test_fatal_errors_are_not_retried(error):
+    assert RetryPolicy().next_delay(error, 1) is None
+
+
+def test_attempts_run_out():
+    policy = RetryPolicy(max_attempts=3)
+    assert policy.next_delay(APIStatusError(500), 2) is not None
+    assert policy.next_delay(APIStatusError(500), 3) is None
+
+
+@pytest.mark.parametrize("error, base", [(APIStatusError(503), 1.0), (APIStatusError(429), 5.0)])
+def test_backoff_is_jittered_below_an_exponential_cap(error, base):
+    policy = RetryPolicy(max_attempts=10, base_delay=1.0, rate_limit_base_delay=5.0, max_delay=12.0)
+    for attempt in range(1, 6):
+        cap = min(12.0, base * 2 ** (attempt - 1))
+        delays = [policy.next_delay(error, attempt) for _ in range(200)]
+        assert all(0.0 <= d <= cap for d in delays)
+        assert max(delays) > cap / 2  # spread across the range, not pinned to zero
+
+
+def test_retry_after_is_honoured_and_capped():
+    policy = RetryPolicy(max_delay=10.0)
+    short = [policy.next_delay(APIStatusError(429, {"retry-after": "3"}), 1) for _ in range(50)]
+    long = [policy.next_delay(APIStatusError(429, {"retry-after": "120"}), 1) for _ in range(50)]
+
+    assert all(3.0 <= d <= 3.5 for d in short)
+    assert all(10.0 <= d <= 10.5 for d in long)
@@ -0,0 +1,123 @@
+import pytest
+
+from transmeet.llm import router
+from transmeet.llm.retry import RetryPolicy
+from transmeet.llm.router import RoutingLLMManager, parse_targets
+
+
+class ServiceUnavailable(Exception):
+    status_code = 503
+
+
+class _Limiter:
+    def headroom_wait(self, requests=1, tokens=0, audio_seconds=0.0):
+        return 0.0
+
+
+class _Tracker:
+    def __init__(self):
+        self.routes = []
+        self.failovers = []
+
+    def record_route(self, reason):
+        self.routes.append(reason)
+
+    def record_failover(self, kind, cooldown):
+        self.failovers.append((kind, cooldown))
+
+    def usage_stats(self):
+        return {"routes": len(self.routes)}
+
+
+class _StubManager:
+    """One target; ``failures`` is how many of its next calls raise a 503."""
+
+    def __init__(self, provider, model_name, retry_policy=None, response_cache=None):
+        self.provider = provider
+        self.model_name = model_name
+        self.rate_limiter = _Limiter()
+        self.token_tracker = _Tracker()
+        self.failures = 0
+        self.calls = 0
+
+    def transcribe_audio(self, audio, audio_seconds=0.0):
+        self.calls += 1
+        if self.failures:
+            self.failures -= 1
+            raise ServiceUnavailable("busy")
+        return f"{self.provider} text"
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(router, "LLMManager", _StubManager)
+    monkeypatch.setattr(router.time, "monotonic", clock)
+    return clock
+
+
+@pytest.mark.parametrize("spec, expected", [
+    ("groq", [("groq", "default")]),
+    ("groq,openai:whisper-1", [("groq", "default"), ("openai", "whisper-1")]),
+    (" Groq , openai ", [("groq", "default"), ("openai", "default")]),
+    ("local:org/model:v2", [("local", "org/model:v2")]),
+])
+def test_parse_targets(spec, expected):
+    assert parse_targets(spec, "default") == expected
+
+
+@pytest.mark.parametrize("spec", ["", " , "])
+def test_parse_targets_rejects_empty_specs(spec):
+    with pytest.raises(ValueError):
+        parse_targets(spec, "default")
+
+
+def test_fails_over_and_skips_the_failed_target_until_its_cooldown_ends(clock):
+    manager = RoutingLLMManager([("groq", "a"), ("openai", "b")], retry_policy=RetryPolicy(base_delay=10.0))
+    first, second = (target.manager for target in manager.targets)
+    first.failures = 1
+
+    assert manager.transcribe_audio(b"audio") == "openai text"
+    assert first.token_tracker.failovers == [("transient", 10.0)]
+    assert second.token_tracker.routes == ["failover"]
+
+    clock.now += 5
+    assert manager.transcribe_audio(b"audio") == "openai text"
+    assert first.calls == 1
+
+    clock.now += 6
+    assert manager.transcribe_audio(b"audio") == "groq text"
+    assert first.calls == 2
+    assert manager.routing_stats()["groq/a"]["consecutive_failures"] == 0
+
+
+def test_gives_up_after_every_target_failed_once(clock):
+    manager = RoutingLLMManager([("groq", "a"), ("openai", "b")])
+    for target in manager.targets:
+        target.manager.failures = 1
+
+    with pytest.raises(ServiceUnavailable):
+        manager.transcribe_audio(b"audio")
+    assert [target.manager.calls for target in manager.targets] == [1, 1]
+
+
+def test_fatal_errors_are_not_failed_over(clock):
+    manager = RoutingLLMManager([("groq", "a"), ("openai", "b")])
+    first, second = (target.manager for target in manager.targets)
+
+    def reject(audio, audio_seconds=0.0):
+        raise ValueError("bad audio")
+
+    first.transcribe_audio = reject
+
+    with pytest.raises(ValueError):
+        manager.transcribe_audio(b"audio")
+    assert second.calls == 0
@@ -0,0 +1,50 @@
+from transmeet.utils.transcript_utils import merge_overlapping_words, stitch_transcripts
+
+
+def test_removes_words_duplicated_by_the_overlap():
+    left = "so the plan for this week is to finish the migration".split()
+    right = "finish the migration and then update the docs".split()
+    assert " ".join(merge_overlapping_words(left, right, overlap_s=1.0)) == (
+        "so the plan for this week is to finish the migration and then update the docs"
+    )
+
+
+def test_drops_a_truncated_word_at_the_chunk_edge():
+    left = "we agreed to move the launch to next mon".split()
+    right = "to next monday after the review".split()
+    assert " ".join(merge_overlapping_words(left, right, overlap_s=1.0)) == (
+        "we agreed to move the launch to next monday after the review"
+    )
+
+
+def test_common_phrase_far_from_the_boundary_is_not_an_overlap():
+    left = ("we need to ship the release in the next sprint and then we will review "
+            "all of the open bugs with the team tomorrow").split()
+    right = ("tomorrow morning we can also talk about the budget for the next quarter "
+             "and hiring plans").split()
+    assert merge_overlapping_words(left, right, overlap_s=2.0) == left + right
+
+
+def test_repeated_phrase_does_not_replace_the_real_overlap():
+    left = "I think that the numbers look fine and I think that we should".split()
+    right = "we should go. I think that is the right call".split()
+    assert " ".join(merge_overlapping_words(left, right, overlap_s=2.0)) == (
+        "I think that the numbers look fine and I think that we should go. I think that is the right call"
+    )
+
+
+def test_of_the_inside_both_windows_but_away_from_the_edges_is_rejected():
+    left = "then we will review all of the open bugs with the team".split()
+    right = "team leads said that most of the work is done".split()
+    assert merge_overlapping_words(left, right, overlap_s=2.0) == left + right
+
+
+def test_no_match_falls_back_to_concatenation():
+    assert stitch_transcripts(["hello there", "", "general kenobi"], overlap_s=2.0) == (
+        "hello there general kenobi"
+    )
+
+
+def test_stitches_several_chunks():
+    texts = ["one two three four five", "four five six seven", "six seven eight"]
+    assert stitch_transcripts(texts, overlap_s=1.0) == "one two three four five six seven eight"
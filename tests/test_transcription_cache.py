@@ -0,0 +1,69 @@
+import pytest
+from pydub.generators import Sine
+
+from transmeet.clients import transcription_client
+from transmeet.clients.transcription_cache import TranscriptionCache
+from transmeet.clients.transcription_client import _transcribe_chunk
+
+
+class _CountingManager:
+    provider = "fake"
+    preferred_upload_format = None
+
+    def __init__(self, model_name="model-a"):
+        self.model_name = model_name
+        self.calls = 0
+
+    def transcribe_audio(self, audio, audio_seconds=0.0):
+        self.calls += 1
+        return f"{self.model_name} transcript"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return TranscriptionCache(path=tmp_path / "transcriptions.sqlite3")
+
+
+@pytest.fixture
+def chunk():
+    return Sine(440).to_audio_segment(duration=1000)
+
+
+def test_cache_hit_skips_the_provider(cache, chunk):
+    manager = _CountingManager()
+
+    first = _transcribe_chunk(chunk, 0, manager, "wav", cache=cache)
+    second = _transcribe_chunk(chunk, 0, manager, "wav", cache=cache)
+
+    assert first == second == "model-a transcript"
+    assert manager.calls == 1
+
+
+@pytest.mark.parametrize("model_name, upload_format", [("model-b", "wav"), ("model-a", "raw")])
+def test_other_model_or_upload_format_misses(cache, chunk, model_name, upload_format, monkeypatch):
+    monkeypatch.setattr(transcription_client, "_encode_within_limit",
+                        lambda chunk, upload_format, max_upload_mb: [(b"audio", len(chunk) / 1000)])
+    _transcribe_chunk(chunk, 0, _CountingManager(), "wav", cache=cache)
+    manager = _CountingManager(model_name)
+
+    assert _transcribe_chunk(chunk, 0, manager, upload_format, cache=cache) == f"{model_name} transcript"
+    assert manager.calls == 1
+
+
+def test_other_audio_misses(cache, chunk):
+    _transcribe_chunk(chunk, 0, _CountingManager(), "wav", cache=cache)
+    manager = _CountingManager()
+
+    _transcribe_chunk(Sine(880).to_audio_segment(duration=1000), 1, manager, "wav", cache=cache)
+
+    assert manager.calls == 1
+
+
+def test_chunk_is_hashed_once_per_transcription(cache, chunk, monkeypatch):
+    hashed = []
+    real_key = transcription_client.chunk_cache_key
+    monkeypatch.setattr(transcription_client, "chunk_cache_key", lambda *args: hashed.append(args) or real_key(*args))
+
+    _transcribe_chunk(chunk, 0, _CountingManager(), "wav", cache=cache)
+
+    assert len(hashed) == 1
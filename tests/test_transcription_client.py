@@ -0,0 +1,129 @@
+import asyncio
+import threading
+import time
+
+from pydub import AudioSegment
+
+from transmeet.clients.hedging import HedgePolicy
+from transmeet.clients.transcription_client import (
+    _transcribe_chunk,
+    transcribe_with_llm_calls,
+    transcribe_with_llm_calls_async,
+)
+from transmeet.llm.retry import RetryPolicy
+
+
+class _Tracker:
+    def __init__(self):
+        self.hedges = 0
+        self.hedges_won = 0
+
+    def record_hedge(self, won=False):
+        if won:
+            self.hedges_won += 1
+        else:
+            self.hedges += 1
+
+
+class _StragglerManager:
+    """Answers every chunk quickly, except the first request for the 1.5 s chunk."""
+
+    provider = "fake"
+    model_name = "fake"
+    max_concurrency = None
+    preferred_upload_format = None
+
+    def __init__(self, straggler_s):
+        self.retry_policy = RetryPolicy(max_attempts=1)
+        self.token_tracker = _Tracker()
+        self.straggler_s = straggler_s
+        self.straggled = False
+        self.lock = threading.Lock()
+
+    def transcribe_audio(self, audio, audio_seconds=0.0):
+        with self.lock:
+            slow = audio_seconds == 1.5 and not self.straggled
+            self.straggled = self.straggled or slow
+        time.sleep(self.straggler_s if slow else 0.05)
+        return f"{audio_seconds:g}s"
+
+
+def test_hedged_straggler_does_not_delay_the_result():
+    chunks = [AudioSegment.silent(duration=1500 if i == 5 else 1000) for i in range(8)]
+    manager = _StragglerManager(straggler_s=5.0)
+    policy = HedgePolicy(percentile=0.9, min_samples=3, min_delay_s=0.2, max_fraction=0.5)
+
+    started = time.monotonic()
+    result = transcribe_with_llm_calls(chunks, manager, max_workers=4, hedge_policy=policy)
+    elapsed = time.monotonic() - started
+
+    assert result.chunk_texts == ["1s"] * 5 + ["1.5s"] + ["1s"] * 2
+    assert manager.token_tracker.hedges == 1
+    assert manager.token_tracker.hedges_won == 1
+    assert elapsed < 2.0, f"returned after {elapsed:.1f}s; the losing request was joined"
+
+
+class _WavOnlyManager:
+    """Records what it is sent, like a provider that declares it prefers WAV."""
+
+    provider = "fake"
+    model_name = "fake"
+    preferred_upload_format = "wav"
+
+    def __init__(self):
+        self.uploads = []
+
+    def transcribe_audio(self, audio, audio_seconds=0.0):
+        self.uploads.append(audio.read())
+        return "ok"
+
+
+def test_chunks_are_uploaded_in_the_providers_preferred_format():
+    manager = _WavOnlyManager()
+
+    text = _transcribe_chunk(AudioSegment.silent(duration=1000), 0, manager, upload_format="flac")
+
+    assert text == "ok"
+    assert [upload[:4] for upload in manager.uploads] == [b"RIFF"]
+
+
+class _FailingAsyncManager:
+    """Fails every request with a retryable error."""
+
+    provider = "fake"
+    model_name = "fake"
+    max_concurrency = None
+    preferred_upload_format = None
+
+    def __init__(self):
+        self.retry_policy = RetryPolicy(max_attempts=5, base_delay=0.05)
+        self.calls = 0
+
+    async def transcribe_audio_async(self, audio, audio_seconds=0.0):
+        self.calls += 1
+        raise ConnectionError("connection reset")
+
+
+def test_cancelling_a_chunk_waiting_for_its_slot_does_not_leak_the_semaphore():
+    async def scenario():
+        semaphore = asyncio.Semaphore(1)
+        manager = _FailingAsyncManager()
+        run = asyncio.ensure_future(transcribe_with_llm_calls_async(
+            [AudioSegment.silent(duration=1000)], manager, semaphore=semaphore
+        ))
+        while manager.calls == 0:
+            await asyncio.sleep(0.01)
+        # Take the slot while the chunk backs off, so its retry waits for it.
+        await semaphore.acquire()
+        await asyncio.sleep(0.2)
+        run.cancel()
+        try:
+            await run
+        except asyncio.CancelledError:
+            pass
+        semaphore.release()
+
+        await semaphore.acquire()
+        return semaphore.locked()
+
+    assert asyncio.run(scenario())
@@ -1,16 +1,82 @@
 # cython: language_level=3
-from transmeet.processor import (
-    transcribe_audio_file, 
-    generate_meeting_minutes_from_transcript, 
-    generate_podcast_script_from_transcript, 
-    generate_mind_map_from_transcript,
-    segment_conversation_by_speaker
-)
-
-__all__ = [
-    "transcribe_audio_file",
-    "generate_meeting_minutes_from_transcript",
-    "generate_podcast_script_from_transcript",
-    "generate_mind_map_from_transcript",
-    "segment_conversation_by_speaker"
-]
\ No newline at end of file
+# Public names are resolved on first access (PEP 562), so `import transmeet`
+# does not load the audio stack or the provider SDKs until they are used.
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+_LAZY_ATTRIBUTES = {
+    "transcribe_audio_file": "transmeet.processor",
+    "generate_meeting_minutes_from_transcript": "transmeet.processor",
+    "generate_meeting_transcript_and_minutes": "transmeet.processor",
+    "generate_meeting_minutes_stream_from_transcript": "transmeet.processor",
+    "generate_podcast_script_stream_from_transcript": "transmeet.processor",
+    "generate_podcast_script_from_transcript": "transmeet.processor",
+    "generate_mind_map_from_transcript": "transmeet.processor",
+    "segment_conversation_by_speaker": "transmeet.processor",
+    "segment_speech_by_speaker": "transmeet.processor",
+    "transcribe_audio_file_async": "transmeet.processor",
+    "generate_meeting_minutes_from_transcript_async": "transmeet.processor",
+    "generate_meeting_transcript_and_minutes_async": "transmeet.processor",
+    "generate_podcast_script_from_transcript_async": "transmeet.processor",
+    "generate_mind_map_from_transcript_async": "transmeet.processor",
+    "segment_speech_by_speaker_async": "transmeet.processor",
+    "generate_artifacts": "transmeet.processor",
+    "generate_artifacts_async": "transmeet.processor",
+    "generate_meeting_minutes_stream_from_transcript_async": "transmeet.processor",
+    "generate_podcast_script_stream_from_transcript_async": "transmeet.processor",
+    "configure_transcription_cache": "transmeet.clients.transcription_cache",
+    "configure_response_cache": "transmeet.llm.response_cache",
+    "configure_hedging": "transmeet.clients.hedging",
+    "close_async_client_pool": "transmeet.llm.client_pool",
+    "get_usage_stats": "transmeet.llm.token_tracker",
+    "reset_usage_stats": "transmeet.llm.token_tracker",
+    "run_report": "transmeet.utils.tracing",
+    "write_run_report": "transmeet.utils.tracing",
+    "configure_logging": "transmeet.utils.general_utils",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from transmeet.processor import (
+        transcribe_audio_file,
+        generate_meeting_minutes_from_transcript,
+        generate_meeting_transcript_and_minutes,
+        generate_meeting_minutes_stream_from_transcript,
+        generate_podcast_script_stream_from_transcript,
+        generate_podcast_script_from_transcript,
+        generate_mind_map_from_transcript,
+        segment_conversation_by_speaker,
+        segment_speech_by_speaker,
+        transcribe_audio_file_async,
+        generate_meeting_minutes_from_transcript_async,
+        generate_meeting_transcript_and_minutes_async,
+        generate_podcast_script_from_transcript_async,
+        generate_mind_map_from_transcript_async,
+        segment_speech_by_speaker_async,
+        generate_artifacts,
+        generate_artifacts_async,
+        generate_meeting_minutes_stream_from_transcript_async,
+        generate_podcast_script_stream_from_transcript_async,
+    )
+    from transmeet.clients.transcription_cache import configure_transcription_cache
+    from transmeet.llm.response_cache import configure_response_cache
+    from transmeet.clients.hedging import configure_hedging
+    from transmeet.llm.client_pool import close_async_client_pool
+    from transmeet.llm.token_tracker import get_usage_stats, reset_usage_stats
+    from transmeet.utils.tracing import run_report, write_run_report
+    from transmeet.utils.general_utils import configure_logging
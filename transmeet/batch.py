@@ -0,0 +1,194 @@
+# cython: language_level=3
+import glob
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from threading import Lock
+from typing import List, Optional
+
+from pydub import AudioSegment
+
+from transmeet.clients.transcription_client import (
+    process_audio_transcription,
+    process_audio_stream_transcription,
+)
+from transmeet.processor import generate_meeting_minutes_from_transcript
+from transmeet.utils.audio_formats import DEFAULT_UPLOAD_FORMAT
+from transmeet.utils.audio_utils import get_audio_size_mb, probe_audio
+from transmeet.utils.general_utils import get_logger
+from transmeet.utils.tracing import job, span
+
+logger = get_logger(__name__)
+
+AUDIO_EXTENSIONS = {".wav", ".mp3", ".m4a", ".flac", ".ogg", ".opus", ".webm", ".mp4", ".aac"}
+MANIFEST_FILENAME = "manifest.json"
+
+
+def discover_audio_files(source: str) -> List[Path]:
+    """Expand a directory (searched recursively) or a glob pattern into audio files."""
+    if os.path.isdir(source):
+        paths = Path(source).rglob("*")
+    else:
+        paths = (Path(p) for p in glob.glob(source, recursive=True))
+    return sorted(p for p in paths if p.is_file() and p.suffix.lower() in AUDIO_EXTENSIONS)
+
+
+def load_manifest(manifest_path: Path) -> dict:
+    if manifest_path.exists():
+        with open(manifest_path, encoding="utf-8") as f:
+            return json.load(f)
+    return {}
+
+
+def save_manifest(manifest_path: Path, manifest: dict):
+    # Write-then-rename so an interrupted run never leaves a truncated manifest.
+    tmp_path = manifest_path.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, manifest_path)
+
+
+def _fingerprint(path: Path) -> dict:
+    stat = path.stat()
+    return {"size": stat.st_size, "mtime": stat.st_mtime}
+
+
+def is_completed(manifest: dict, path: Path) -> bool:
+    """A file is done when its manifest entry matches the file and its outputs still exist."""
+    entry = manifest.get(str(path.resolve()))
+    if not entry or entry.get("status") != "completed":
+        return False
+    if {k: entry.get(k) for k in ("size", "mtime")} != _fingerprint(path):
+        return False
+    return all(os.path.exists(p) for p in entry.get("outputs", {}).values())
+
+
+def _output_stem(path: Path, root: Optional[Path]) -> str:
+    """Name outputs after the path relative to the batch root, so equal file names don't collide."""
+    try:
+        relative = path.resolve().relative_to(root) if root else Path(path.name)
+    except ValueError:
+        relative = Path(path.name)
+    return "__".join(relative.with_suffix("").parts)
+
+
+def run_batch(
+    source: str,
+    output_dir: str = "output",
+    transcription_client: str = "groq",
+    transcription_model: str = "whisper-large-v3-turbo",
+    llm_client: str = "groq",
+    llm_model: str = "llama-3.3-70b-versatile",
+    audio_chunk_size_mb: int = 18,
+    audio_chunk_overlap: float = 2.0,
+    upload_format: str = DEFAULT_UPLOAD_FORMAT,
+    split_on_silence: bool = True,
+    max_silence_s: Optional[float] = None,
+    audio_chunk_seconds: Optional[float] = None,
+    streaming: bool = True,
+    generate_minutes: bool = True,
+    max_workers: int = 20,
+    max_files_in_flight: int = 4,
+    max_input_tokens: Optional[int] = None,
+) -> dict:
+    """
+    Transcribe every recording matched by ``source`` (directory or glob).
+
+    Chunks of up to ``max_files_in_flight`` recordings are scheduled on one
+    shared pool of ``max_workers`` upload workers, under the process-wide rate
+    limiter, so short files fill the gaps left by long ones. Finished files are
+    recorded in ``<output_dir>/manifest.json`` and skipped on the next run.
+
+    Returns:
+        dict: Run report with per-status counts and throughput.
+    """
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    manifest_path = output_path / MANIFEST_FILENAME
+    manifest = load_manifest(manifest_path)
+    manifest_lock = Lock()
+
+    root = Path(source).resolve() if os.path.isdir(source) else None
+    files = discover_audio_files(source)
+    todo = [p for p in files if not is_completed(manifest, p)]
+    logger.info(f"Batch: {len(files)} file(s) found, {len(files) - len(todo)} already done, {len(todo)} to process.")
+
+    def process_file(path: Path, chunk_executor):
+        # Spans and log lines of this recording carry its output name as job id.
+        with job(_output_stem(path, root)):
+            return _process_file(path, chunk_executor)
+
+    def _process_file(path: Path, chunk_executor):
+        options = dict(
+            transcription_client=transcription_client,
+            transcription_model=transcription_model,
+            audio_chunk_size_mb=audio_chunk_size_mb,
+            audio_chunk_overlap=audio_chunk_overlap,
+            upload_format=upload_format,
+            split_on_silence=split_on_silence,
+            max_silence_s=max_silence_s,
+            audio_chunk_seconds=audio_chunk_seconds,
+            executor=chunk_executor,
+        )
+        if streaming:
+            audio_seconds = probe_audio(path)["duration_s"]
+            result = process_audio_stream_transcription(audio_path=path, **options)
+        else:
+            with span("decode"):
+                audio = AudioSegment.from_file(path)
+            audio_seconds = len(audio) / 1000
+            result = process_audio_transcription(audio=audio, file_size_mb=get_audio_size_mb(audio), **options)
+            del audio
+
+        if result.failed_chunks:
+            raise RuntimeError(f"{len(result.failed_chunks)} chunk(s) failed: {sorted(result.failed_chunks)}")
+
+        stem = _output_stem(path, root)
+        outputs = {"transcript": str(output_path / f"transcript_{stem}.txt")}
+        with open(outputs["transcript"], "w", encoding="utf-8") as f:
+            f.write(result.text)
+
+        if generate_minutes:
+            minutes = generate_meeting_minutes_from_transcript(
+                result.text, llm_client, llm_model, max_input_tokens=max_input_tokens
+            )
+            if minutes is None or minutes.startswith("Error:"):
+                raise RuntimeError(minutes or "No meeting minutes were generated")
+            outputs["minutes"] = str(output_path / f"meeting_minutes_{stem}.txt")
+            with open(outputs["minutes"], "w", encoding="utf-8") as f:
+                f.write(minutes)
+
+        return audio_seconds, outputs
+
+    report = {"found": len(files), "skipped": len(files) - len(todo), "completed": 0, "failed": 0,
+              "audio_seconds": 0.0}
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=max_workers) as chunk_executor, \
+            ThreadPoolExecutor(max_workers=max_files_in_flight) as file_executor:
+        futures = {file_executor.submit(process_file, path, chunk_executor): path for path in todo}
+        for future in as_completed(futures):
+            path = futures[future]
+            entry = {**_fingerprint(path), "updated_at": datetime.now().isoformat()}
+            try:
+                audio_seconds, outputs = future.result()
+                entry.update(status="completed", audio_seconds=audio_seconds, outputs=outputs)
+                report["completed"] += 1
+                report["audio_seconds"] += audio_seconds
+                logger.info(f"Batch: finished {path}")
+            except Exception as e:
+                entry.update(status="failed", error=str(e))
+                report["failed"] += 1
+                logger.error(f"Batch: failed {path}: {e}")
+
+            with manifest_lock:
+                manifest[str(path.resolve())] = entry
+                save_manifest(manifest_path, manifest)
+
+    elapsed_hours = max(time.monotonic() - start, 1e-9) / 3600
+    report["elapsed_seconds"] = elapsed_hours * 3600
+    report["files_per_hour"] = report["completed"] / elapsed_hours
+    report["audio_hours_per_hour"] = report["audio_seconds"] / 3600 / elapsed_hours
+    return report
@@ -1,27 +1,43 @@
 # cython: language_level=3
 import argparse
+import os
 import sys
-from transmeet import generate_meeting_transcript_and_minutes
+from transmeet.clients.transcription_cache import configure_transcription_cache
+from transmeet.llm.rate_limiter import configure_rate_limit, set_rate_limit_state_path
+from transmeet.utils.audio_formats import UPLOAD_FORMATS, DEFAULT_UPLOAD_FORMAT
 
+# The audio stack and provider SDKs are imported inside each command, after
+# argument parsing, so `--help` and argument errors return immediately.
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="🎤 TransMeet: Transcribe audio and generate meeting minutes using Groq or Google."
-    )
+TRANSCRIPTION_PROVIDERS = ("groq", "openai", "local", "google")
+LLM_PROVIDERS = ("groq", "openai")
 
-    parser.add_argument(
-        "-i", "--audio-path", required=True,
-        help="Path to the audio file (.wav, .mp3, etc.)"
-    )
 
+def _provider_spec(providers):
+    """Argument type for a provider or a routing list such as "groq,openai:whisper-1"."""
+    def parse(value):
+        for entry in value.split(","):
+            provider = entry.strip().partition(":")[0].lower()
+            if provider not in providers:
+                raise argparse.ArgumentTypeError(
+                    f"unknown provider {provider!r} (choose from {', '.join(providers)})"
+                )
+        return value
+    return parse
+
+
+def _add_common_arguments(parser):
+    """Options shared by single-file and batch runs."""
     parser.add_argument(
         "-o", "--output-dir", default="output",
         help="Directory where output (transcript + minutes) will be saved"
     )
 
     parser.add_argument(
-        "--transcription-client", choices=["groq", "openai"], default="groq",
-        help="Transcription backend to use (default: groq)"
+        "--transcription-client", type=_provider_spec(TRANSCRIPTION_PROVIDERS), default="groq",
+        help="Transcription backend: groq, openai, local (faster-whisper on this machine) or google "
+             "(Web Speech API; the model is the language, e.g. en-US); a list such as "
+             "'groq,openai:whisper-1' spreads chunks across providers by headroom and latency (default: groq)"
     )
 
     parser.add_argument(
@@ -30,8 +46,9 @@ def main():
     )
 
     parser.add_argument(
-        "--llm-client", choices=["groq", "openai"], default="groq",
-        help="LLM backend to use for generating meeting minutes (default: groq)"
+        "--llm-client", type=_provider_spec(LLM_PROVIDERS), default="groq",
+        help="LLM backend for the meeting minutes: groq or openai, or a routing list such as "
+             "'groq,openai:gpt-4o-mini' (default: groq)"
     )
 
     parser.add_argument(
@@ -45,34 +62,331 @@ def main():
     )
 
     parser.add_argument(
-        "--chunk-overlap", type=float, default=0.5,
-        help="Overlap ratio between audio chunks (default: 0.5)"
+        "--chunk-overlap", type=float, default=2.0,
+        help="Seconds of overlap between audio chunks, de-duplicated when stitching (default: 2)"
     )
 
-    args = parser.parse_args()
+    parser.add_argument(
+        "--chunk-seconds", type=float, default=None,
+        help="Maximum chunk duration in seconds, e.g. 60 to fan out many parallel requests"
+    )
+
+    parser.add_argument(
+        "--upload-format", choices=list(UPLOAD_FORMATS), default=DEFAULT_UPLOAD_FORMAT,
+        help=f"Encoding for uploaded audio chunks; all but wav are 16 kHz mono (default: {DEFAULT_UPLOAD_FORMAT})"
+    )
+
+    parser.add_argument(
+        "--streaming", action="store_true",
+        help="Decode the audio incrementally so memory use does not grow with recording length"
+    )
+
+    parser.add_argument(
+        "--max-silence", type=float, default=None,
+        help="Shorten pauses longer than this many seconds before upload (default: off)"
+    )
+
+    parser.add_argument(
+        "--no-silence-split", action="store_true",
+        help="Cut chunks at fixed sizes instead of moving boundaries into pauses"
+    )
+
+    parser.add_argument(
+        "--max-input-tokens", type=int, default=None,
+        help="Summarize longer transcripts section by section before writing the minutes (map-reduce)"
+    )
+
+    parser.add_argument(
+        "--transcription-rpm", type=float, default=None,
+        help="Requests per minute allowed for each transcription provider (default: provider preset)"
+    )
+
+    parser.add_argument(
+        "--hedge", type=float, default=None, metavar="PERCENTILE",
+        help="Send a duplicate request for chunks running longer than this latency percentile "
+             "of the run so far, e.g. 0.9; the first answer wins (default: off)"
+    )
+
+    parser.add_argument(
+        "--hedge-client", type=_provider_spec(TRANSCRIPTION_PROVIDERS), default=None,
+        help="Provider, provider:model or routing list for hedged requests "
+             "(default: same as --transcription-client)"
+    )
+
+    parser.add_argument(
+        "--rate-limit-db", default=None,
+        help="SQLite file used to share rate-limit budgets between concurrent transmeet runs"
+    )
+
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Always call the transcription API, ignoring chunks transcribed before"
+    )
+
+    parser.add_argument(
+        "--cache-path", default=None,
+        help="SQLite file for cached chunk transcripts (default: ~/.cache/transmeet/transcriptions.sqlite3)"
+    )
+
+    _add_report_argument(parser)
+
+
+def _add_report_argument(parser):
+    parser.add_argument(
+        "--report", default=None, metavar="PATH",
+        help="Write per-stage timings and token usage to PATH as JSON, or Prometheus text if it ends in .prom"
+    )
+
+
+def _write_report(args):
+    if args.report:
+        from transmeet.utils.tracing import write_run_report
+        write_run_report(args.report)
+        print(f"📊 Run report saved to {args.report}")
+
+
+def _apply_runtime_args(args):
+    if args.no_cache or args.cache_path:
+        configure_transcription_cache(enabled=not args.no_cache, path=args.cache_path)
+    if args.hedge:
+        from transmeet.clients.hedging import configure_hedging
+        # A whole spec: create_llm_manager splits "provider:model" and routing lists itself.
+        configure_hedging(percentile=args.hedge, provider=args.hedge_client)
+    if args.rate_limit_db:
+        set_rate_limit_state_path(args.rate_limit_db)
+    if args.transcription_rpm:
+        from transmeet.llm.router import parse_targets
+        for provider, model_name in parse_targets(args.transcription_client, args.transcription_model):
+            configure_rate_limit(provider, model_name, requests_per_minute=args.transcription_rpm)
+
+
+def batch_main(argv):
+    parser = argparse.ArgumentParser(
+        prog="transmeet batch",
+        description="🎤 TransMeet batch: transcribe every recording in a directory or glob."
+    )
+
+    parser.add_argument(
+        "source",
+        help="Directory (searched recursively) or quoted glob pattern, e.g. 'calls/**/*.mp3'"
+    )
+
+    _add_common_arguments(parser)
+
+    parser.add_argument(
+        "--workers", type=int, default=20,
+        help="Upload workers shared by all recordings (default: 20)"
+    )
+
+    parser.add_argument(
+        "--max-files", type=int, default=4,
+        help="Recordings processed at the same time (default: 4)"
+    )
+
+    parser.add_argument(
+        "--no-minutes", action="store_true",
+        help="Only write transcripts, skip meeting minutes"
+    )
+
+    args = parser.parse_args(argv)
+    _apply_runtime_args(args)
+    from transmeet.batch import run_batch
 
     try:
-        transcript, meeting_minutes = generate_meeting_transcript_and_minutes(
-            meeting_audio_file=args.audio_path,
+        report = run_batch(
+            source=args.source,
+            output_dir=args.output_dir,
             transcription_client=args.transcription_client,
             transcription_model=args.transcription_model,
             llm_client=args.llm_client,
             llm_model=args.llm_model,
             audio_chunk_size_mb=args.chunk_size_mb,
             audio_chunk_overlap=args.chunk_overlap,
+            upload_format=args.upload_format,
+            split_on_silence=not args.no_silence_split,
+            max_silence_s=args.max_silence,
+            audio_chunk_seconds=args.chunk_seconds,
+            streaming=args.streaming,
+            generate_minutes=not args.no_minutes,
+            max_workers=args.workers,
+            max_files_in_flight=args.max_files,
+            max_input_tokens=args.max_input_tokens,
         )
+    except Exception as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(
+        f"✅ {report['completed']} completed, {report['skipped']} skipped, {report['failed']} failed "
+        f"in {report['elapsed_seconds']:.0f}s"
+    )
+    print(
+        f"📈 {report['files_per_hour']:.1f} files/hour, "
+        f"{report['audio_hours_per_hour']:.2f} audio hours/hour"
+    )
+    _write_report(args)
+    if report["failed"]:
+        sys.exit(1)
+
+
+def _format_timestamp(ms):
+    seconds = int(ms // 1000)
+    return f"{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+
+
+def live_main(argv):
+    from transmeet.live import DEFAULT_MAX_WINDOW_MS, DEFAULT_MIN_WINDOW_MS, open_pcm_source, transcribe_live
+
+    parser = argparse.ArgumentParser(
+        prog="transmeet live",
+        description="🎤 TransMeet live: caption raw 16-bit PCM from stdin or a local socket as it arrives.",
+        epilog="Example: ffmpeg -re -i meeting.mp3 -f s16le -ac 1 -ar 16000 - | transmeet live -o live.txt"
+    )
+
+    parser.add_argument(
+        "--listen", default=None, metavar="[HOST]:PORT",
+        help="Read PCM from the first TCP connection on this address instead of stdin"
+    )
+
+    parser.add_argument(
+        "--sample-rate", type=int, default=16000,
+        help="Sample rate of the incoming PCM (default: 16000)"
+    )
+
+    parser.add_argument(
+        "--channels", type=int, default=1,
+        help="Channel count of the incoming PCM (default: 1)"
+    )
+
+    parser.add_argument(
+        "-o", "--output", default=None,
+        help="Also append each caption line to this file"
+    )
+
+    parser.add_argument(
+        "--transcription-client", type=_provider_spec(TRANSCRIPTION_PROVIDERS), default="groq",
+        help="Transcription backend: groq, openai, local (faster-whisper on this machine) or google "
+             "(Web Speech API; the model is the language, e.g. en-US); a list such as "
+             "'groq,openai:whisper-1' spreads chunks across providers by headroom and latency (default: groq)"
+    )
+
+    parser.add_argument(
+        "--transcription-model", default="whisper-large-v3-turbo",
+        help="Transcription model to use (default: whisper-large-v3-turbo)"
+    )
+
+    parser.add_argument(
+        "--upload-format", choices=list(UPLOAD_FORMATS), default=DEFAULT_UPLOAD_FORMAT,
+        help=f"Encoding for uploaded windows (default: {DEFAULT_UPLOAD_FORMAT})"
+    )
+
+    parser.add_argument(
+        "--max-window", type=float, default=DEFAULT_MAX_WINDOW_MS / 1000,
+        help="Longest window in seconds; bounds caption latency (default: %(default)s)"
+    )
+
+    parser.add_argument(
+        "--workers", type=int, default=4,
+        help="Windows transcribed at the same time (default: 4)"
+    )
+
+    _add_report_argument(parser)
+
+    args = parser.parse_args(argv)
+    output = open(args.output, "a", encoding="utf-8") if args.output else None
+
+    def show(update, _transcript):
+        if not update.text:
+            return
+        line = f"[{_format_timestamp(update.start_ms)}] {update.text}"
+        print(line, flush=True)
+        if output:
+            output.write(line + "\n")
+            output.flush()
+
+    try:
+        result = transcribe_live(
+            open_pcm_source(args.listen),
+            transcription_client=args.transcription_client,
+            transcription_model=args.transcription_model,
+            frame_rate=args.sample_rate,
+            channels=args.channels,
+            upload_format=args.upload_format,
+            max_workers=args.workers,
+            max_window_ms=int(args.max_window * 1000),
+            min_window_ms=min(DEFAULT_MIN_WINDOW_MS, int(args.max_window * 1000)),
+            on_update=show,
+        )
+    except KeyboardInterrupt:
+        return
+    except Exception as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        if output:
+            output.close()
+        _write_report(args)
+
+    if result.failed_chunks:
+        print(f"⚠️ {len(result.failed_chunks)} window(s) could not be transcribed", file=sys.stderr)
+
 
-        output_dir=args.output_dir,
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "batch":
+        return batch_main(argv[1:])
+    if argv and argv[0] == "live":
+        return live_main(argv[1:])
+
+    parser = argparse.ArgumentParser(
+        description="🎤 TransMeet: Transcribe audio and generate meeting minutes using Groq or Google."
+    )
+
+    parser.add_argument(
+        "-i", "--audio-path", required=True,
+        help="Path to the audio file (.wav, .mp3, etc.)"
+    )
+
+    _add_common_arguments(parser)
+
+    args = parser.parse_args(argv)
+    _apply_runtime_args(args)
+    from transmeet.processor import transcribe_audio_file, generate_meeting_minutes_stream_from_transcript
+
+    try:
+        transcript = transcribe_audio_file(
+            audio_path=args.audio_path,
+            llm_client=args.transcription_client,
+            llm_model=args.transcription_model,
+            audio_chunk_size_mb=args.chunk_size_mb,
+            audio_chunk_overlap=args.chunk_overlap,
+            streaming=args.streaming,
+            upload_format=args.upload_format,
+            split_on_silence=not args.no_silence_split,
+            max_silence_s=args.max_silence,
+            audio_chunk_seconds=args.chunk_seconds,
+        )
+        if transcript.startswith("Error:"):
+            raise RuntimeError(transcript)
+
+        output_dir = args.output_dir
+        os.makedirs(output_dir, exist_ok=True)
         transcript_path = f"{output_dir}/transcript_{args.audio_path.split('/')[-1].split('.')[0]}.txt"
         minutes_path = f"{output_dir}/meeting_minutes_{args.audio_path.split('/')[-1].split('.')[0]}.txt"
 
         with open(transcript_path, "w") as f:
             f.write(transcript)
         print(f"✅ Transcript saved to {transcript_path}")
-        
+
+        # Minutes are written as they are generated, so the file can be followed while it grows.
+        print(f"📝 Writing meeting minutes to {minutes_path} ...")
         with open(minutes_path, "w") as f:
-            f.write(meeting_minutes)
+            for piece in generate_meeting_minutes_stream_from_transcript(
+                    transcript, args.llm_client, args.llm_model, max_input_tokens=args.max_input_tokens):
+                f.write(piece)
+                f.flush()
         print(f"✅ Meeting minutes saved to {minutes_path}")
+        _write_report(args)
 
     except Exception as e:
         print(f"❌ Error: {e}", file=sys.stderr)
@@ -0,0 +1,61 @@
+# cython: language_level=3
+import math
+from dataclasses import dataclass
+from threading import Lock
+from typing import Optional, Sequence
+
+DEFAULT_HEDGE_PERCENTILE = 0.9
+
+
+@dataclass
+class HedgePolicy:
+    """
+    When to send a duplicate request for a straggling chunk.
+
+    A chunk is hedged once its request has run longer than ``percentile`` of
+    the chunk latencies seen so far in the same run (at least ``min_delay_s``,
+    and only after ``min_samples`` chunks finished). The duplicate goes to
+    ``provider``/``model_name`` when set, otherwise to the same manager; the
+    first answer wins. At most ``max_fraction`` of the chunks are hedged.
+    """
+    percentile: float = DEFAULT_HEDGE_PERCENTILE
+    min_samples: int = 5
+    min_delay_s: float = 2.0
+    max_fraction: float = 0.1
+    provider: Optional[str] = None
+    model_name: Optional[str] = None
+
+    def threshold(self, latencies: Sequence[float]) -> Optional[float]:
+        """Seconds after which a running chunk is hedged, or None with too few samples."""
+        if len(latencies) < self.min_samples:
+            return None
+        ordered = sorted(latencies)
+        rank = min(len(ordered) - 1, int(self.percentile * len(ordered)))
+        return max(self.min_delay_s, ordered[rank])
+
+    def budget(self, chunks: int) -> int:
+        """Hedges allowed once ``chunks`` chunks have been started."""
+        return max(1, math.ceil(self.max_fraction * chunks))
+
+
+_policy: Optional[HedgePolicy] = None
+_policy_lock = Lock()
+
+
+def configure_hedging(enabled: bool = True, percentile: float = DEFAULT_HEDGE_PERCENTILE, min_samples: int = 5,
+                      min_delay_s: float = 2.0, max_fraction: float = 0.1, provider: Optional[str] = None,
+                      model_name: Optional[str] = None):
+    """
+    Hedge straggling chunk transcriptions from now on, or stop with ``enabled=False``.
+    Example: configure_hedging(percentile=0.95, provider="openai", model_name="whisper-1")
+    """
+    global _policy
+    policy = HedgePolicy(percentile, min_samples, min_delay_s, max_fraction, provider, model_name)
+    with _policy_lock:
+        _policy = policy if enabled else None
+
+
+def get_hedge_policy() -> Optional[HedgePolicy]:
+    """The process-wide hedging policy, or None when hedging is off (the default)."""
+    with _policy_lock:
+        return _policy
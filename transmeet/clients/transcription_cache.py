@@ -0,0 +1,89 @@
+# cython: language_level=3
+import hashlib
+from threading import Lock
+from typing import TYPE_CHECKING, Optional
+
+from transmeet.utils.general_utils import get_logger
+from transmeet.utils.sqlite_cache import SQLiteCache, default_cache_dir
+
+if TYPE_CHECKING:
+    from pydub import AudioSegment
+
+logger = get_logger(__name__)
+
+DEFAULT_CACHE_MAX_MB = 256
+DEFAULT_CACHE_MAX_AGE_DAYS = 90
+
+
+def chunk_cache_key(chunk: "AudioSegment", provider: str, model_name: str, upload_format: str) -> str:
+    """Hash of the chunk's decoded PCM and sample layout plus everything that shapes the transcript."""
+    digest = hashlib.sha256()
+    digest.update(f"{provider}|{model_name}|{upload_format}|".encode())
+    digest.update(f"{chunk.frame_rate}|{chunk.channels}|{chunk.sample_width}|".encode())
+    digest.update(chunk.raw_data)
+    return digest.hexdigest()
+
+
+class TranscriptionCache:
+    """Chunk transcripts stored on disk, addressed by ``chunk_cache_key``."""
+
+    def __init__(self, path=None, max_mb: Optional[float] = DEFAULT_CACHE_MAX_MB,
+                 max_age_days: Optional[float] = DEFAULT_CACHE_MAX_AGE_DAYS):
+        path = path or default_cache_dir() / "transcriptions.sqlite3"
+        self.store = SQLiteCache(
+            path,
+            max_bytes=int(max_mb * 1024 * 1024) if max_mb else None,
+            max_age_s=max_age_days * 86400 if max_age_days else None,
+        )
+
+    # Cache errors (locked or corrupt file, full disk) degrade to a miss rather than failing the chunk.
+    def get(self, key: str) -> Optional[str]:
+        try:
+            return self.store.get(key)
+        except Exception as e:
+            logger.warning(f"Transcription cache read failed: {e}")
+            return None
+
+    def set(self, key: str, text: str):
+        try:
+            self.store.set(key, text)
+        except Exception as e:
+            logger.warning(f"Transcription cache write failed: {e}")
+
+    def stats(self) -> dict:
+        return self.store.stats()
+
+
+_cache: Optional[TranscriptionCache] = None
+_cache_options = {"enabled": True}
+_cache_lock = Lock()
+
+
+def configure_transcription_cache(enabled: bool = True, path=None, max_mb: Optional[float] = DEFAULT_CACHE_MAX_MB,
+                                  max_age_days: Optional[float] = DEFAULT_CACHE_MAX_AGE_DAYS):
+    """
+    Turn the on-disk transcription cache on or off, or move it.
+    Example: configure_transcription_cache(path="/data/transmeet-cache.sqlite3", max_mb=1024)
+    """
+    global _cache
+    with _cache_lock:
+        _cache_options.update(enabled=enabled, path=path, max_mb=max_mb, max_age_days=max_age_days)
+        _cache = None
+
+
+def get_transcription_cache() -> Optional[TranscriptionCache]:
+    """Return the process-wide transcription cache, or None when caching is disabled."""
+    global _cache
+    with _cache_lock:
+        if not _cache_options["enabled"]:
+            return None
+        if _cache is None:
+            options = {k: v for k, v in _cache_options.items() if k != "enabled"}
+            try:
+                _cache = TranscriptionCache(**options)
+            except Exception as e:
+                # A read-only or missing cache directory must not stop transcription.
+                logger.warning(f"Transcription cache unavailable ({e}); continuing without it.")
+                _cache_options["enabled"] = False
+                return None
+        return _cache
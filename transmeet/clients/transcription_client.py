@@ -1,86 +1,384 @@
 # cython: language_level=3
-import math
+import asyncio
+import heapq
 import time
-from collections import deque
-from threading import Lock
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional
 
-import speech_recognition as sr
 from pydub import AudioSegment
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Executor, ThreadPoolExecutor, FIRST_COMPLETED, wait
 
-from transmeet.llm.llm_manager import LLMManager
-from transmeet.utils.file_utils import (
-    export_temp_wav,
-    delete_file,
+from transmeet.llm.llm_manager import LLMManager, create_llm_manager
+from transmeet.llm.retry import RetryPolicy, classify_error
+from transmeet.clients.hedging import HedgePolicy, get_hedge_policy
+from transmeet.clients.transcription_cache import TranscriptionCache, chunk_cache_key, get_transcription_cache
+from transmeet.utils.audio_formats import DEFAULT_UPLOAD_FORMAT
+from transmeet.utils.audio_utils import (
+    AudioChunk,
+    encode_audio_chunk,
+    get_audio_size_mb,
+    estimate_encoded_bytes_per_ms,
+    upload_stream_format,
+    split_audio_by_target_size,
+    probe_audio,
+    chunk_duration_for_size,
+    stream_audio_chunks,
 )
-from transmeet.utils.audio_utils import split_audio_by_target_size
 from transmeet.utils.general_utils import get_logger
+from transmeet.utils.tracing import in_current_context, span
+from transmeet.utils.transcript_utils import DEFAULT_OVERLAP_S, stitch_transcripts
 
 
 logger = get_logger(__name__)
 
-MAX_CALLS_PER_MINUTE = 20
-TIME_WINDOW = 60  # in seconds
-call_times = deque()
-rate_lock = Lock()
-
-def wait_for_rate_limit():
-    with rate_lock:
-        now = time.time()
-        # Remove expired timestamps
-        while call_times and now - call_times[0] > TIME_WINDOW:
-            call_times.popleft()
-
-        if len(call_times) >= MAX_CALLS_PER_MINUTE:
-            wait_time = TIME_WINDOW - (now - call_times[0])
-            print(f"[RateLimit] Hit 19 calls. Sleeping {wait_time:.2f} seconds...")
-            time.sleep(wait_time)
-            call_times.popleft()
-
-        call_times.append(time.time())
-
-def rate_limited(func):
-    def wrapper(*args, **kwargs):
-        wait_for_rate_limit()
-        return func(*args, **kwargs)
-    return wrapper
-
-@rate_limited
-def _transcribe_chunk_safe(chunk, idx, llm_manager: LLMManager):
-    try:
-        return _transcribe_chunk(chunk, idx, llm_manager)
-    except Exception as e:
-        logger.exception(f"Failed to transcribe chunk {idx}: {e}")
-        return idx, ""
+@dataclass
+class TranscriptionResult:
+    """Joined transcript plus the chunks that could not be transcribed."""
+    text: str
+    chunk_texts: List[str] = field(default_factory=list)
+    failed_chunks: Dict[int, str] = field(default_factory=dict)
+
+
+@dataclass
+class ChunkTranscript:
+    """Transcript of one chunk and its position in the source recording."""
+    index: int
+    text: str
+    start_ms: int
+    end_ms: int
+    error: Optional[str] = None
+
+
+def _chunk_bounds(chunk):
+    if isinstance(chunk, AudioChunk):
+        return chunk.start_ms, chunk.end_ms
+    return 0, len(chunk)
+
 
-def transcribe_with_llm_calls(audio_segments, llm_manager: LLMManager, max_workers=20):
+def iter_chunk_transcripts(audio_segments, llm_manager: LLMManager, max_workers=20,
+                           upload_format="wav", max_upload_mb=None,
+                           retry_policy: Optional[RetryPolicy] = None,
+                           executor: Optional[Executor] = None,
+                           cache: Optional[TranscriptionCache] = None,
+                           hedge_policy: Optional[HedgePolicy] = None) -> Iterator[ChunkTranscript]:
     """
-    Transcribes a list of audio segments using an LLM client in parallel, rate-limited to 19 calls/minute.
+    Transcribe chunks in parallel and yield a ``ChunkTranscript`` per chunk, in
+    chunk order, as soon as every earlier chunk is done. Chunks that finish early
+    wait in a reorder buffer. Texts are per chunk, so neighbouring chunks still
+    share their overlap; ``start_ms``/``end_ms`` are positions in the recording.
+
+    Takes the same scheduling arguments as ``transcribe_with_llm_calls``.
+    Closing the generator early cancels the chunks that have not started.
     """
-    results = [""] * len(audio_segments)
+    retry_policy = retry_policy or llm_manager.retry_policy
+    max_workers = min(max_workers, llm_manager.max_concurrency or max_workers)
+    hedge_manager = llm_manager
+    if hedge_policy is not None and hedge_policy.provider:
+        hedge_manager = create_llm_manager(hedge_policy.provider, hedge_policy.model_name or llm_manager.model_name)
+    ready = {}  # reorder buffer: idx -> ChunkTranscript
+    next_idx = 0
+    retries = []  # heap of (ready_at, idx, attempt, chunk)
+    source = enumerate(audio_segments)
+    exhausted = False
+    pending = {}  # future -> (idx, chunk, attempt, clock, is_hedge)
+    started_chunks = 0
+    latencies = []  # seconds per answered request in this run, for the hedging threshold
+    hedged = set()
+    hedges_won = 0
+
+    own_executor = executor is None
+    if own_executor:
+        executor = ThreadPoolExecutor(max_workers=max_workers)
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {
-            executor.submit(_transcribe_chunk_safe, chunk, idx, llm_manager): idx
-            for idx, chunk in enumerate(audio_segments)
-        }
+    def submit(idx, chunk, attempt, manager=llm_manager, is_hedge=False):
+        clock = {}
 
-        for future in as_completed(futures):
-            idx, text = future.result()
-            results[idx] = text
+        def run():
+            clock["start"] = time.monotonic()
+            return _transcribe_chunk(chunk, idx, manager, upload_format, max_upload_mb, cache)
 
-    return " ".join(results).strip()
+        future = executor.submit(in_current_context(run))
+        pending[future] = (idx, chunk, attempt, clock, is_hedge)
 
-def _transcribe_chunk(chunk, idx, llm_manager: LLMManager):
-    temp_filename = export_temp_wav(chunk, "llm", idx)
-    logger.info(f"Transcribing chunk {idx + 1} using {llm_manager.provider}...")
+    def fire_hedges():
+        """Duplicate chunks running past the threshold; return seconds until the next one is due."""
+        threshold = hedge_policy.threshold(latencies) if hedge_policy is not None else None
+        if threshold is None:
+            return None
+        now = time.monotonic()
+        next_due = None
+        for idx, chunk, attempt, clock, is_hedge in list(pending.values()):
+            if is_hedge or idx in hedged:
+                continue
+            # Not started yet (queued on a shared executor): look again later.
+            due = clock["start"] + threshold - now if "start" in clock else threshold
+            if due > 0:
+                next_due = due if next_due is None else min(next_due, due)
+            elif len(pending) < max_workers and len(hedged) < hedge_policy.budget(started_chunks):
+                logger.info(f"Chunk {idx} running for {now - clock['start']:.1f}s "
+                            f"(threshold {threshold:.1f}s); sending a hedged request.")
+                hedged.add(idx)
+                hedge_manager.token_tracker.record_hedge()
+                submit(idx, chunk, attempt, hedge_manager, is_hedge=True)
+        return next_due
 
     try:
-        text = llm_manager.transcribe_audio(temp_filename)
-        return idx, text
+        while True:
+            while retries and retries[0][0] <= time.monotonic() and len(pending) < max_workers:
+                _, idx, attempt, chunk = heapq.heappop(retries)
+                submit(idx, chunk, attempt)
+
+            while not exhausted and len(pending) < max_workers and len(pending) + len(retries) < 2 * max_workers:
+                try:
+                    idx, chunk = next(source)
+                except StopIteration:
+                    exhausted = True
+                    break
+                started_chunks += 1
+                submit(idx, chunk, 1)
+
+            while next_idx in ready:
+                yield ready.pop(next_idx)
+                next_idx += 1
+
+            if not pending and not retries:
+                break
+
+            timeout = max(0.0, retries[0][0] - time.monotonic()) if retries else None
+            hedge_due = fire_hedges()
+            if hedge_due is not None:
+                timeout = hedge_due if timeout is None else min(timeout, hedge_due)
+            if not pending:
+                time.sleep(timeout)
+                continue
+
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                idx, chunk, attempt, clock, is_hedge = pending.pop(future)
+                if idx < next_idx or idx in ready:
+                    continue  # the other copy of a hedged chunk answered first
+                siblings = [other for other, entry in pending.items() if entry[0] == idx]
+                start_ms, end_ms = _chunk_bounds(chunk)
+                try:
+                    text = future.result()
+                except Exception as e:
+                    if siblings:
+                        logger.warning(f"Chunk {idx} copy failed ({e}); waiting for the other one.")
+                        continue
+                    delay = retry_policy.next_delay(e, attempt)
+                    if delay is None:
+                        logger.error(f"Chunk {idx} failed permanently after {attempt} attempt(s): {e}")
+                        ready[idx] = ChunkTranscript(idx, "", start_ms, end_ms, error=str(e))
+                    else:
+                        logger.warning(
+                            f"Chunk {idx} failed ({classify_error(e)}: {e}); retrying in {delay:.1f}s"
+                        )
+                        heapq.heappush(retries, (time.monotonic() + delay, idx, attempt + 1, chunk))
+                    continue
+
+                latencies.append(time.monotonic() - clock["start"])
+                ready[idx] = ChunkTranscript(idx, text, start_ms, end_ms)
+                if is_hedge:
+                    hedges_won += 1
+                    hedge_manager.token_tracker.record_hedge(won=True)
+                for other in siblings:
+                    # Not started yet: dropped; already running: forgotten, so the
+                    # run can finish without waiting for the losing request.
+                    other.cancel()
+                    del pending[other]
     finally:
-        delete_file(temp_filename)
+        # Only reached with work pending when the generator is closed early.
+        # Requests already running are not joined (nor are hedge losers above).
+        for future in pending:
+            future.cancel()
+        if own_executor:
+            executor.shutdown(wait=False)
+        _log_cache_stats(cache)
+        if hedged:
+            logger.info(f"Hedged {len(hedged)} chunk(s); {hedges_won} hedge(s) answered first.")
+
+
+def transcribe_with_llm_calls(audio_segments, llm_manager: LLMManager, max_workers=20,
+                              upload_format="wav", max_upload_mb=None, stitch=False,
+                              overlap_s: float = DEFAULT_OVERLAP_S,
+                              retry_policy: Optional[RetryPolicy] = None,
+                              executor: Optional[Executor] = None,
+                              cache: Optional[TranscriptionCache] = None,
+                              on_chunk: Optional[Callable[[ChunkTranscript], None]] = None,
+                              hedge_policy: Optional[HedgePolicy] = None) -> TranscriptionResult:
+    """
+    Transcribes a list of audio segments using an LLM client in parallel.
+    Calls are paced by the provider/model rate limiter inside ``LLMManager``.
+
+    ``audio_segments`` may also be a lazy iterator. At most ``max_workers`` chunks
+    are held in flight at once, so streamed input never piles up in memory.
+    Each chunk is encoded as ``upload_format``; chunks whose encoded size exceeds
+    ``max_upload_mb`` are halved until they fit. With ``stitch`` the chunk texts
+    are aligned word by word so overlapping boundaries are not duplicated;
+    ``overlap_s`` (the seconds of audio neighbouring chunks share) bounds how
+    many words at each boundary may be treated as duplicates.
+
+    Failed chunks are classified by ``retry_policy``; retryable ones are parked
+    until their backoff expires and then resubmitted to the same pool, so no
+    worker sleeps on them. Chunks that still fail are listed in ``failed_chunks``.
+
+    Pass a shared ``executor`` to schedule chunks of several recordings on one
+    worker pool; ``max_workers`` then caps this recording's chunks in flight.
+
+    With a ``cache``, chunks whose audio was already transcribed by the same
+    provider, model and upload format are answered from disk without an API call.
+
+    ``on_chunk`` is called with each ``ChunkTranscript`` in order, as soon as all
+    earlier chunks are done (see ``iter_chunk_transcripts``).
+
+    With a ``hedge_policy``, a chunk still running past the policy's latency
+    percentile for this run gets a duplicate request once a worker is free
+    (``max_workers`` still caps requests in flight). The first answer is kept;
+    the other copy is cancelled, or ignored if it already started. Hedges pass
+    through the rate limiter like any request and are counted as ``hedges`` and
+    ``hedges_won`` in ``get_usage_stats()``.
+    """
+    texts = []
+    failed_chunks = {}
+    for chunk_transcript in iter_chunk_transcripts(
+            audio_segments, llm_manager, max_workers=max_workers, upload_format=upload_format,
+            max_upload_mb=max_upload_mb, retry_policy=retry_policy, executor=executor, cache=cache,
+            hedge_policy=hedge_policy):
+        texts.append(chunk_transcript.text)
+        if chunk_transcript.error is not None:
+            failed_chunks[chunk_transcript.index] = chunk_transcript.error
+        if on_chunk is not None:
+            on_chunk(chunk_transcript)
+
+    with span("stitch", chunks=len(texts)):
+        text = stitch_transcripts(texts, overlap_s) if stitch else " ".join(t for t in texts if t).strip()
+    return TranscriptionResult(text=text, chunk_texts=texts, failed_chunks=failed_chunks)
+
+def _log_cache_stats(cache: Optional[TranscriptionCache]):
+    if cache is not None:
+        stats = cache.store
+        logger.info(f"Transcription cache: {stats.hits} hit(s), {stats.misses} miss(es) so far.")
+
+def _encode_within_limit(chunk, upload_format, max_upload_mb=None):
+    """
+    Encode a chunk, splitting it in half until each encoded piece fits the limit.
+    Returns ``(buffer, duration_s)`` pairs.
+    """
+    buffer = encode_audio_chunk(chunk, upload_format)
+    size = len(buffer.getvalue())
+    if max_upload_mb is None or size <= max_upload_mb * 1024 * 1024 or len(chunk) < 2000:
+        return [(buffer, len(chunk) / 1000)]
+
+    logger.warning(f"Encoded chunk is {size / (1024 * 1024):.2f} MB, above {max_upload_mb} MB — splitting it.")
+    middle = len(chunk) // 2
+    return (_encode_within_limit(chunk[:middle], upload_format, max_upload_mb)
+            + _encode_within_limit(chunk[middle:], upload_format, max_upload_mb))
+
+def _cached_text(chunk, idx, llm_manager: LLMManager, upload_format, cache):
+    """The chunk's cache key and cached text; the key is kept to store a fresh transcript."""
+    if cache is None:
+        return None, None
+    # Hashes the whole PCM buffer, so it is computed once per chunk.
+    key = chunk_cache_key(chunk, llm_manager.provider, llm_manager.model_name, upload_format)
+    text = cache.get(key)
+    if text is not None:
+        logger.info(f"Chunk {idx + 1} served from the transcription cache.")
+    return key, text
+
+def _transcribe_chunk(chunk, idx, llm_manager: LLMManager, upload_format="wav", max_upload_mb=None,
+                      cache: Optional[TranscriptionCache] = None):
+    if isinstance(chunk, AudioChunk):
+        chunk = chunk.audio
+    upload_format = _upload_format_for(llm_manager, upload_format)
+    with span("chunk", index=idx, audio_seconds=len(chunk) / 1000) as attributes:
+        with span("cache_lookup", index=idx):
+            key, text = _cached_text(chunk, idx, llm_manager, upload_format, cache)
+        attributes["cached"] = text is not None
+        if text is not None:
+            return text
+
+        with span("encode", index=idx, format=upload_format):
+            buffers = _encode_within_limit(chunk, upload_format, max_upload_mb)
+        logger.info(f"Transcribing chunk {idx + 1} using {llm_manager.provider}...")
+        text = " ".join(
+            llm_manager.transcribe_audio(buffer, audio_seconds=duration_s)
+            for buffer, duration_s in buffers
+        )
+        if cache is not None:
+            cache.set(key, text)
+        return text
+
+
+def _chunk_seconds_for(llm_manager: LLMManager, audio_chunk_seconds: Optional[float]) -> Optional[float]:
+    """Cap the chunk duration at the longest audio the provider takes per request."""
+    limit = llm_manager.max_audio_seconds
+    if limit is None:
+        return audio_chunk_seconds
+    return min(audio_chunk_seconds or limit, limit)
+
+
+def _upload_format_for(llm_manager: LLMManager, upload_format: str) -> str:
+    """The provider's preferred upload format, if it has one, over the caller's."""
+    return llm_manager.preferred_upload_format or upload_format
+
+
+def prepare_audio_chunks(
+    audio: AudioSegment,
+    file_size_mb: float,
+    audio_chunk_size_mb: int,
+    audio_chunk_overlap: float,
+    upload_format: str = DEFAULT_UPLOAD_FORMAT,
+    split_on_silence: bool = True,
+    max_silence_s: Optional[float] = None,
+    audio_chunk_seconds: Optional[float] = None
+):
+    """Split a decoded recording into upload-sized chunks (or one chunk if it already fits)."""
+    bytes_per_ms = estimate_encoded_bytes_per_ms(
+        upload_format, audio.frame_rate, audio.channels, sample=audio
+    )
+    upload_size_mb = len(audio) * bytes_per_ms / (1024 * 1024)
+    too_long = audio_chunk_seconds and len(audio) > audio_chunk_seconds * 1000
+    if upload_size_mb > audio_chunk_size_mb or too_long or max_silence_s:
+        logger.info(
+            f"Audio file is {file_size_mb:.2f} MB (~{upload_size_mb:.2f} MB as {upload_format}) — splitting into chunks."
+        )
+        return split_audio_by_target_size(
+            audio, audio_chunk_size_mb, audio_chunk_overlap, upload_format,
+            split_on_silence=split_on_silence,
+            max_silence_ms=int(max_silence_s * 1000) if max_silence_s else None,
+            max_chunk_ms=audio_chunk_seconds * 1000 if audio_chunk_seconds else None,
+        )
+
+    logger.info("Audio file is within size limit — transcribing directly.")
+    return [audio]
 
+def prepare_stream_chunks(
+    audio_path,
+    audio_chunk_size_mb: int,
+    audio_chunk_overlap: float,
+    upload_format: str = DEFAULT_UPLOAD_FORMAT,
+    split_on_silence: bool = True,
+    max_silence_s: Optional[float] = None,
+    audio_chunk_seconds: Optional[float] = None
+):
+    """Lazily decode ``audio_path`` into upload-sized chunks through ffmpeg."""
+    info = probe_audio(audio_path)
+    # Let ffmpeg resample/downmix while decoding so windows are already upload-sized.
+    frame_rate, channels = upload_stream_format(upload_format, info["frame_rate"], info["channels"])
+    chunk_duration_ms = chunk_duration_for_size(
+        audio_chunk_size_mb, frame_rate, channels, upload_format
+    )
+    if audio_chunk_seconds:
+        chunk_duration_ms = min(chunk_duration_ms, max(1000, int(audio_chunk_seconds * 1000)))
+    logger.info(
+        f"Streaming {audio_path} ({info['duration_s']:.0f}s) in windows of {chunk_duration_ms / 1000:.0f}s."
+    )
+    return stream_audio_chunks(
+        audio_path, chunk_duration_ms, frame_rate, channels,
+        split_on_silence=split_on_silence,
+        max_silence_ms=int(max_silence_s * 1000) if max_silence_s else None,
+        overlap=audio_chunk_overlap,
+    )
 
 def process_audio_transcription(
     transcription_client,
@@ -88,42 +386,230 @@ def process_audio_transcription(
     audio: AudioSegment,
     file_size_mb: float,
     audio_chunk_size_mb: int,
-    audio_chunk_overlap: float
-) -> str:
-    llm_manager = LLMManager(
+    audio_chunk_overlap: float,
+    upload_format: str = DEFAULT_UPLOAD_FORMAT,
+    split_on_silence: bool = True,
+    max_silence_s: Optional[float] = None,
+    audio_chunk_seconds: Optional[float] = None,
+    executor: Optional[Executor] = None,
+    on_chunk: Optional[Callable[[ChunkTranscript], None]] = None
+) -> TranscriptionResult:
+    llm_manager = create_llm_manager(
+        provider=transcription_client,
+        model_name=transcription_model
+    )
+    audio_chunk_seconds = _chunk_seconds_for(llm_manager, audio_chunk_seconds)
+    upload_format = _upload_format_for(llm_manager, upload_format)
+    with span("split", audio_seconds=len(audio) / 1000):
+        chunks = prepare_audio_chunks(
+            audio, file_size_mb, audio_chunk_size_mb, audio_chunk_overlap, upload_format,
+            split_on_silence, max_silence_s, audio_chunk_seconds
+        )
+    return transcribe_with_llm_calls(
+        chunks, llm_manager, upload_format=upload_format, max_upload_mb=audio_chunk_size_mb,
+        stitch=audio_chunk_overlap > 0, overlap_s=audio_chunk_overlap, executor=executor,
+        cache=get_transcription_cache(), on_chunk=on_chunk, hedge_policy=get_hedge_policy()
+    )
+
+def process_audio_stream_transcription(
+    transcription_client,
+    transcription_model: str,
+    audio_path,
+    audio_chunk_size_mb: int,
+    audio_chunk_overlap: float,
+    upload_format: str = DEFAULT_UPLOAD_FORMAT,
+    split_on_silence: bool = True,
+    max_silence_s: Optional[float] = None,
+    audio_chunk_seconds: Optional[float] = None,
+    executor: Optional[Executor] = None,
+    on_chunk: Optional[Callable[[ChunkTranscript], None]] = None
+) -> TranscriptionResult:
+    """
+    Like ``process_audio_transcription`` but decodes ``audio_path`` window by
+    window through ffmpeg instead of loading the whole recording.
+    """
+    llm_manager = create_llm_manager(
+        provider=transcription_client,
+        model_name=transcription_model
+    )
+    audio_chunk_seconds = _chunk_seconds_for(llm_manager, audio_chunk_seconds)
+    upload_format = _upload_format_for(llm_manager, upload_format)
+    chunks = prepare_stream_chunks(
+        audio_path, audio_chunk_size_mb, audio_chunk_overlap, upload_format,
+        split_on_silence, max_silence_s, audio_chunk_seconds
+    )
+    return transcribe_with_llm_calls(
+        chunks, llm_manager, upload_format=upload_format, max_upload_mb=audio_chunk_size_mb,
+        stitch=audio_chunk_overlap > 0, overlap_s=audio_chunk_overlap, executor=executor,
+        cache=get_transcription_cache(), on_chunk=on_chunk, hedge_policy=get_hedge_policy()
+    )
+
+async def _transcribe_chunk_async(chunk, idx, llm_manager: LLMManager, upload_format="wav", max_upload_mb=None,
+                                  cache: Optional[TranscriptionCache] = None):
+    if isinstance(chunk, AudioChunk):
+        chunk = chunk.audio
+    upload_format = _upload_format_for(llm_manager, upload_format)
+    loop = asyncio.get_running_loop()
+    with span("chunk", index=idx, audio_seconds=len(chunk) / 1000) as attributes:
+        # Hashing the PCM and the SQLite lookup are blocking, like encoding below.
+        with span("cache_lookup", index=idx):
+            key, text = await loop.run_in_executor(
+                None, _cached_text, chunk, idx, llm_manager, upload_format, cache
+            )
+        attributes["cached"] = text is not None
+        if text is not None:
+            return text
+
+        # Encoding is CPU/ffmpeg work, so it stays off the event loop.
+        with span("encode", index=idx, format=upload_format):
+            buffers = await loop.run_in_executor(None, _encode_within_limit, chunk, upload_format, max_upload_mb)
+        logger.info(f"Transcribing chunk {idx + 1} using {llm_manager.provider}...")
+        texts = []
+        for buffer, duration_s in buffers:
+            texts.append(await llm_manager.transcribe_audio_async(buffer, audio_seconds=duration_s))
+        text = " ".join(texts)
+        if cache is not None:
+            await loop.run_in_executor(None, cache.set, key, text)
+        return text
+
+async def transcribe_with_llm_calls_async(audio_segments, llm_manager: LLMManager, max_concurrency=20,
+                                          upload_format="wav", max_upload_mb=None, stitch=False,
+                                          overlap_s: float = DEFAULT_OVERLAP_S,
+                                          retry_policy: Optional[RetryPolicy] = None,
+                                          semaphore: Optional[asyncio.Semaphore] = None,
+                                          cache: Optional[TranscriptionCache] = None,
+                                          on_chunk: Optional[Callable[[ChunkTranscript], None]] = None
+                                          ) -> TranscriptionResult:
+    """
+    Async counterpart of ``transcribe_with_llm_calls``.
+
+    Concurrency is bounded by ``semaphore``; pass one shared semaphore to cap
+    in-flight uploads across many meetings on the same event loop. A chunk
+    gives up its slot while it backs off before a retry. ``audio_segments`` may
+    be a lazy (synchronous) iterator; it is only advanced when a slot is free.
+    ``on_chunk`` receives each ``ChunkTranscript`` in chunk order, as soon as all
+    earlier chunks are done.
+    """
+    retry_policy = retry_policy or llm_manager.retry_policy
+    semaphore = semaphore or asyncio.Semaphore(
+        min(max_concurrency, llm_manager.max_concurrency or max_concurrency)
+    )
+    loop = asyncio.get_running_loop()
+    failed_chunks = {}
+    ready = {}  # reorder buffer for on_chunk: idx -> ChunkTranscript
+    next_idx = 0
+
+    def emit(idx, chunk, text):
+        nonlocal next_idx
+        if on_chunk is None:
+            return
+        ready[idx] = ChunkTranscript(idx, text, *_chunk_bounds(chunk), error=failed_chunks.get(idx))
+        while next_idx in ready:
+            on_chunk(ready.pop(next_idx))
+            next_idx += 1
+
+    async def run(idx, chunk):
+        text = await transcribe(idx, chunk)
+        emit(idx, chunk, text)
+        return text
+
+    async def transcribe(idx, chunk):
+        attempt = 0
+        held = True  # the loop below acquired this chunk's slot
+        try:
+            while True:
+                attempt += 1
+                try:
+                    return await _transcribe_chunk_async(
+                        chunk, idx, llm_manager, upload_format, max_upload_mb, cache
+                    )
+                except Exception as e:
+                    delay = retry_policy.next_delay(e, attempt)
+                    if delay is None:
+                        logger.error(f"Chunk {idx} failed permanently after {attempt} attempt(s): {e}")
+                        failed_chunks[idx] = str(e)
+                        return ""
+                    logger.warning(f"Chunk {idx} failed ({classify_error(e)}: {e}); retrying in {delay:.1f}s")
+                    semaphore.release()
+                    held = False
+                    await asyncio.sleep(delay)
+                    await semaphore.acquire()
+                    held = True
+        finally:
+            # Cancelled while backing off or waiting for a slot: nothing to give back.
+            if held:
+                semaphore.release()
+
+    tasks = []
+    source = iter(audio_segments)
+    idx = 0
+    while True:
+        await semaphore.acquire()
+        # Pulling from a streaming source blocks on ffmpeg, so do it in a thread.
+        chunk = await loop.run_in_executor(None, next, source, None)
+        if chunk is None:
+            semaphore.release()
+            break
+        tasks.append(asyncio.ensure_future(run(idx, chunk)))
+        idx += 1
+
+    texts = list(await asyncio.gather(*tasks))
+    _log_cache_stats(cache)
+    with span("stitch", chunks=len(texts)):
+        text = stitch_transcripts(texts, overlap_s) if stitch else " ".join(t for t in texts if t).strip()
+    return TranscriptionResult(text=text, chunk_texts=texts, failed_chunks=failed_chunks)
+
+async def process_audio_transcription_async(
+    transcription_client,
+    transcription_model: str,
+    audio_path,
+    audio_chunk_size_mb: int,
+    audio_chunk_overlap: float,
+    upload_format: str = DEFAULT_UPLOAD_FORMAT,
+    split_on_silence: bool = True,
+    max_silence_s: Optional[float] = None,
+    audio_chunk_seconds: Optional[float] = None,
+    streaming: bool = False,
+    max_concurrency: int = 20,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    on_chunk: Optional[Callable[[ChunkTranscript], None]] = None
+) -> TranscriptionResult:
+    """Decode (in a worker thread) and transcribe ``audio_path`` on the running event loop."""
+    llm_manager = create_llm_manager(
         provider=transcription_client,
         model_name=transcription_model
     )
-    if file_size_mb > audio_chunk_size_mb:
-        logger.info(f"Audio file is {file_size_mb:.2f} MB — splitting into chunks.")
-        chunks = split_audio_by_target_size(audio, audio_chunk_size_mb, audio_chunk_overlap)
+    audio_chunk_seconds = _chunk_seconds_for(llm_manager, audio_chunk_seconds)
+    upload_format = _upload_format_for(llm_manager, upload_format)
+    loop = asyncio.get_running_loop()
+    if streaming:
+        chunks = await loop.run_in_executor(
+            None, prepare_stream_chunks, audio_path, audio_chunk_size_mb, audio_chunk_overlap,
+            upload_format, split_on_silence, max_silence_s, audio_chunk_seconds
+        )
     else:
-        logger.info(f"Audio file is within size limit — transcribing directly.")
-        chunks = [audio]
-
-    return transcribe_with_llm_calls(chunks, llm_manager)
-
-def transcribe_with_google(audio, chunk_length_ms=60_000):
-    recognizer = sr.Recognizer()
-    full_text = ""
-    num_chunks = math.ceil(len(audio) / chunk_length_ms)
-
-    for i in range(num_chunks):
-        start, end = i * chunk_length_ms, min((i + 1) * chunk_length_ms, len(audio))
-        chunk = audio[start:end]
-        temp_filename = export_temp_wav(chunk, "google", i)
-        logger.info(f"Transcribing {temp_filename} with Google...")
-
-        with sr.AudioFile(temp_filename) as source:
-            audio_data = recognizer.record(source)
-            try:
-                text = recognizer.recognize_google(audio_data) # type: ignore
-                full_text += text + " "
-            except sr.UnknownValueError:
-                logger.warning(f"Could not understand audio in {temp_filename}")
-            except sr.RequestError as e:
-                logger.error(f"Google request error: {e}")
-
-        delete_file(temp_filename)
-
-    return full_text.strip()
+        def decode_and_split():
+            with span("decode"):
+                audio = AudioSegment.from_file(audio_path)
+            with span("split", audio_seconds=len(audio) / 1000):
+                return prepare_audio_chunks(
+                    audio, get_audio_size_mb(audio), audio_chunk_size_mb, audio_chunk_overlap,
+                    upload_format, split_on_silence, max_silence_s, audio_chunk_seconds
+                )
+        chunks = await loop.run_in_executor(None, in_current_context(decode_and_split))
+
+    return await transcribe_with_llm_calls_async(
+        chunks, llm_manager, max_concurrency=max_concurrency, upload_format=upload_format,
+        max_upload_mb=audio_chunk_size_mb, stitch=audio_chunk_overlap > 0, overlap_s=audio_chunk_overlap,
+        semaphore=semaphore, cache=get_transcription_cache(), on_chunk=on_chunk
+    )
+
+def transcribe_with_google(audio, chunk_length_ms=60_000, language="en-US"):
+    """
+    Transcribe a decoded recording with Google Speech: windows of ``chunk_length_ms``
+    go through the same parallel, rate-limited scheduler as the other providers.
+    Equivalent to ``process_audio_transcription`` with ``transcription_client="google"``.
+    """
+    llm_manager = create_llm_manager(provider="google", model_name=language)
+    chunks = [audio[start:start + chunk_length_ms] for start in range(0, len(audio), chunk_length_ms)]
+    return transcribe_with_llm_calls(chunks, llm_manager, upload_format="wav").text
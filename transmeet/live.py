@@ -0,0 +1,175 @@
+# cython: language_level=3
+import socket
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import BinaryIO, Callable, Iterator, Optional
+
+import numpy as np
+from pydub import AudioSegment
+
+from transmeet.clients.transcription_client import ChunkTranscript, TranscriptionResult, _transcribe_chunk
+from transmeet.llm.llm_manager import create_llm_manager
+from transmeet.llm.retry import RetryPolicy
+from transmeet.utils.audio_formats import DEFAULT_UPLOAD_FORMAT
+from transmeet.utils.audio_utils import (
+    MIN_PAUSE_MS,
+    PCM_SAMPLE_WIDTH,
+    SILENCE_FRAME_MS,
+    AudioChunk,
+    find_pause_boundary,
+    frame_levels_db,
+    silence_threshold_db,
+    _silent_runs,
+)
+from transmeet.utils.general_utils import get_logger
+from transmeet.utils.tracing import in_current_context, job
+
+logger = get_logger(__name__)
+
+LIVE_READ_MS = 250
+DEFAULT_MIN_WINDOW_MS = 4_000
+DEFAULT_MAX_WINDOW_MS = 15_000
+# Windows that never rise above this level are not sent; speech models tend to
+# invent text for pure silence.
+SILENT_WINDOW_DB = -50.0
+
+
+def _trailing_pause_cut(levels, silence_thresh_db, min_pause_ms=MIN_PAUSE_MS, frame_ms=SILENCE_FRAME_MS):
+    """Middle of the pause the buffer ends in, or None if it does not end in a long enough pause."""
+    starts, ends = _silent_runs(levels < silence_thresh_db)
+    if not len(starts) or ends[-1] != len(levels):
+        return None
+    if (ends[-1] - starts[-1]) * frame_ms < min_pause_ms:
+        return None
+    return int((starts[-1] + ends[-1]) // 2) * frame_ms
+
+
+def live_pcm_windows(stream: BinaryIO, frame_rate: int = 16000, channels: int = 1,
+                     min_window_ms: int = DEFAULT_MIN_WINDOW_MS,
+                     max_window_ms: int = DEFAULT_MAX_WINDOW_MS) -> Iterator[AudioChunk]:
+    """
+    Read signed 16-bit little-endian PCM from ``stream`` as it arrives and yield
+    ``AudioChunk`` windows cut in pauses. A window is closed once it is at least
+    ``min_window_ms`` long and ends in a pause, or at the best pause when it
+    reaches ``max_window_ms``, which bounds the delay before it is sent.
+    """
+    frame_width = channels * PCM_SAMPLE_WIDTH
+    read_bytes = max(1, int(frame_rate * LIVE_READ_MS / 1000)) * frame_width
+    buffer = b""
+    buffer_start_ms = 0
+
+    def window_of(data):
+        return AudioSegment(data=data, sample_width=PCM_SAMPLE_WIDTH, frame_rate=frame_rate, channels=channels)
+
+    while True:
+        data = stream.read(read_bytes)
+        at_end = not data
+        buffer += data or b""
+        usable = buffer[:len(buffer) - len(buffer) % frame_width]
+        window = window_of(usable)
+
+        cut_ms = None
+        if at_end:
+            cut_ms = len(window) if len(window) else None
+        elif len(window) >= min_window_ms:
+            levels = frame_levels_db(window)
+            threshold = silence_threshold_db(levels)
+            cut_ms = _trailing_pause_cut(levels, threshold)
+            if cut_ms is None and len(window) >= max_window_ms:
+                cut_ms = find_pause_boundary(levels, threshold, 0, len(window), search_ms=max_window_ms // 2)
+
+        if cut_ms:
+            emitted = window[:cut_ms]
+            buffer = buffer[len(emitted.raw_data):]
+            levels = frame_levels_db(emitted)
+            if len(levels) and float(np.max(levels)) >= SILENT_WINDOW_DB:
+                yield AudioChunk(emitted, buffer_start_ms, buffer_start_ms + len(emitted))
+            buffer_start_ms += len(emitted)
+
+        if at_end:
+            return
+
+
+def open_pcm_source(listen: Optional[str] = None) -> BinaryIO:
+    """
+    Standard input, or the first connection accepted on ``listen`` ("host:port"
+    or ":port" for localhost).
+    """
+    if not listen:
+        return sys.stdin.buffer
+
+    host, _, port = listen.rpartition(":")
+    server = socket.create_server((host or "127.0.0.1", int(port)))
+    logger.info(f"Waiting for a PCM stream on {host or '127.0.0.1'}:{port} ...")
+    connection, address = server.accept()
+    server.close()
+    logger.info(f"Receiving audio from {address[0]}:{address[1]}.")
+    return connection.makefile("rb")
+
+
+def transcribe_live(
+    stream: BinaryIO,
+    transcription_client: str = "groq",
+    transcription_model: str = "whisper-large-v3-turbo",
+    frame_rate: int = 16000,
+    channels: int = 1,
+    upload_format: str = DEFAULT_UPLOAD_FORMAT,
+    max_workers: int = 4,
+    min_window_ms: int = DEFAULT_MIN_WINDOW_MS,
+    max_window_ms: int = DEFAULT_MAX_WINDOW_MS,
+    on_update: Optional[Callable[[ChunkTranscript, str], None]] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+) -> TranscriptionResult:
+    """
+    Transcribe a live PCM stream until it ends.
+
+    Windows are uploaded as soon as they are cut, up to ``max_workers`` at a
+    time, through ``LLMManager.transcribe_audio``. ``on_update`` is called in
+    window order with each new ``ChunkTranscript`` and the transcript so far, so
+    a caption lags the speech by at most one window plus one request.
+    """
+    llm_manager = create_llm_manager(provider=transcription_client, model_name=transcription_model)
+    retry_policy = retry_policy or llm_manager.retry_policy
+    lock = Lock()
+    ready = {}  # reorder buffer: idx -> ChunkTranscript
+    texts = []
+    failed_chunks = {}
+    in_flight = set()
+
+    def transcribe(idx, chunk):
+        return retry_policy.call(_transcribe_chunk, chunk, idx, llm_manager, upload_format)
+
+    def done(idx, chunk, future):
+        try:
+            result = ChunkTranscript(idx, future.result(), chunk.start_ms, chunk.end_ms)
+        except Exception as e:
+            logger.error(f"Live window {idx} ({chunk.start_ms / 1000:.1f}s) failed: {e}")
+            result = ChunkTranscript(idx, "", chunk.start_ms, chunk.end_ms, error=str(e))
+        with lock:
+            in_flight.discard(idx)
+            ready[idx] = result
+            while len(texts) in ready:
+                update = ready.pop(len(texts))
+                texts.append(update.text)
+                if update.error is not None:
+                    failed_chunks[update.index] = update.error
+                if on_update is not None:
+                    on_update(update, " ".join(t for t in texts if t))
+
+    started = time.monotonic()
+    with job(), ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for idx, chunk in enumerate(live_pcm_windows(stream, frame_rate, channels, min_window_ms, max_window_ms)):
+            with lock:
+                in_flight.add(idx)
+                backlog = len(in_flight)
+            if backlog > max_workers:
+                logger.warning(f"Live transcription is {backlog} windows behind; consider more workers.")
+            future = executor.submit(in_current_context(transcribe), idx, chunk)
+            future.add_done_callback(lambda f, idx=idx, chunk=chunk: done(idx, chunk, f))
+
+    logger.info(f"Live stream ended after {time.monotonic() - started:.0f}s.")
+    return TranscriptionResult(
+        text=" ".join(t for t in texts if t).strip(), chunk_texts=texts, failed_chunks=failed_chunks
+    )
@@ -1,26 +1,114 @@
+import asyncio
+import os
 from abc import ABC, abstractmethod
 from datetime import datetime
+from typing import AsyncIterator, BinaryIO, Iterator, List, Optional, Tuple, Union
+
+AudioInput = Union[str, os.PathLike, bytes, bytearray, BinaryIO]
 
 class LLMTokenObserver(ABC):
     @abstractmethod
-    def notify(self, event_type: str, content: str, timestamp: datetime):
-        pass
+    def notify(self, event_type: str, content: str, timestamp: datetime, **details):
+        """
+        ``details`` may hold ``usage`` (the provider's prompt/completion token
+        counts) and ``messages`` (the prompt, for estimating when usage is missing).
+        """
 
 
 class BaseLLMClass(ABC):
+    # Cap on chunks worth transcribing at once, for providers bound by local
+    # compute rather than by the network; None leaves it to the caller.
+    max_concurrency: Optional[int] = None
+    # Longest audio one transcription request may carry; None means no limit
+    # beyond the upload size.
+    max_audio_seconds: Optional[float] = None
+    # Upload format the client reads without re-encoding (e.g. "wav"); it
+    # overrides the caller's choice. None takes whatever the caller sends.
+    preferred_upload_format: Optional[str] = None
+
     def __init__(self):
         self._observers = []
 
     def attach_observer(self, observer: LLMTokenObserver):
         self._observers.append(observer)
 
-    def notify_observers(self, event_type: str, content: str):
+    def notify_observers(self, event_type: str, content: str, **details):
+        timestamp = datetime.now()
         for observer in self._observers:
-            observer.notify(event_type, content, datetime.now())
+            observer.notify(event_type, content, timestamp, **details)
+
+    @staticmethod
+    def usage_of(response) -> Optional[dict]:
+        """Token usage reported with a response or final stream chunk, if any."""
+        usage = getattr(response, "usage", None)
+        if usage is None:
+            # Groq reports streaming usage on the last chunk under ``x_groq``.
+            usage = getattr(getattr(response, "x_groq", None), "usage", None)
+        if usage is None:
+            return None
+        return {
+            "prompt_tokens": getattr(usage, "prompt_tokens", 0) or 0,
+            "completion_tokens": getattr(usage, "completion_tokens", 0) or 0,
+        }
 
     @abstractmethod
-    def generate_response(self, model_name, system_prompt, user_prompt):
+    def generate_response(self, model_name, system_prompt, user_prompt, context: Optional[str] = None):
         raise NotImplementedError("This method should be overridden by subclasses.")
 
-    def transcribe_audio_file(self, file_path: str, model_name: str) -> str:
+    @staticmethod
+    def build_messages(system_prompt, user_prompt, context: Optional[str] = None) -> List[dict]:
+        """
+        Chat messages for one call. ``context`` (e.g. a transcript shared by several
+        tasks) goes first, so calls that share it share a prompt prefix the provider can cache.
+        """
+        messages = [{"role": "system", "content": context}] if context else []
+        messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": user_prompt})
+        return messages
+
+    def transcribe_audio_file(self, audio: AudioInput, model_name: str) -> str:
         raise NotImplementedError("Audio transcription not supported by this LLM.")
+
+    def generate_response_stream(self, model_name, system_prompt, user_prompt,
+                                 context: Optional[str] = None) -> Iterator[str]:
+        """
+        Yield the completion in pieces as they arrive. Providers without streaming
+        yield the whole response at once. Observers get the output once, in full.
+        """
+        response = self.generate_response(model_name, system_prompt, user_prompt, context)
+        if response:
+            yield response
+
+    async def generate_response_async(self, model_name, system_prompt, user_prompt, context: Optional[str] = None):
+        """Async variant; providers without an async SDK run the blocking call in an executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self.generate_response, model_name, system_prompt, user_prompt, context
+        )
+
+    async def generate_response_stream_async(self, model_name, system_prompt, user_prompt,
+                                             context: Optional[str] = None) -> AsyncIterator[str]:
+        response = await self.generate_response_async(model_name, system_prompt, user_prompt, context)
+        if response:
+            yield response
+
+    async def transcribe_audio_file_async(self, audio: AudioInput, model_name: str) -> str:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.transcribe_audio_file, audio, model_name)
+
+    @staticmethod
+    def prepare_audio_upload(audio: AudioInput, default_name: str = "audio.wav") -> Tuple[str, bytes]:
+        """
+        Normalize a file path, raw bytes or a file-like buffer into the
+        ``(filename, content)`` tuple accepted by the provider SDKs.
+        """
+        if isinstance(audio, (bytes, bytearray)):
+            return default_name, bytes(audio)
+        if isinstance(audio, (str, os.PathLike)):
+            with open(audio, "rb") as f:
+                return os.path.basename(os.fspath(audio)), f.read()
+
+        name = os.path.basename(str(getattr(audio, "name", "") or default_name))
+        if hasattr(audio, "getvalue"):
+            return name, audio.getvalue()
+        return name, audio.read()
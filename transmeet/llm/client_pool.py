@@ -0,0 +1,164 @@
+import asyncio
+import atexit
+import functools
+import hashlib
+import os
+import weakref
+from contextlib import asynccontextmanager
+from threading import Lock
+from typing import Callable, Dict, Optional, Tuple
+
+import httpx
+
+DEFAULT_MAX_CONNECTIONS = 32
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_TIMEOUT = 120.0
+
+_settings = {
+    "max_connections": DEFAULT_MAX_CONNECTIONS,
+    "max_keepalive_connections": DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    "timeout": DEFAULT_TIMEOUT,
+}
+_clients: Dict[Tuple[str, str, Optional[str]], object] = {}
+_pool_lock = Lock()
+# Async clients hold connections bound to one event loop, so they are pooled per loop.
+_async_clients = weakref.WeakKeyDictionary()
+_async_scopes = weakref.WeakKeyDictionary()  # loop -> open async_client_scope() count
+
+
+def configure_client_pool(max_connections: Optional[int] = None,
+                          max_keepalive_connections: Optional[int] = None,
+                          timeout: Optional[float] = None):
+    """Set connection limits and timeouts for provider clients created from now on."""
+    with _pool_lock:
+        if max_connections is not None:
+            _settings["max_connections"] = max_connections
+        if max_keepalive_connections is not None:
+            _settings["max_keepalive_connections"] = max_keepalive_connections
+        if timeout is not None:
+            _settings["timeout"] = timeout
+
+
+def _credential_key(api_key: Optional[str]) -> str:
+    # Only a digest of the key is kept in the pool's index.
+    return hashlib.sha256((api_key or "").encode()).hexdigest()
+
+
+def get_pooled_client(provider: str, factory: Callable, api_key_env: str, base_url: Optional[str] = None):
+    """
+    Return the process-wide SDK client for ``provider`` and the current credential,
+    creating it on first use. ``factory(api_key=..., http_client=..., timeout=...)``
+    builds the SDK client around a shared, keep-alive ``httpx.Client``.
+    SDK clients are thread-safe, so one instance serves every worker thread.
+    """
+    api_key = os.environ.get(api_key_env)
+    key = (provider, _credential_key(api_key), base_url)
+    client = _clients.get(key)
+    if client is not None:
+        return client
+
+    with _pool_lock:
+        client = _clients.get(key)
+        if client is None:
+            http_client = httpx.Client(
+                limits=httpx.Limits(
+                    max_connections=_settings["max_connections"],
+                    max_keepalive_connections=_settings["max_keepalive_connections"],
+                ),
+                timeout=_settings["timeout"],
+            )
+            kwargs = {"api_key": api_key, "http_client": http_client, "timeout": _settings["timeout"]}
+            if base_url:
+                kwargs["base_url"] = base_url
+            client = factory(**kwargs)
+            _clients[key] = client
+        return client
+
+
+def get_pooled_async_client(provider: str, factory: Callable, api_key_env: str, base_url: Optional[str] = None):
+    """
+    Async counterpart of ``get_pooled_client``: one SDK client per provider and
+    credential for each running event loop, around a shared ``httpx.AsyncClient``.
+    """
+    loop = asyncio.get_running_loop()
+    api_key = os.environ.get(api_key_env)
+    key = (provider, _credential_key(api_key), base_url)
+
+    with _pool_lock:
+        clients = _async_clients.setdefault(loop, {})
+        client = clients.get(key)
+        if client is None:
+            http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=_settings["max_connections"],
+                    max_keepalive_connections=_settings["max_keepalive_connections"],
+                ),
+                timeout=_settings["timeout"],
+            )
+            kwargs = {"api_key": api_key, "http_client": http_client, "timeout": _settings["timeout"]}
+            if base_url:
+                kwargs["base_url"] = base_url
+            client = factory(**kwargs)
+            clients[key] = client
+        return client
+
+
+async def close_async_client_pool():
+    """
+    Close the async clients pooled for the running event loop. The package's
+    async entry points do this when they finish; call it yourself after using
+    ``LLMManager``'s async methods directly.
+    """
+    with _pool_lock:
+        clients = list(_async_clients.pop(asyncio.get_running_loop(), {}).values())
+    for client in clients:
+        try:
+            await client.close()
+        except Exception:
+            pass
+
+
+@asynccontextmanager
+async def async_client_scope():
+    """
+    Keep the running loop's pooled async clients open inside the block and close
+    them when the loop's last open scope exits, so concurrent calls on one loop
+    share connections and none outlive it.
+    """
+    loop = asyncio.get_running_loop()
+    with _pool_lock:
+        _async_scopes[loop] = _async_scopes.get(loop, 0) + 1
+    try:
+        yield
+    finally:
+        with _pool_lock:
+            _async_scopes[loop] -= 1
+            last = _async_scopes[loop] == 0
+            if last:
+                del _async_scopes[loop]
+        if last:
+            await close_async_client_pool()
+
+
+def closes_async_clients(func):
+    """Run the coroutine function ``func`` inside ``async_client_scope()``."""
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        async with async_client_scope():
+            return await func(*args, **kwargs)
+    return wrapper
+
+
+def close_client_pool():
+    """Close every pooled client and its connections. Safe to call more than once."""
+    with _pool_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        try:
+            client.close()
+        except Exception:
+            pass
+
+
+atexit.register(close_client_pool)
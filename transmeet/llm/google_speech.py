@@ -0,0 +1,67 @@
+import io
+import os
+import re
+import wave
+
+from transmeet.llm.base_llm import AudioInput, BaseLLMClass
+from transmeet.utils.general_utils import get_logger
+
+logger = get_logger(__name__)
+
+GOOGLE_SPEECH_API_KEY_ENV = "GOOGLE_SPEECH_API_KEY"
+DEFAULT_LANGUAGE = "en-US"
+# The Web Speech API rejects longer requests, so recordings are cut into windows of at most a minute.
+MAX_REQUEST_SECONDS = 60
+
+_LANGUAGE_PATTERN = re.compile(r"^[a-z]{2,3}(-[A-Za-z0-9]+)*$")
+
+
+def _audio_data(content: bytes):
+    """
+    Mono ``speech_recognition.AudioData`` built in memory: mono WAV is read
+    directly, anything else is decoded (and downmixed) with pydub.
+    """
+    import speech_recognition as sr
+
+    if content[:4] == b"RIFF":
+        with wave.open(io.BytesIO(content)) as wav:
+            if wav.getnchannels() == 1:
+                return sr.AudioData(wav.readframes(wav.getnframes()), wav.getframerate(), wav.getsampwidth())
+
+    from pydub import AudioSegment
+    # Naming the format lets pydub read WAV itself instead of probing with ffmpeg.
+    audio_format = "wav" if content[:4] == b"RIFF" else None
+    segment = AudioSegment.from_file(io.BytesIO(content), format=audio_format).set_channels(1)
+    return sr.AudioData(segment.raw_data, segment.frame_rate, segment.sample_width)
+
+
+class GoogleSpeechClient(BaseLLMClass):
+    """
+    Transcription through Google's Web Speech API (``speech_recognition``).
+    The "model" is the recognition language, e.g. "en-US" or "de-DE"; Whisper
+    model names fall back to en-US. Set GOOGLE_SPEECH_API_KEY to use your own key.
+    """
+
+    max_audio_seconds = MAX_REQUEST_SECONDS
+    # recognize_google re-encodes to FLAC itself; mono WAV reaches it without a decode.
+    preferred_upload_format = "wav"
+
+    def generate_response(self, model_name, system_prompt, user_prompt, context=None):
+        raise NotImplementedError("The google provider only transcribes; use groq or openai for LLM tasks.")
+
+    def transcribe_audio_file(self, audio: AudioInput, model_name: str) -> str:
+        import speech_recognition as sr
+
+        _, content = self.prepare_audio_upload(audio)
+        language = model_name if _LANGUAGE_PATTERN.match(model_name or "") else DEFAULT_LANGUAGE
+        try:
+            return sr.Recognizer().recognize_google(
+                _audio_data(content), key=os.environ.get(GOOGLE_SPEECH_API_KEY_ENV), language=language
+            )
+        except sr.UnknownValueError:
+            # Silence or nothing intelligible in this chunk.
+            logger.warning("Google Speech could not understand a chunk; leaving it empty.")
+            return ""
+        except sr.RequestError as e:
+            # Raised for network and quota failures; retried by the chunk scheduler.
+            raise ConnectionError(f"Google Speech request failed: {e}") from e
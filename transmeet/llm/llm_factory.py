@@ -1,13 +1,19 @@
-from transmeet.llm.openai_llm import OpenAIClient
-from transmeet.llm.groq_llm import GroqAIClient
-
 class LLMFactory:
     @staticmethod
     def get_client(provider: str):
+        # Provider SDKs are imported on first use; each is slow to import.
         provider = provider.lower()
         if provider == "openai":
+            from transmeet.llm.openai_llm import OpenAIClient
             return OpenAIClient()
         elif provider == "groq":
+            from transmeet.llm.groq_llm import GroqAIClient
             return GroqAIClient()
+        elif provider == "google":
+            from transmeet.llm.google_speech import GoogleSpeechClient
+            return GoogleSpeechClient()
+        elif provider == "local":
+            from transmeet.llm.local_whisper import LocalWhisperClient
+            return LocalWhisperClient()
         else:
             raise ValueError(f"Unsupported LLM provider: {provider}")
@@ -1,16 +1,216 @@
+import asyncio
+import time
+from threading import Lock
+from typing import AsyncIterator, Iterator, Optional
+
+from transmeet.llm.base_llm import AudioInput
 from transmeet.llm.llm_factory import LLMFactory
+from transmeet.llm.rate_limiter import get_rate_limiter
+from transmeet.llm.response_cache import ResponseCache, get_response_cache, response_cache_key
+from transmeet.llm.retry import RetryPolicy, classify_error
 from transmeet.llm.token_tracker import TokenTracker
+from transmeet.utils.general_utils import get_logger
+from transmeet.utils.tracing import span
+
+logger = get_logger(__name__)
+
+
+def create_llm_manager(provider: str, model_name: str, **options):
+    """
+    ``LLMManager`` for one provider, or a ``RoutingLLMManager`` when ``provider``
+    lists several targets, e.g. "groq,openai:whisper-1" (entries without a model
+    use ``model_name``).
+    """
+    if "," in provider or ":" in provider:
+        from transmeet.llm.router import RoutingLLMManager, parse_targets
+        return RoutingLLMManager(parse_targets(provider, model_name), **options)
+    return LLMManager(provider, model_name, **options)
+
 
 class LLMManager:
-    def __init__(self, provider: str, model_name: str):
+    def __init__(self, provider: str, model_name: str, retry_policy: Optional[RetryPolicy] = None,
+                 response_cache: Optional[ResponseCache] = None):
         self.provider = provider.lower()
         self.model_name = model_name
-        self.token_tracker = TokenTracker(model_name)
+        self.retry_policy = retry_policy or RetryPolicy()
+        # None falls back to the process-wide cache chosen with configure_response_cache().
+        self.response_cache = response_cache
+        self.token_tracker = TokenTracker(model_name, provider=self.provider)
+        self.rate_limiter = get_rate_limiter(self.provider, model_name)
         self.llm_client = LLMFactory.get_client(provider)
         self.llm_client.attach_observer(self.token_tracker)
+        self._context_tokens = (None, 0)
+        self._context_lock = Lock()
+
+    @property
+    def max_concurrency(self) -> Optional[int]:
+        """Cap on requests worth running at once, or None when the network is the only bound."""
+        return self.llm_client.max_concurrency
+
+    @property
+    def max_audio_seconds(self) -> Optional[float]:
+        """Longest audio the provider accepts per transcription request, if it has a limit."""
+        return self.llm_client.max_audio_seconds
+
+    @property
+    def preferred_upload_format(self) -> Optional[str]:
+        """Upload format the provider should get regardless of the caller's, if any."""
+        return self.llm_client.preferred_upload_format
+
+    def _cache_lookup(self, system_prompt, user_prompt, context, use_cache):
+        cache = (self.response_cache or get_response_cache()) if use_cache else None
+        if cache is None:
+            return None, None, None
+        key = response_cache_key(self.provider, self.model_name, system_prompt, user_prompt, context)
+        try:
+            cached = cache.get(key)
+        except Exception as e:
+            logger.warning(f"Response cache read failed: {e}")
+            cached = None
+        self.token_tracker.record_cache_lookup(hit=cached is not None)
+        return cache, key, cached
+
+    def _cache_store(self, cache, key, response):
+        if cache is None or response is None:
+            return
+        try:
+            cache.set(key, response)
+        except Exception as e:
+            logger.warning(f"Response cache write failed: {e}")
+
+    def _prompt_tokens(self, system_prompt, user_prompt, context=None):
+        """Prompt size for the tokens-per-minute budget; 0 when no such budget is set."""
+        if "tokens_per_minute" not in self.rate_limiter.limits:
+            return 0
+        tokens = self.token_tracker.count_tokens(system_prompt) + self.token_tracker.count_tokens(user_prompt)
+        if context:
+            # Tasks sharing one context (a transcript) tokenize it once per manager.
+            with self._context_lock:
+                if self._context_tokens[0] != context:
+                    self._context_tokens = (context, self.token_tracker.count_tokens(context))
+                tokens += self._context_tokens[1]
+        return tokens
+
+    def generate_response(self, system_prompt, user_prompt, use_cache: bool = True, context: Optional[str] = None):
+        """
+        Chat completion, answered from the response cache when the same provider,
+        model and prompts were seen before. Pass ``use_cache=False`` to force a call.
+        ``context`` is sent ahead of the prompts as a prefix shared between calls.
+        """
+        cache, key, cached = self._cache_lookup(system_prompt, user_prompt, context, use_cache)
+        if cached is not None:
+            return cached
+        response = self.retry_policy.call(self._generate_response_once, system_prompt, user_prompt, context)
+        self._cache_store(cache, key, response)
+        return response
+
+    def _span(self, name, **attributes):
+        return span(name, provider=self.provider, model=self.model_name, **attributes)
+
+    def _generate_response_once(self, system_prompt, user_prompt, context=None):
+        with self._span("rate_limit_wait"):
+            self.rate_limiter.acquire(tokens=self._prompt_tokens(system_prompt, user_prompt, context))
+        with self._span("llm_request"):
+            return self.llm_client.generate_response(self.model_name, system_prompt, user_prompt, context)
+
+    async def generate_response_async(self, system_prompt, user_prompt, use_cache: bool = True,
+                                      context: Optional[str] = None):
+        cache, key, cached = self._cache_lookup(system_prompt, user_prompt, context, use_cache)
+        if cached is not None:
+            return cached
+        response = await self.retry_policy.call_async(
+            self._generate_response_once_async, system_prompt, user_prompt, context
+        )
+        self._cache_store(cache, key, response)
+        return response
+
+    async def _generate_response_once_async(self, system_prompt, user_prompt, context=None):
+        with self._span("rate_limit_wait"):
+            await self.rate_limiter.acquire_async(tokens=self._prompt_tokens(system_prompt, user_prompt, context))
+        with self._span("llm_request"):
+            return await self.llm_client.generate_response_async(self.model_name, system_prompt, user_prompt, context)
+
+    def generate_response_stream(self, system_prompt, user_prompt, use_cache: bool = True,
+                                 context: Optional[str] = None) -> Iterator[str]:
+        """
+        Yield the response in pieces as the provider produces them. Failures before
+        the first piece are retried like ``generate_response``; once output has been
+        yielded an error is raised, since the caller already has part of the text.
+        The complete response is cached as usual.
+        """
+        cache, key, cached = self._cache_lookup(system_prompt, user_prompt, context, use_cache)
+        if cached is not None:
+            yield cached
+            return
+
+        attempt = 0
+        while True:
+            attempt += 1
+            pieces = []
+            try:
+                with self._span("rate_limit_wait"):
+                    self.rate_limiter.acquire(tokens=self._prompt_tokens(system_prompt, user_prompt, context))
+                with self._span("llm_request", stream=True):
+                    for piece in self.llm_client.generate_response_stream(
+                            self.model_name, system_prompt, user_prompt, context):
+                        pieces.append(piece)
+                        yield piece
+                break
+            except Exception as e:
+                delay = None if pieces else self.retry_policy.next_delay(e, attempt)
+                if delay is None:
+                    raise
+                logger.warning(f"Attempt {attempt} failed ({classify_error(e)}: {e}); retrying in {delay:.1f}s")
+                time.sleep(delay)
+        self._cache_store(cache, key, "".join(pieces).strip())
+
+    async def generate_response_stream_async(self, system_prompt, user_prompt, use_cache: bool = True,
+                                             context: Optional[str] = None) -> AsyncIterator[str]:
+        """Async counterpart of ``generate_response_stream``."""
+        cache, key, cached = self._cache_lookup(system_prompt, user_prompt, context, use_cache)
+        if cached is not None:
+            yield cached
+            return
+
+        attempt = 0
+        while True:
+            attempt += 1
+            pieces = []
+            try:
+                with self._span("rate_limit_wait"):
+                    await self.rate_limiter.acquire_async(
+                        tokens=self._prompt_tokens(system_prompt, user_prompt, context)
+                    )
+                with self._span("llm_request", stream=True):
+                    async for piece in self.llm_client.generate_response_stream_async(
+                            self.model_name, system_prompt, user_prompt, context):
+                        pieces.append(piece)
+                        yield piece
+                break
+            except Exception as e:
+                delay = None if pieces else self.retry_policy.next_delay(e, attempt)
+                if delay is None:
+                    raise
+                logger.warning(f"Attempt {attempt} failed ({classify_error(e)}: {e}); retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+        self._cache_store(cache, key, "".join(pieces).strip())
 
-    def generate_response(self, system_prompt, user_prompt):
-        return self.llm_client.generate_response(self.model_name, system_prompt, user_prompt)
+    def transcribe_audio(self, audio: AudioInput, audio_seconds: float = 0.0) -> str:
+        """
+        Transcribe a file path, raw bytes or an in-memory buffer. Not retried
+        here; the chunk scheduler requeues failed chunks itself.
+        """
+        with self._span("rate_limit_wait"):
+            self.rate_limiter.acquire(audio_seconds=audio_seconds)
+        with self._span("transcription_request", audio_seconds=audio_seconds):
+            text = self.llm_client.transcribe_audio_file(audio, self.model_name)
+        self.token_tracker.record_transcription(audio_seconds)
+        return text
 
-    def transcribe_audio(self, file_path: str) -> str:
-        return self.llm_client.transcribe_audio_file(file_path, self.model_name)
\ No newline at end of file
+    async def transcribe_audio_async(self, audio: AudioInput, audio_seconds: float = 0.0) -> str:
+        with self._span("rate_limit_wait"):
+            await self.rate_limiter.acquire_async(audio_seconds=audio_seconds)
+        with self._span("transcription_request", audio_seconds=audio_seconds):
+            text = await self.llm_client.transcribe_audio_file_async(audio, self.model_name)
+        self.token_tracker.record_transcription(audio_seconds)
+        return text
@@ -1,46 +1,210 @@
 from transmeet.utils.json_parser import extract_json_from_text
 from transmeet.utils.prompt_loader import load_prompt, format_prompt
-from transmeet.llm.llm_manager import LLMManager
+from transmeet.llm.llm_manager import LLMManager, create_llm_manager
+from transmeet.llm.map_reduce import condense_transcript, condense_transcript_async
 
 
+def build_task_prompts(task_name, transcribed_text, *extra_args):
+    """Load and fill the system/user prompts of a task."""
+    system_prompt = load_prompt(task_name, "system")
+    user_prompt = load_prompt(task_name, "user").replace("{transcribed_text}", transcribed_text)
+    user_prompt = format_prompt(user_prompt, transcribed_text, *extra_args)
+    return system_prompt, user_prompt
 
-def generate_meeting_minutes(llm_client, transcribed_text, model_name, meeting_datetime=None):
-    system_prompt = load_prompt("meeting_minutes", "system")
-    user_prompt = load_prompt("meeting_minutes", "user") #.replace("{transcribed_text}", transcribed_text).replace("{meeting_datetime}", meeting_datetime or "")
-    user_prompt = format_prompt(user_prompt, transcribed_text, meeting_datetime)
 
-    manager = LLMManager(provider=llm_client, model_name=model_name)
-    return manager.generate_response(system_prompt=system_prompt, user_prompt=user_prompt)
+# Artifacts that generate_artifact can produce; each is also a prompt directory.
+ARTIFACT_TASKS = ("meeting_minutes", "mind_map", "podcast_script", "speaker_segmentation")
 
+# Summarizing tasks, whose input can be condensed first when it is too long.
+# Speaker segmentation rewrites the whole transcript, so it is never condensed.
+MAP_REDUCE_TASKS = ("meeting_minutes", "mind_map", "podcast_script")
 
-def segment_conversation_by_speaker(llm_client, transcribed_text, model_name):
-    system_prompt = load_prompt("speaker_segmentation", "system")
-    user_prompt = load_prompt("speaker_segmentation", "user") #replace("{transcribed_text}", transcribed_text)
-    user_prompt = format_prompt(user_prompt, transcribed_text)
+# Sent once, ahead of every artifact's own prompts, so the requests share a cacheable prefix.
+TRANSCRIPT_CONTEXT = "Meeting transcript:\n\n{transcribed_text}"
+TRANSCRIPT_REFERENCE = "(see the meeting transcript above)"
 
-    manager = LLMManager(provider=llm_client, model_name=model_name)
-    return manager.generate_response(system_prompt=system_prompt, user_prompt=user_prompt)
+# Map focus for notes condensed once and shared by several artifacts (see map_reduce.TASK_FOCUS).
+SHARED_CONDENSE_TASK = "artifacts"
 
 
-def create_podcast_dialogue(llm_client, transcribed_text, model_name):
-    system_prompt = load_prompt("podcast_script", "system")
-    user_prompt = load_prompt("podcast_script", "user")
-    user_prompt = format_prompt(user_prompt, transcribed_text)
+def _fit_transcript(manager, task_name, transcribed_text, max_input_tokens):
+    """
+    With ``max_input_tokens``, a longer transcript is condensed section by section
+    (map) so the task prompt itself then runs on the joined notes (reduce).
+    """
+    if not max_input_tokens or task_name not in MAP_REDUCE_TASKS:
+        return transcribed_text
+    return condense_transcript(manager, task_name, transcribed_text, max_tokens=max_input_tokens)
 
-    manager = LLMManager(provider=llm_client, model_name=model_name)
-    return manager.generate_response(system_prompt=system_prompt, user_prompt=user_prompt)
 
+async def _fit_transcript_async(manager, task_name, transcribed_text, max_input_tokens):
+    if not max_input_tokens or task_name not in MAP_REDUCE_TASKS:
+        return transcribed_text
+    return await condense_transcript_async(manager, task_name, transcribed_text, max_tokens=max_input_tokens)
 
-def transform_transcript_to_mind_map(llm_client, transcribed_text, model_name):
-    system_prompt = load_prompt("mind_map", "system")
-    user_prompt = load_prompt("mind_map", "user").replace("{transcribed_text}", transcribed_text)
-    user_prompt = format_prompt(user_prompt, transcribed_text)
 
-    manager = LLMManager(provider=llm_client, model_name=model_name)
-    response = manager.generate_response(system_prompt=system_prompt, user_prompt=user_prompt)
+def _shared_condense_task(artifacts):
+    """Focus for condensing once for ``artifacts``: the task's own if only one summarizes."""
+    summarizing = [task_name for task_name in artifacts if task_name in MAP_REDUCE_TASKS]
+    if not summarizing:
+        return None
+    return summarizing[0] if len(set(summarizing)) == 1 else SHARED_CONDENSE_TASK
 
+
+def fit_transcript_for_artifacts(manager, artifacts, transcribed_text, max_input_tokens):
+    """
+    Like ``_fit_transcript`` but once for all summarizing ``artifacts``: one set of
+    map calls, and one condensed transcript they all send as the shared context.
+    """
+    task_name = _shared_condense_task(artifacts)
+    if not max_input_tokens or task_name is None:
+        return transcribed_text
+    return condense_transcript(manager, task_name, transcribed_text, max_tokens=max_input_tokens)
+
+
+async def fit_transcript_for_artifacts_async(manager, artifacts, transcribed_text, max_input_tokens):
+    task_name = _shared_condense_task(artifacts)
+    if not max_input_tokens or task_name is None:
+        return transcribed_text
+    return await condense_transcript_async(manager, task_name, transcribed_text, max_tokens=max_input_tokens)
+
+
+def parse_mind_map(response):
     if not response:
         raise ValueError("The LLM did not return a valid response.")
 
     response = extract_json_from_text(response)
     return response if response else {}
+
+
+def generate_meeting_minutes(llm_client, transcribed_text, model_name, meeting_datetime=None, use_cache=True,
+                             max_input_tokens=None):
+    manager = create_llm_manager(provider=llm_client, model_name=model_name)
+    transcribed_text = _fit_transcript(manager, "meeting_minutes", transcribed_text, max_input_tokens)
+    system_prompt, user_prompt = build_task_prompts("meeting_minutes", transcribed_text, meeting_datetime)
+    return manager.generate_response(system_prompt=system_prompt, user_prompt=user_prompt, use_cache=use_cache)
+
+
+def generate_meeting_minutes_stream(llm_client, transcribed_text, model_name, meeting_datetime=None,
+                                    use_cache=True, max_input_tokens=None):
+    """Like ``generate_meeting_minutes`` but yields the minutes in pieces as they are generated."""
+    manager = create_llm_manager(provider=llm_client, model_name=model_name)
+    transcribed_text = _fit_transcript(manager, "meeting_minutes", transcribed_text, max_input_tokens)
+    system_prompt, user_prompt = build_task_prompts("meeting_minutes", transcribed_text, meeting_datetime)
+    yield from manager.generate_response_stream(system_prompt, user_prompt, use_cache=use_cache)
+
+
+def segment_conversation_by_speaker(llm_client, transcribed_text, model_name, use_cache=True):
+    system_prompt, user_prompt = build_task_prompts("speaker_segmentation", transcribed_text)
+    manager = create_llm_manager(provider=llm_client, model_name=model_name)
+    return manager.generate_response(system_prompt=system_prompt, user_prompt=user_prompt, use_cache=use_cache)
+
+
+def create_podcast_dialogue(llm_client, transcribed_text, model_name, use_cache=True, max_input_tokens=None):
+    manager = create_llm_manager(provider=llm_client, model_name=model_name)
+    transcribed_text = _fit_transcript(manager, "podcast_script", transcribed_text, max_input_tokens)
+    system_prompt, user_prompt = build_task_prompts("podcast_script", transcribed_text)
+    return manager.generate_response(system_prompt=system_prompt, user_prompt=user_prompt, use_cache=use_cache)
+
+
+def create_podcast_dialogue_stream(llm_client, transcribed_text, model_name, use_cache=True, max_input_tokens=None):
+    manager = create_llm_manager(provider=llm_client, model_name=model_name)
+    transcribed_text = _fit_transcript(manager, "podcast_script", transcribed_text, max_input_tokens)
+    system_prompt, user_prompt = build_task_prompts("podcast_script", transcribed_text)
+    yield from manager.generate_response_stream(system_prompt, user_prompt, use_cache=use_cache)
+
+
+def transform_transcript_to_mind_map(llm_client, transcribed_text, model_name, use_cache=True,
+                                     max_input_tokens=None):
+    manager = create_llm_manager(provider=llm_client, model_name=model_name)
+    transcribed_text = _fit_transcript(manager, "mind_map", transcribed_text, max_input_tokens)
+    system_prompt, user_prompt = build_task_prompts("mind_map", transcribed_text)
+    response = manager.generate_response(system_prompt=system_prompt, user_prompt=user_prompt, use_cache=use_cache)
+    return parse_mind_map(response)
+
+
+async def generate_meeting_minutes_async(llm_client, transcribed_text, model_name, meeting_datetime=None,
+                                         use_cache=True, max_input_tokens=None):
+    manager = create_llm_manager(provider=llm_client, model_name=model_name)
+    transcribed_text = await _fit_transcript_async(manager, "meeting_minutes", transcribed_text, max_input_tokens)
+    system_prompt, user_prompt = build_task_prompts("meeting_minutes", transcribed_text, meeting_datetime)
+    return await manager.generate_response_async(
+        system_prompt=system_prompt, user_prompt=user_prompt, use_cache=use_cache
+    )
+
+
+async def generate_meeting_minutes_stream_async(llm_client, transcribed_text, model_name, meeting_datetime=None,
+                                                use_cache=True, max_input_tokens=None):
+    manager = create_llm_manager(provider=llm_client, model_name=model_name)
+    transcribed_text = await _fit_transcript_async(manager, "meeting_minutes", transcribed_text, max_input_tokens)
+    system_prompt, user_prompt = build_task_prompts("meeting_minutes", transcribed_text, meeting_datetime)
+    async for piece in manager.generate_response_stream_async(system_prompt, user_prompt, use_cache=use_cache):
+        yield piece
+
+
+async def segment_conversation_by_speaker_async(llm_client, transcribed_text, model_name, use_cache=True):
+    system_prompt, user_prompt = build_task_prompts("speaker_segmentation", transcribed_text)
+    manager = create_llm_manager(provider=llm_client, model_name=model_name)
+    return await manager.generate_response_async(
+        system_prompt=system_prompt, user_prompt=user_prompt, use_cache=use_cache
+    )
+
+
+async def create_podcast_dialogue_async(llm_client, transcribed_text, model_name, use_cache=True,
+                                        max_input_tokens=None):
+    manager = create_llm_manager(provider=llm_client, model_name=model_name)
+    transcribed_text = await _fit_transcript_async(manager, "podcast_script", transcribed_text, max_input_tokens)
+    system_prompt, user_prompt = build_task_prompts("podcast_script", transcribed_text)
+    return await manager.generate_response_async(
+        system_prompt=system_prompt, user_prompt=user_prompt, use_cache=use_cache
+    )
+
+
+async def create_podcast_dialogue_stream_async(llm_client, transcribed_text, model_name, use_cache=True,
+                                               max_input_tokens=None):
+    manager = create_llm_manager(provider=llm_client, model_name=model_name)
+    transcribed_text = await _fit_transcript_async(manager, "podcast_script", transcribed_text, max_input_tokens)
+    system_prompt, user_prompt = build_task_prompts("podcast_script", transcribed_text)
+    async for piece in manager.generate_response_stream_async(system_prompt, user_prompt, use_cache=use_cache):
+        yield piece
+
+
+async def transform_transcript_to_mind_map_async(llm_client, transcribed_text, model_name, use_cache=True,
+                                                 max_input_tokens=None):
+    manager = create_llm_manager(provider=llm_client, model_name=model_name)
+    transcribed_text = await _fit_transcript_async(manager, "mind_map", transcribed_text, max_input_tokens)
+    system_prompt, user_prompt = build_task_prompts("mind_map", transcribed_text)
+    response = await manager.generate_response_async(
+        system_prompt=system_prompt, user_prompt=user_prompt, use_cache=use_cache
+    )
+    return parse_mind_map(response)
+
+
+def _artifact_request(task_name, transcribed_text, meeting_datetime=None):
+    if task_name not in ARTIFACT_TASKS:
+        raise ValueError(f"Unknown artifact: {task_name}")
+    extra_args = (meeting_datetime,) if task_name == "meeting_minutes" else ()
+    system_prompt, user_prompt = build_task_prompts(task_name, TRANSCRIPT_REFERENCE, *extra_args)
+    context = TRANSCRIPT_CONTEXT.replace("{transcribed_text}", transcribed_text)
+    return system_prompt, user_prompt, context
+
+
+def generate_artifact(manager: LLMManager, task_name, transcribed_text, meeting_datetime=None, use_cache=True,
+                      max_input_tokens=None):
+    """Run one artifact task on a shared manager, with the transcript sent as a shared prefix."""
+    transcribed_text = _fit_transcript(manager, task_name, transcribed_text, max_input_tokens)
+    system_prompt, user_prompt, context = _artifact_request(task_name, transcribed_text, meeting_datetime)
+    response = manager.generate_response(
+        system_prompt=system_prompt, user_prompt=user_prompt, use_cache=use_cache, context=context
+    )
+    return parse_mind_map(response) if task_name == "mind_map" else response
+
+
+async def generate_artifact_async(manager: LLMManager, task_name, transcribed_text, meeting_datetime=None,
+                                  use_cache=True, max_input_tokens=None):
+    transcribed_text = await _fit_transcript_async(manager, task_name, transcribed_text, max_input_tokens)
+    system_prompt, user_prompt, context = _artifact_request(task_name, transcribed_text, meeting_datetime)
+    response = await manager.generate_response_async(
+        system_prompt=system_prompt, user_prompt=user_prompt, use_cache=use_cache, context=context
+    )
+    return parse_mind_map(response) if task_name == "mind_map" else response
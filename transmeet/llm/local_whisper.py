@@ -0,0 +1,117 @@
+import io
+import os
+from threading import Lock
+from typing import Dict, Optional, Tuple
+
+from transmeet.llm.base_llm import AudioInput, BaseLLMClass
+from transmeet.utils.general_utils import get_logger
+
+logger = get_logger(__name__)
+
+# API model names mapped to their faster-whisper equivalents; anything else
+# (e.g. "small", "distil-large-v3" or a local CTranslate2 directory) is used as is.
+LOCAL_MODEL_ALIASES = {
+    "whisper-large-v3-turbo": "large-v3-turbo",
+    "whisper-large-v3": "large-v3",
+    "whisper-1": "large-v2",
+}
+
+DEFAULT_THREADS_PER_WORKER = 4
+DEFAULT_BATCH_SIZE = 8
+
+_settings = {
+    "device": os.environ.get("TRANSMEET_LOCAL_DEVICE", "cpu"),
+    "compute_type": os.environ.get("TRANSMEET_LOCAL_COMPUTE_TYPE", "int8"),
+    "cpu_threads": int(os.environ.get("TRANSMEET_LOCAL_THREADS", 0)) or None,
+    "num_workers": int(os.environ.get("TRANSMEET_LOCAL_WORKERS", 0)) or None,
+    "batch_size": int(os.environ.get("TRANSMEET_LOCAL_BATCH_SIZE", DEFAULT_BATCH_SIZE)),
+    "download_root": os.environ.get("TRANSMEET_LOCAL_MODEL_DIR"),
+}
+_models: Dict[Tuple, object] = {}
+_models_lock = Lock()
+
+
+def configure_local_transcription(device: Optional[str] = None, compute_type: Optional[str] = None,
+                                  cpu_threads: Optional[int] = None, num_workers: Optional[int] = None,
+                                  batch_size: Optional[int] = None, download_root: Optional[str] = None):
+    """
+    Settings for the "local" provider. Models already loaded keep their settings.
+    Example: configure_local_transcription(compute_type="int8", cpu_threads=4, num_workers=4)
+    """
+    options = dict(device=device, compute_type=compute_type, cpu_threads=cpu_threads,
+                   num_workers=num_workers, batch_size=batch_size, download_root=download_root)
+    with _models_lock:
+        _settings.update({k: v for k, v in options.items() if v is not None})
+
+
+def _worker_layout() -> Tuple[int, int]:
+    """(threads per worker, workers): by default the cores are split into workers of up to 4 threads."""
+    cores = os.cpu_count() or 1
+    threads = _settings["cpu_threads"] or min(DEFAULT_THREADS_PER_WORKER, cores)
+    workers = _settings["num_workers"] or max(1, cores // threads)
+    return threads, workers
+
+
+def _load_model(model_name: str):
+    """The process-wide model (and batched pipeline) for ``model_name``, loaded on first use."""
+    try:
+        from faster_whisper import WhisperModel
+    except ImportError as e:
+        raise ImportError(
+            "The local transcription provider needs faster-whisper: pip install 'transmeet[local]'"
+        ) from e
+
+    threads, workers = _worker_layout()
+    name = LOCAL_MODEL_ALIASES.get(model_name, model_name)
+    key = (name, _settings["device"], _settings["compute_type"], threads, workers)
+    with _models_lock:
+        loaded = _models.get(key)
+        if loaded is None:
+            logger.info(
+                f"Loading local model {name} ({_settings['device']}, {_settings['compute_type']}, "
+                f"{workers} worker(s) x {threads} thread(s))..."
+            )
+            model = WhisperModel(
+                name, device=_settings["device"], compute_type=_settings["compute_type"],
+                cpu_threads=threads, num_workers=workers, download_root=_settings["download_root"],
+            )
+            try:
+                from faster_whisper import BatchedInferencePipeline
+                pipeline = BatchedInferencePipeline(model=model)
+            except ImportError:
+                # faster-whisper < 1.1 has no batched pipeline; chunks are decoded one at a time.
+                pipeline = None
+            loaded = _models[key] = (model, pipeline)
+        return loaded
+
+
+class LocalWhisperClient(BaseLLMClass):
+    """
+    Transcription on this machine with faster-whisper (CTranslate2), no network
+    and no rate limit. One model per process serves every chunk; it runs
+    ``num_workers`` transcriptions side by side and, with the batched pipeline,
+    decodes the speech segments of a chunk in batches of ``batch_size``.
+    """
+
+    @property
+    def max_concurrency(self) -> int:
+        """Chunks worth running at once: more would only queue inside the model."""
+        return _worker_layout()[1]
+
+    def generate_response(self, model_name, system_prompt, user_prompt, context: Optional[str] = None):
+        raise NotImplementedError("The local provider only transcribes; use groq or openai for LLM tasks.")
+
+    def transcribe_audio_file(self, audio: AudioInput, model_name: str) -> str:
+        model, pipeline = _load_model(model_name)
+        if isinstance(audio, (bytes, bytearray)):
+            audio = io.BytesIO(audio)
+        elif isinstance(audio, os.PathLike):
+            audio = os.fspath(audio)
+        elif hasattr(audio, "seek"):
+            audio.seek(0)
+
+        if pipeline is not None:
+            segments, _ = pipeline.transcribe(audio, batch_size=_settings["batch_size"])
+        else:
+            segments, _ = model.transcribe(audio, vad_filter=True)
+        return " ".join(segment.text.strip() for segment in segments).strip()
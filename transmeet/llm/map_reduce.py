@@ -0,0 +1,145 @@
+import asyncio
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from transmeet.llm.llm_manager import LLMManager
+from transmeet.utils.general_utils import get_logger
+from transmeet.utils.tracing import in_current_context, span
+
+logger = get_logger(__name__)
+
+DEFAULT_SECTION_TOKENS = 6000
+DEFAULT_OVERLAP_TOKENS = 200
+DEFAULT_MAP_WORKERS = 8
+MAX_REDUCE_LEVELS = 4
+
+# What each task needs kept from a section, so the reduce step has the material it relies on.
+TASK_FOCUS = {
+    "meeting_minutes": "decisions, action items with owners and deadlines, open questions and key discussion points",
+    "mind_map": "topics, their subtopics and how they relate",
+    "podcast_script": "the storyline, notable quotes, facts, figures and the speakers' viewpoints",
+    # One set of notes shared by several of the tasks above.
+    "artifacts": "decisions, action items with owners and deadlines, open questions, the topics and how they "
+                 "relate, notable quotes, facts, figures and the speakers' viewpoints",
+}
+
+MAP_SYSTEM_PROMPT = (
+    "You condense one section of a long meeting transcript into dense notes. "
+    "Keep {focus}. Keep names, numbers and dates exactly. Do not invent anything. "
+    "Sections overlap slightly; record each point only once."
+)
+MAP_USER_PROMPT = "Section {index} of {total} of the transcript:\n\n{text}"
+SECTION_SEPARATOR = "\n\n"
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+|\n+")
+
+
+def split_text_by_tokens(text: str, encoder, max_tokens: int = DEFAULT_SECTION_TOKENS,
+                         overlap_tokens: int = DEFAULT_OVERLAP_TOKENS) -> List[str]:
+    """
+    Pack sentences into sections of at most ``max_tokens`` tokens. Each section
+    starts with the last ``overlap_tokens`` worth of sentences of the previous one,
+    so a point made across a boundary is seen whole by one section.
+    """
+    # Sections must mostly hold new text, or a long transcript turns into far more calls.
+    overlap_tokens = min(overlap_tokens, max_tokens // 4)
+    sentences = []
+    for sentence in _SENTENCE_END.split(text):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        tokens = encoder.encode(sentence)
+        # A run-on "sentence" longer than a section is cut on token boundaries.
+        for start in range(0, len(tokens), max_tokens):
+            piece = tokens[start:start + max_tokens]
+            sentences.append((encoder.decode(piece) if len(tokens) > max_tokens else sentence, len(piece)))
+
+    sections, current, current_tokens = [], [], 0
+    for sentence, count in sentences:
+        if current and current_tokens + count > max_tokens:
+            sections.append(" ".join(s for s, _ in current))
+            carry, carry_tokens = [], 0
+            for previous in reversed(current):
+                if carry_tokens + previous[1] > overlap_tokens or carry_tokens + previous[1] + count > max_tokens:
+                    break
+                carry.insert(0, previous)
+                carry_tokens += previous[1]
+            current, current_tokens = carry, carry_tokens
+        current.append((sentence, count))
+        current_tokens += count
+    if current:
+        sections.append(" ".join(s for s, _ in current))
+    return sections
+
+
+def _map_prompts(task_name, sections):
+    system_prompt = MAP_SYSTEM_PROMPT.format(focus=TASK_FOCUS.get(task_name, "every important point"))
+    total = len(sections)
+    return system_prompt, [
+        MAP_USER_PROMPT.format(index=i + 1, total=total, text=section) for i, section in enumerate(sections)
+    ]
+
+
+def _join_notes(notes):
+    return SECTION_SEPARATOR.join(f"Notes on section {i + 1}:\n{n or ''}" for i, n in enumerate(notes))
+
+
+def condense_transcript(manager: LLMManager, task_name: str, text: str,
+                        max_tokens: int = DEFAULT_SECTION_TOKENS,
+                        overlap_tokens: int = DEFAULT_OVERLAP_TOKENS,
+                        max_workers: int = DEFAULT_MAP_WORKERS) -> str:
+    """
+    Map step: summarize sections of ``text`` in parallel, repeating on the joined
+    notes until they fit in ``max_tokens`` (or stop shrinking). Text that already
+    fits is returned unchanged.
+    """
+    encoder = manager.token_tracker.encoder
+    for level in range(MAX_REDUCE_LEVELS):
+        token_count = len(encoder.encode(text))
+        if token_count <= max_tokens:
+            break
+        sections = split_text_by_tokens(text, encoder, max_tokens, overlap_tokens)
+        logger.info(f"{task_name}: condensing {token_count} tokens in {len(sections)} sections (level {level + 1}).")
+        system_prompt, user_prompts = _map_prompts(task_name, sections)
+        with span("condense", task=task_name, level=level + 1, sections=len(sections)), \
+                ThreadPoolExecutor(max_workers=min(max_workers, len(sections))) as executor:
+            notes = list(executor.map(
+                in_current_context(lambda user_prompt: manager.generate_response(system_prompt, user_prompt)),
+                user_prompts
+            ))
+        condensed = _join_notes(notes)
+        if len(encoder.encode(condensed)) >= token_count:
+            logger.warning(f"{task_name}: section notes are not getting shorter; using them as they are.")
+            return condensed
+        text = condensed
+    return text
+
+
+async def condense_transcript_async(manager: LLMManager, task_name: str, text: str,
+                                    max_tokens: int = DEFAULT_SECTION_TOKENS,
+                                    overlap_tokens: int = DEFAULT_OVERLAP_TOKENS,
+                                    max_workers: int = DEFAULT_MAP_WORKERS) -> str:
+    """Async counterpart of ``condense_transcript``."""
+    encoder = manager.token_tracker.encoder
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def summarize(system_prompt, user_prompt):
+        async with semaphore:
+            return await manager.generate_response_async(system_prompt, user_prompt)
+
+    for level in range(MAX_REDUCE_LEVELS):
+        token_count = len(encoder.encode(text))
+        if token_count <= max_tokens:
+            break
+        sections = split_text_by_tokens(text, encoder, max_tokens, overlap_tokens)
+        logger.info(f"{task_name}: condensing {token_count} tokens in {len(sections)} sections (level {level + 1}).")
+        system_prompt, user_prompts = _map_prompts(task_name, sections)
+        with span("condense", task=task_name, level=level + 1, sections=len(sections)):
+            notes = await asyncio.gather(*(summarize(system_prompt, p) for p in user_prompts))
+        condensed = _join_notes(notes)
+        if len(encoder.encode(condensed)) >= token_count:
+            logger.warning(f"{task_name}: section notes are not getting shorter; using them as they are.")
+            return condensed
+        text = condensed
+    return text
@@ -1,32 +1,114 @@
-from openai import OpenAI
-from transmeet.llm.base_llm import BaseLLMClass
+import os
+from typing import AsyncIterator, Iterator, Optional
+
+from openai import AsyncOpenAI, OpenAI
+from transmeet.llm.base_llm import AudioInput, BaseLLMClass
+from transmeet.llm.client_pool import get_pooled_async_client, get_pooled_client
 
 class OpenAIClient(BaseLLMClass):
     def get_llm_client(self):
-        return OpenAI()
+        return get_pooled_client("openai", self._create_client, "OPENAI_API_KEY",
+                                 base_url=os.environ.get("OPENAI_BASE_URL"))
+
+    @staticmethod
+    def _create_client(**kwargs):
+        # Retries are handled by transmeet's RetryPolicy and chunk scheduler.
+        return OpenAI(max_retries=0, **kwargs)
+
+    def get_async_llm_client(self):
+        return get_pooled_async_client("openai", self._create_async_client, "OPENAI_API_KEY",
+                                       base_url=os.environ.get("OPENAI_BASE_URL"))
 
-    def generate_response(self, model_name, system_prompt, user_prompt):
-        self.notify_observers("input", user_prompt)
+    @staticmethod
+    def _create_async_client(**kwargs):
+        return AsyncOpenAI(max_retries=0, **kwargs)
+
+    def generate_response(self, model_name, system_prompt, user_prompt, context: Optional[str] = None):
         llm = self.get_llm_client()
+        messages = self.build_messages(system_prompt, user_prompt, context)
 
         response = llm.chat.completions.create(
             model=model_name,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
+            messages=messages,
         )
         content = response.choices[0].message.content
+        self.notify_observers("output", content or "", usage=self.usage_of(response), messages=messages)
         if content is not None:
-            self.notify_observers("output", content)
             return content.strip()
 
-    def transcribe_audio_file(self, file_path: str, model_name: str) -> str:
+    def generate_response_stream(self, model_name, system_prompt, user_prompt,
+                                 context: Optional[str] = None) -> Iterator[str]:
+        messages = self.build_messages(system_prompt, user_prompt, context)
+        stream = self.get_llm_client().chat.completions.create(
+            model=model_name,
+            messages=messages,
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+        pieces = []
+        usage = None
+        try:
+            for chunk in stream:
+                usage = self.usage_of(chunk) or usage
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    pieces.append(delta)
+                    yield delta
+        finally:
+            stream.close()
+            # Count the output once, whole, even if the consumer stopped early.
+            if pieces or usage:
+                self.notify_observers("output", "".join(pieces), usage=usage, messages=messages)
+
+    def transcribe_audio_file(self, audio: AudioInput, model_name: str) -> str:
         client = self.get_llm_client()
-        with open(file_path, "rb") as f:
-            response = client.audio.transcriptions.create(
-                file=(file_path, f.read()),
-                model=model_name,
-            )
-        self.notify_observers("Output", response.text.strip())
+        response = client.audio.transcriptions.create(
+            file=self.prepare_audio_upload(audio),
+            model=model_name,
+        )
+        return response.text.strip()
+
+    async def generate_response_async(self, model_name, system_prompt, user_prompt,
+                                      context: Optional[str] = None):
+        llm = self.get_async_llm_client()
+        messages = self.build_messages(system_prompt, user_prompt, context)
+
+        response = await llm.chat.completions.create(
+            model=model_name,
+            messages=messages,
+        )
+        content = response.choices[0].message.content
+        self.notify_observers("output", content or "", usage=self.usage_of(response), messages=messages)
+        if content is not None:
+            return content.strip()
+
+    async def generate_response_stream_async(self, model_name, system_prompt, user_prompt,
+                                             context: Optional[str] = None) -> AsyncIterator[str]:
+        messages = self.build_messages(system_prompt, user_prompt, context)
+        stream = await self.get_async_llm_client().chat.completions.create(
+            model=model_name,
+            messages=messages,
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+        pieces = []
+        usage = None
+        try:
+            async for chunk in stream:
+                usage = self.usage_of(chunk) or usage
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    pieces.append(delta)
+                    yield delta
+        finally:
+            await stream.close()
+            if pieces or usage:
+                self.notify_observers("output", "".join(pieces), usage=usage, messages=messages)
+
+    async def transcribe_audio_file_async(self, audio: AudioInput, model_name: str) -> str:
+        client = self.get_async_llm_client()
+        response = await client.audio.transcriptions.create(
+            file=self.prepare_audio_upload(audio),
+            model=model_name,
+        )
         return response.text.strip()
\ No newline at end of file
@@ -0,0 +1,215 @@
+import asyncio
+import os
+import sqlite3
+import time
+from threading import Lock
+from typing import Dict, Optional, Tuple
+
+from transmeet.utils.general_utils import get_logger
+
+logger = get_logger(__name__)
+
+RATE_LIMIT_DB_ENV = "TRANSMEET_RATE_LIMIT_DB"
+
+# Budgets per provider; any limit left out is not enforced.
+DEFAULT_RATE_LIMITS = {
+    "groq": {"requests_per_minute": 20},
+    "openai": {"requests_per_minute": 50},
+    # The key speech_recognition ships with is meant for light use.
+    "google": {"requests_per_minute": 30},
+    # Local transcription is bounded by the model's workers, not by a quota.
+    "local": {},
+}
+
+# limit name -> seconds over which the budget refills
+LIMIT_PERIODS = {
+    "requests_per_minute": 60,
+    "tokens_per_minute": 60,
+    "audio_seconds_per_hour": 3600,
+}
+
+
+class TokenBucket:
+    """
+    A token bucket that hands out reservations instead of blocking.
+
+    ``reserve`` always succeeds and may drive the balance negative; the caller
+    is told how long to wait for its share to refill. Waiting therefore never
+    happens while a lock is held.
+    """
+
+    def __init__(self, capacity: float, period: float):
+        self.capacity = float(capacity)
+        self.rate = self.capacity / period
+        self.tokens = self.capacity
+        self.updated = time.time()
+
+    def refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, amount: float, now: float) -> float:
+        self.refill(now)
+        self.tokens -= amount
+        return max(0.0, -self.tokens / self.rate)
+
+    def wait_for(self, amount: float, now: float) -> float:
+        """What ``reserve`` would return, without claiming anything."""
+        tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate) - amount
+        return max(0.0, -tokens / self.rate)
+
+
+class SQLiteBucketStore:
+    """
+    Keeps bucket balances in a SQLite file so several processes on one host
+    draw from the same budget. Each reservation runs in one ``BEGIN IMMEDIATE``
+    transaction, which serializes writers across processes.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS buckets (key TEXT PRIMARY KEY, tokens REAL, updated REAL)"
+            )
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30, isolation_level=None)
+
+    def reserve(self, buckets: Dict[str, TokenBucket], amounts: Dict[str, float]) -> float:
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            now = time.time()
+            wait = 0.0
+            for key, amount in amounts.items():
+                bucket = buckets[key]
+                row = conn.execute("SELECT tokens, updated FROM buckets WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    bucket.tokens, bucket.updated = row
+                else:
+                    bucket.tokens, bucket.updated = bucket.capacity, now
+                wait = max(wait, bucket.reserve(amount, now))
+                conn.execute(
+                    "INSERT OR REPLACE INTO buckets (key, tokens, updated) VALUES (?, ?, ?)",
+                    (key, bucket.tokens, bucket.updated),
+                )
+            conn.execute("COMMIT")
+            return wait
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+
+class RateLimiter:
+    """Request, token and audio-second budgets for one provider/model pair."""
+
+    def __init__(self, provider: str, model_name: str, state_path: Optional[str] = None, **limits):
+        self.provider = provider
+        self.model_name = model_name
+        self.limits = {name: value for name, value in limits.items() if value}
+        unknown = set(self.limits) - set(LIMIT_PERIODS)
+        if unknown:
+            raise ValueError(f"Unknown rate limits: {', '.join(sorted(unknown))}")
+
+        self._buckets = {
+            self._key(name): TokenBucket(value, LIMIT_PERIODS[name])
+            for name, value in self.limits.items()
+        }
+        self._store = SQLiteBucketStore(state_path) if state_path and self._buckets else None
+        self._lock = Lock()
+
+    def _key(self, limit_name: str) -> str:
+        return f"{self.provider}:{self.model_name}:{limit_name}"
+
+    def _amounts(self, requests, tokens, audio_seconds) -> Dict[str, float]:
+        usage = {
+            "requests_per_minute": requests,
+            "tokens_per_minute": tokens,
+            "audio_seconds_per_hour": audio_seconds,
+        }
+        return {self._key(name): usage[name] for name in self.limits if usage[name]}
+
+    def reserve(self, requests: int = 1, tokens: int = 0, audio_seconds: float = 0.0) -> float:
+        """Claim budget for one call and return how many seconds to wait before making it."""
+        amounts = self._amounts(requests, tokens, audio_seconds)
+        if not amounts:
+            return 0.0
+
+        with self._lock:
+            if self._store is not None:
+                return self._store.reserve(self._buckets, amounts)
+            now = time.time()
+            return max(self._buckets[key].reserve(amount, now) for key, amount in amounts.items())
+
+    def headroom_wait(self, requests: int = 1, tokens: int = 0, audio_seconds: float = 0.0) -> float:
+        """
+        Seconds a call of this size would wait if made now; nothing is reserved.
+        With a shared SQLite store this reads this process's last view of the
+        balances, which is close enough for choosing between providers.
+        """
+        amounts = self._amounts(requests, tokens, audio_seconds)
+        if not amounts:
+            return 0.0
+        with self._lock:
+            now = time.time()
+            return max(self._buckets[key].wait_for(amount, now) for key, amount in amounts.items())
+
+    def acquire(self, requests: int = 1, tokens: int = 0, audio_seconds: float = 0.0) -> float:
+        """Reserve budget and sleep, outside any lock, until it is available."""
+        wait = self.reserve(requests, tokens, audio_seconds)
+        if wait > 0:
+            logger.info(f"[RateLimit] {self.provider}/{self.model_name}: waiting {wait:.2f}s")
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, requests: int = 1, tokens: int = 0, audio_seconds: float = 0.0) -> float:
+        """Like ``acquire`` but yields to the event loop while waiting."""
+        wait = self.reserve(requests, tokens, audio_seconds)
+        if wait > 0:
+            logger.info(f"[RateLimit] {self.provider}/{self.model_name}: waiting {wait:.2f}s")
+            await asyncio.sleep(wait)
+        return wait
+
+
+_overrides: Dict[Tuple[str, Optional[str]], dict] = {}
+_limiters: Dict[Tuple[str, str], RateLimiter] = {}
+_registry_lock = Lock()
+_state_path: Optional[str] = None
+
+
+def configure_rate_limit(provider: str, model_name: Optional[str] = None, **limits):
+    """
+    Override the budgets for a provider, or for one of its models.
+    Example: configure_rate_limit("groq", requests_per_minute=30, audio_seconds_per_hour=7200)
+    """
+    with _registry_lock:
+        _overrides[(provider.lower(), model_name)] = limits
+        for key in [key for key in _limiters if key[0] == provider.lower()]:
+            del _limiters[key]
+
+
+def set_rate_limit_state_path(path: Optional[str]):
+    """Share rate-limit state through a SQLite file, e.g. across concurrent CLI runs."""
+    global _state_path
+    with _registry_lock:
+        _state_path = path
+        _limiters.clear()
+
+
+def get_rate_limiter(provider: str, model_name: str) -> RateLimiter:
+    """Return the process-wide limiter for a provider/model pair."""
+    provider = provider.lower()
+    key = (provider, model_name)
+    with _registry_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limits = dict(DEFAULT_RATE_LIMITS.get(provider, {}))
+            limits.update(_overrides.get((provider, None), {}))
+            limits.update(_overrides.get((provider, model_name), {}))
+            state_path = _state_path or os.environ.get(RATE_LIMIT_DB_ENV)
+            limiter = RateLimiter(provider, model_name, state_path=state_path, **limits)
+            _limiters[key] = limiter
+        return limiter
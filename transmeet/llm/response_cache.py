@@ -0,0 +1,118 @@
+import hashlib
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional
+
+from transmeet.utils.general_utils import get_logger
+from transmeet.utils.sqlite_cache import SQLiteCache, default_cache_dir
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_TTL_SECONDS = 24 * 3600
+
+
+def response_cache_key(provider: str, model_name: str, system_prompt: str, user_prompt: str,
+                       context: Optional[str] = None) -> str:
+    def digest(text):
+        return hashlib.sha256((text or "").encode("utf-8")).hexdigest()
+    key = f"{provider}:{model_name}:{digest(system_prompt)}:{digest(user_prompt)}"
+    return f"{key}:{digest(context)}" if context else key
+
+
+class ResponseCache(ABC):
+    """Interface for chat-response caches used by ``LLMManager``."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """The cached response for ``key``, or None on a miss."""
+
+    @abstractmethod
+    def set(self, key: str, value: str):
+        """Store ``value`` under ``key``."""
+
+    @abstractmethod
+    def clear(self):
+        """Drop every entry."""
+
+
+class MemoryResponseCache(ResponseCache):
+    """In-process LRU cache whose entries expire after ``ttl_s`` seconds."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl_s: Optional[float] = DEFAULT_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_s = ttl_s
+        self._entries = OrderedDict()  # key -> (stored_at, value)
+        self._lock = Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if self.ttl_s is not None and time.monotonic() - entry[0] > self.ttl_s:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, value: str):
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteResponseCache(ResponseCache):
+    """Persistent cache shared across runs and processes, with TTL and a size budget."""
+
+    def __init__(self, path=None, ttl_s: Optional[float] = DEFAULT_TTL_SECONDS, max_mb: Optional[float] = 64):
+        self.store = SQLiteCache(
+            path or default_cache_dir() / "responses.sqlite3",
+            max_bytes=int(max_mb * 1024 * 1024) if max_mb else None,
+            max_age_s=ttl_s,
+        )
+
+    def get(self, key: str) -> Optional[str]:
+        return self.store.get(key)
+
+    def set(self, key: str, value: str):
+        self.store.set(key, value)
+
+    def clear(self):
+        self.store.clear()
+
+
+_cache: Optional[ResponseCache] = MemoryResponseCache()
+_cache_lock = Lock()
+
+
+def configure_response_cache(backend: Optional[str] = "memory", **options):
+    """
+    Choose the process-wide response cache: "memory", "sqlite" or None to disable.
+    Example: configure_response_cache("sqlite", ttl_s=7 * 24 * 3600)
+    """
+    global _cache
+    backends = {"memory": MemoryResponseCache, "sqlite": SQLiteResponseCache}
+    if backend is not None and backend not in backends:
+        raise ValueError(f"Unknown response cache backend: {backend}")
+    with _cache_lock:
+        _cache = backends[backend](**options) if backend else None
+
+
+def set_response_cache(cache: Optional[ResponseCache]):
+    """Install a custom ``ResponseCache`` implementation as the process-wide cache."""
+    global _cache
+    with _cache_lock:
+        _cache = cache
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    return _cache
@@ -0,0 +1,127 @@
+import asyncio
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from transmeet.utils.general_utils import get_logger
+
+logger = get_logger(__name__)
+
+RATE_LIMITED = "rate_limit"
+TRANSIENT = "transient"
+FATAL = "fatal"
+
+TRANSIENT_STATUS_CODES = {408, 409, 500, 502, 503, 504}
+
+
+def _status_code(exc: BaseException) -> Optional[int]:
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def classify_error(exc: BaseException) -> str:
+    """
+    Sort a provider error into rate-limit, transient or fatal. Works on the
+    groq and openai SDK exceptions without importing either SDK.
+    """
+    status = _status_code(exc)
+    if status == 429:
+        return RATE_LIMITED
+    if status is not None:
+        return TRANSIENT if status in TRANSIENT_STATUS_CODES or status >= 500 else FATAL
+
+    name = type(exc).__name__
+    if isinstance(exc, (ConnectionError, TimeoutError)) or "Timeout" in name or "Connection" in name:
+        return TRANSIENT
+    return FATAL
+
+
+def retry_after_seconds(exc: BaseException) -> Optional[float]:
+    """Delay requested by the provider through ``Retry-After``/``retry-after-ms``, if any."""
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+
+    value = headers.get("retry-after-ms")
+    if value:
+        try:
+            return float(value) / 1000
+        except ValueError:
+            pass
+
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+
+class RetryPolicy:
+    """Jittered exponential backoff that honours provider ``Retry-After`` hints."""
+
+    def __init__(self, max_attempts: int = 5, base_delay: float = 1.0, max_delay: float = 60.0,
+                 rate_limit_base_delay: float = 5.0):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.rate_limit_base_delay = rate_limit_base_delay
+
+    def next_delay(self, exc: BaseException, attempt: int) -> Optional[float]:
+        """
+        Seconds to wait before retrying after ``attempt`` failed attempts,
+        or None when the error is fatal or the attempts are used up.
+        """
+        kind = classify_error(exc)
+        if kind == FATAL or attempt >= self.max_attempts:
+            return None
+
+        retry_after = retry_after_seconds(exc)
+        if retry_after is not None:
+            # A little jitter so callers told the same instant don't all retry at once.
+            return min(self.max_delay, retry_after) + random.uniform(0, 0.5)
+
+        base = self.rate_limit_base_delay if kind == RATE_LIMITED else self.base_delay
+        return random.uniform(0, min(self.max_delay, base * 2 ** (attempt - 1)))
+
+    def call(self, func, *args, **kwargs):
+        """Run ``func`` in the calling thread, sleeping and retrying on retryable errors."""
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                delay = self.next_delay(e, attempt)
+                if delay is None:
+                    raise
+                logger.warning(
+                    f"Attempt {attempt} failed ({classify_error(e)}: {e}); retrying in {delay:.1f}s"
+                )
+                time.sleep(delay)
+
+    async def call_async(self, func, *args, **kwargs):
+        """Await ``func`` with the same retry rules as ``call``."""
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                delay = self.next_delay(e, attempt)
+                if delay is None:
+                    raise
+                logger.warning(
+                    f"Attempt {attempt} failed ({classify_error(e)}: {e}); retrying in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+
+
+NO_RETRY = RetryPolicy(max_attempts=1)
@@ -0,0 +1,285 @@
+import asyncio
+import time
+from threading import Lock
+from typing import AsyncIterator, Iterator, List, Optional, Sequence, Tuple
+
+from transmeet.llm.base_llm import AudioInput
+from transmeet.llm.llm_manager import LLMManager
+from transmeet.llm.response_cache import ResponseCache
+from transmeet.llm.retry import FATAL, NO_RETRY, RATE_LIMITED, RetryPolicy, classify_error, retry_after_seconds
+from transmeet.utils.general_utils import get_logger
+
+logger = get_logger(__name__)
+
+# Weight of the newest sample in a target's moving-average latency.
+LATENCY_SMOOTHING = 0.3
+
+
+def parse_targets(spec: str, default_model: str) -> List[Tuple[str, str]]:
+    """
+    "groq,openai:whisper-1" -> [("groq", default_model), ("openai", "whisper-1")].
+    Only the first ":" separates provider from model, so model names may contain one.
+    """
+    targets = []
+    for entry in spec.split(","):
+        provider, _, model = entry.strip().partition(":")
+        if provider:
+            targets.append((provider.lower(), model or default_model))
+    if not targets:
+        raise ValueError(f"No providers in routing spec: {spec!r}")
+    return targets
+
+
+class RouteTarget:
+    """One provider/model behind a router, with its recent health."""
+
+    def __init__(self, manager: LLMManager):
+        self.manager = manager
+        self.latency: Optional[float] = None  # moving average, seconds
+        self.failures = 0  # consecutive
+        self.cooldown_until = 0.0  # time.monotonic()
+        self.in_flight = 0
+
+    @property
+    def name(self) -> str:
+        return f"{self.manager.provider}/{self.manager.model_name}"
+
+    def score(self, audio_seconds: float = 0.0) -> float:
+        """
+        Expected seconds until an answer: rate-limit wait plus recent latency.
+        Calls still in flight count against the headroom, so a burst of choices
+        made before any of them reserves budget does not all land on one target.
+        """
+        calls = self.in_flight + 1
+        wait = self.manager.rate_limiter.headroom_wait(requests=calls, audio_seconds=calls * audio_seconds)
+        return wait + (self.latency or 0.0)
+
+
+class RoutingLLMManager:
+    """
+    Spreads requests over an ordered list of (provider, model) targets.
+
+    Each call goes to the target that would answer soonest: the one with
+    rate-limit headroom and the lowest recent latency, earlier targets winning
+    ties (untried targets count as instant, so each gets sampled). A target that
+    returns a 429 or 5xx is avoided for its ``Retry-After`` or a growing backoff
+    while the call moves on to the next one. Decisions are recorded in each
+    target's ``TokenTracker`` and so show up in ``get_usage_stats()``.
+
+    Offers the same calls as ``LLMManager``, so it can stand in for one anywhere.
+    """
+
+    def __init__(self, targets: Sequence[Tuple[str, str]], retry_policy: Optional[RetryPolicy] = None,
+                 response_cache: Optional[ResponseCache] = None):
+        if not targets:
+            raise ValueError("RoutingLLMManager needs at least one target.")
+        self.retry_policy = retry_policy or RetryPolicy()
+        # Targets make one attempt each; retries and failover happen here.
+        self.targets = [
+            RouteTarget(LLMManager(provider, model_name, retry_policy=NO_RETRY, response_cache=response_cache))
+            for provider, model_name in targets
+        ]
+        self.provider = "router"
+        self.model_name = ",".join(f"{t.manager.provider}:{t.manager.model_name}" for t in self.targets)
+        self._lock = Lock()
+
+    @property
+    def token_tracker(self):
+        """The first target's tracker, for token counting (e.g. by map-reduce)."""
+        return self.targets[0].manager.token_tracker
+
+    @property
+    def max_concurrency(self) -> Optional[int]:
+        caps = [t.manager.max_concurrency for t in self.targets]
+        return None if None in caps else sum(caps)
+
+    @property
+    def max_audio_seconds(self) -> Optional[float]:
+        """The strictest target's limit, so every chunk fits whichever target gets it."""
+        limits = [t.manager.max_audio_seconds for t in self.targets if t.manager.max_audio_seconds]
+        return min(limits) if limits else None
+
+    @property
+    def preferred_upload_format(self) -> Optional[str]:
+        """Chunks are encoded before a target is chosen, so only a format every target prefers applies."""
+        formats = {t.manager.preferred_upload_format for t in self.targets}
+        return formats.pop() if len(formats) == 1 else None
+
+    def routing_stats(self) -> dict:
+        """Current view of each target: recent latency, failures and remaining cooldown."""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                t.name: {
+                    "latency_s": t.latency,
+                    "consecutive_failures": t.failures,
+                    "cooldown_s": max(0.0, t.cooldown_until - now),
+                    **t.manager.token_tracker.usage_stats(),
+                }
+                for t in self.targets
+            }
+
+    def _choose(self, audio_seconds: float = 0.0) -> Tuple[RouteTarget, float]:
+        """The target for the next attempt and how long to wait before using it."""
+        now = time.monotonic()
+        with self._lock:
+            healthy = [t for t in self.targets if t.cooldown_until <= now]
+            if not healthy:
+                target = min(self.targets, key=lambda t: t.cooldown_until)
+                reason, wait = "cooldown", target.cooldown_until - now
+            else:
+                _, _, target = min((t.score(audio_seconds), i, t) for i, t in enumerate(healthy))
+                if target is self.targets[0]:
+                    reason = "preferred"
+                elif self.targets[0] not in healthy:
+                    reason = "failover"
+                else:
+                    reason = "headroom"
+                wait = 0.0
+            target.in_flight += 1
+        target.manager.token_tracker.record_route(reason)
+        logger.debug(f"[Router] {target.name} ({reason})")
+        return target, wait
+
+    def _finished(self, target: RouteTarget):
+        with self._lock:
+            target.in_flight -= 1
+
+    def _succeeded(self, target: RouteTarget, elapsed: float):
+        with self._lock:
+            target.failures = 0
+            if target.latency is None:
+                target.latency = elapsed
+            else:
+                target.latency += LATENCY_SMOOTHING * (elapsed - target.latency)
+
+    def _failed(self, target: RouteTarget, error: Exception, attempt: int, max_attempts: int) -> bool:
+        """Put a failing target on cooldown; True when the call should try again."""
+        kind = classify_error(error)
+        if kind == FATAL:
+            return False
+        with self._lock:
+            target.failures += 1
+            cooldown = retry_after_seconds(error)
+            if cooldown is None:
+                policy = self.retry_policy
+                base = policy.rate_limit_base_delay if kind == RATE_LIMITED else policy.base_delay
+                cooldown = min(policy.max_delay, base * 2 ** (target.failures - 1))
+            target.cooldown_until = max(target.cooldown_until, time.monotonic() + cooldown)
+        target.manager.token_tracker.record_failover(kind, cooldown)
+        return attempt < max_attempts
+
+    def _route(self, call, max_attempts: int, audio_seconds: float = 0.0):
+        attempt = 0
+        while True:
+            attempt += 1
+            target, wait = self._choose(audio_seconds)
+            if wait > 0:
+                time.sleep(wait)
+            started = time.monotonic()
+            try:
+                result = call(target.manager)
+            except Exception as e:
+                if not self._failed(target, e, attempt, max_attempts):
+                    raise
+                continue
+            finally:
+                self._finished(target)
+            self._succeeded(target, time.monotonic() - started)
+            return result
+
+    async def _route_async(self, call, max_attempts: int, audio_seconds: float = 0.0):
+        attempt = 0
+        while True:
+            attempt += 1
+            target, wait = self._choose(audio_seconds)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            started = time.monotonic()
+            try:
+                result = await call(target.manager)
+            except Exception as e:
+                if not self._failed(target, e, attempt, max_attempts):
+                    raise
+                continue
+            finally:
+                self._finished(target)
+            self._succeeded(target, time.monotonic() - started)
+            return result
+
+    def generate_response(self, system_prompt, user_prompt, use_cache: bool = True, context: Optional[str] = None):
+        return self._route(
+            lambda manager: manager.generate_response(system_prompt, user_prompt, use_cache, context),
+            self.retry_policy.max_attempts,
+        )
+
+    async def generate_response_async(self, system_prompt, user_prompt, use_cache: bool = True,
+                                      context: Optional[str] = None):
+        return await self._route_async(
+            lambda manager: manager.generate_response_async(system_prompt, user_prompt, use_cache, context),
+            self.retry_policy.max_attempts,
+        )
+
+    def generate_response_stream(self, system_prompt, user_prompt, use_cache: bool = True,
+                                 context: Optional[str] = None) -> Iterator[str]:
+        """Fails over like ``generate_response`` until the first piece has been yielded."""
+        attempt = 0
+        while True:
+            attempt += 1
+            target, wait = self._choose()
+            if wait > 0:
+                time.sleep(wait)
+            started = time.monotonic()
+            yielded = False
+            try:
+                for piece in target.manager.generate_response_stream(system_prompt, user_prompt, use_cache, context):
+                    yielded = True
+                    yield piece
+            except Exception as e:
+                if not self._failed(target, e, attempt, self.retry_policy.max_attempts) or yielded:
+                    raise
+                continue
+            finally:
+                self._finished(target)
+            self._succeeded(target, time.monotonic() - started)
+            return
+
+    async def generate_response_stream_async(self, system_prompt, user_prompt, use_cache: bool = True,
+                                             context: Optional[str] = None) -> AsyncIterator[str]:
+        attempt = 0
+        while True:
+            attempt += 1
+            target, wait = self._choose()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            started = time.monotonic()
+            yielded = False
+            try:
+                async for piece in target.manager.generate_response_stream_async(
+                        system_prompt, user_prompt, use_cache, context):
+                    yielded = True
+                    yield piece
+            except Exception as e:
+                if not self._failed(target, e, attempt, self.retry_policy.max_attempts) or yielded:
+                    raise
+                continue
+            finally:
+                self._finished(target)
+            self._succeeded(target, time.monotonic() - started)
+            return
+
+    def transcribe_audio(self, audio: AudioInput, audio_seconds: float = 0.0) -> str:
+        """
+        Each target is tried at most once; if all fail the error goes back to the
+        chunk scheduler, which backs off and requeues the chunk as usual.
+        """
+        return self._route(
+            lambda manager: manager.transcribe_audio(audio, audio_seconds=audio_seconds),
+            len(self.targets), audio_seconds=audio_seconds,
+        )
+
+    async def transcribe_audio_async(self, audio: AudioInput, audio_seconds: float = 0.0) -> str:
+        return await self._route_async(
+            lambda manager: manager.transcribe_audio_async(audio, audio_seconds=audio_seconds),
+            len(self.targets), audio_seconds=audio_seconds,
+        )
@@ -1,30 +1,202 @@
-import tiktoken
-from transmeet.llm.base_llm import LLMTokenObserver
+from collections import deque
+from dataclasses import asdict, dataclass
 from datetime import datetime
+from functools import lru_cache
+from threading import Lock
+from typing import Dict, Optional, Tuple
+
+from transmeet.llm.base_llm import LLMTokenObserver
+from transmeet.utils.general_utils import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_LOG_SIZE = 256
+
+# USD per million prompt/completion tokens and per hour of audio. Override or
+# extend with set_model_pricing(); models missing here are reported at 0, as is
+# everything run by the providers in FREE_PROVIDERS.
+MODEL_PRICING = {
+    "llama-3.3-70b-versatile": {"input": 0.59, "output": 0.79},
+    "llama-3.1-8b-instant": {"input": 0.05, "output": 0.08},
+    "gpt-4o": {"input": 2.50, "output": 10.00},
+    "gpt-4o-mini": {"input": 0.15, "output": 0.60},
+    "gpt-4.1": {"input": 2.00, "output": 8.00},
+    "gpt-4.1-mini": {"input": 0.40, "output": 1.60},
+    "whisper-large-v3-turbo": {"audio_hour": 0.04},
+    "whisper-large-v3": {"audio_hour": 0.111},
+    "whisper-1": {"audio_hour": 0.36},
+}
+FREE_PROVIDERS = {"local"}
+
+
+def set_model_pricing(model_name: str, input_per_million: float = 0.0, output_per_million: float = 0.0,
+                      audio_per_hour: float = 0.0):
+    MODEL_PRICING[model_name] = {
+        "input": input_per_million, "output": output_per_million, "audio_hour": audio_per_hour,
+    }
+
+
+@lru_cache(maxsize=None)
+def get_encoder(model_name: str):
+    """tiktoken encoding for ``model_name``, loaded once per process on first use."""
+    import tiktoken
+
+    try:
+        return tiktoken.encoding_for_model(model_name)
+    except KeyError:
+        logger.debug(f"No tiktoken encoding for '{model_name}'; using 'cl100k_base'.")
+        return tiktoken.get_encoding("cl100k_base")
+
+
+@dataclass
+class UsageTotals:
+    requests: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    # Token counts estimated locally because the provider did not report usage.
+    estimated_tokens: int = 0
+    audio_seconds: float = 0.0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    # Requests a router sent to this provider/model, and those it moved elsewhere after a 429 or 5xx here.
+    routed: int = 0
+    failovers: int = 0
+    # Duplicate requests sent for straggling chunks, and how many of them answered first.
+    hedges: int = 0
+    hedges_won: int = 0
+    cost_usd: float = 0.0
+
+    def add(self, price: dict, requests: int = 0, prompt_tokens: int = 0, completion_tokens: int = 0,
+            estimated_tokens: int = 0, audio_seconds: float = 0.0, cache_hits: int = 0, cache_misses: int = 0,
+            routed: int = 0, failovers: int = 0, hedges: int = 0, hedges_won: int = 0):
+        self.requests += requests
+        self.prompt_tokens += prompt_tokens
+        self.completion_tokens += completion_tokens
+        self.estimated_tokens += estimated_tokens
+        self.audio_seconds += audio_seconds
+        self.cache_hits += cache_hits
+        self.cache_misses += cache_misses
+        self.routed += routed
+        self.failovers += failovers
+        self.hedges += hedges
+        self.hedges_won += hedges_won
+        self.cost_usd += (
+            prompt_tokens * price.get("input", 0.0) / 1e6
+            + completion_tokens * price.get("output", 0.0) / 1e6
+            + audio_seconds * price.get("audio_hour", 0.0) / 3600
+        )
+
+
+_usage: Dict[Tuple[str, str], UsageTotals] = {}
+_usage_lock = Lock()
+
+
+def get_usage_stats() -> Dict[str, dict]:
+    """
+    Process-wide usage per "provider/model": requests, prompt and completion
+    tokens, audio seconds, response-cache hits, routing decisions, hedged
+    requests and estimated cost in USD.
+    """
+    with _usage_lock:
+        return {f"{provider}/{model}": asdict(totals) for (provider, model), totals in _usage.items()}
+
+
+def reset_usage_stats():
+    with _usage_lock:
+        _usage.clear()
+
 
 class TokenTracker(LLMTokenObserver):
-    def __init__(self, model_name: str = "gpt-4"):
+    def __init__(self, model_name: str = "gpt-4", provider: str = "unknown",
+                 max_log_entries: int = DEFAULT_LOG_SIZE):
         """
-        Initialize with the model to ensure accurate token encoding.
+        Track usage for one provider and model. Counts come from the usage the
+        provider reports; text is only tokenized locally when it reports none.
+        ``token_log`` keeps the most recent ``max_log_entries`` events.
         """
-        self.token_log = []
         self.model_name = model_name
-        try:
-            self.encoder = tiktoken.encoding_for_model(model_name)
-        except KeyError:
-            print(f"[WARN] Model '{model_name}' not supported. Falling back to 'cl100k_base'.")
-            self.encoder = tiktoken.get_encoding("cl100k_base")
-            
+        self.provider = provider
+        self.token_log = deque(maxlen=max_log_entries)
+        self.totals = UsageTotals()
+
+    @property
+    def encoder(self):
+        return get_encoder(self.model_name)
+
+    @property
+    def cache_hits(self) -> int:
+        return self.totals.cache_hits
+
+    @property
+    def cache_misses(self) -> int:
+        return self.totals.cache_misses
+
     def count_tokens(self, text: str) -> int:
-        return len(self.encoder.encode(text))
+        return len(self.encoder.encode(text)) if text else 0
 
-    def notify(self, event_type: str, content: str, timestamp: datetime):
-        tokens = self.count_tokens(content)
-        log_entry = {
+    def _record(self, **counts):
+        price = {} if self.provider in FREE_PROVIDERS else MODEL_PRICING.get(self.model_name, {})
+        with _usage_lock:
+            self.totals.add(price, **counts)
+            key = (self.provider, self.model_name)
+            if key not in _usage:
+                _usage[key] = UsageTotals()
+            _usage[key].add(price, **counts)
+
+    def notify(self, event_type: str, content: str, timestamp: datetime, usage: Optional[dict] = None,
+               messages: Optional[list] = None, **details):
+        if usage:
+            prompt_tokens = usage.get("prompt_tokens") or 0
+            completion_tokens = usage.get("completion_tokens") or 0
+            estimated = 0
+        else:
+            prompt_tokens = sum(self.count_tokens(m.get("content")) for m in messages or ())
+            completion_tokens = self.count_tokens(content)
+            estimated = prompt_tokens + completion_tokens
+        self._record(requests=1, prompt_tokens=prompt_tokens, completion_tokens=completion_tokens,
+                     estimated_tokens=estimated)
+        self.token_log.append({
             "event": event_type,
-            "tokens": tokens,
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "source": "estimate" if estimated else "provider",
             "timestamp": timestamp,
-            "preview": content[:60].replace('\n', ' ') + ("..." if len(content) > 60 else "")
+        })
+        logger.debug(f"{self.provider}/{self.model_name} {event_type}: "
+                     f"{prompt_tokens} prompt + {completion_tokens} completion tokens")
+
+    def record_transcription(self, audio_seconds: float = 0.0):
+        self._record(requests=1, audio_seconds=audio_seconds)
+
+    def record_cache_lookup(self, hit: bool):
+        self._record(cache_hits=int(hit), cache_misses=int(not hit))
+
+    def record_route(self, reason: str):
+        """A router chose this provider/model for a request; ``reason`` says why."""
+        self._record(routed=1)
+        self.token_log.append({"event": "route", "reason": reason, "timestamp": datetime.now()})
+
+    def record_failover(self, reason: str, cooldown_s: float = 0.0):
+        """A request failed here (``reason`` is the error class) and the router moved on."""
+        self._record(failovers=1)
+        self.token_log.append({
+            "event": "failover", "reason": reason, "cooldown_s": cooldown_s, "timestamp": datetime.now(),
+        })
+        logger.info(f"{self.provider}/{self.model_name} failed ({reason}); avoided for {cooldown_s:.1f}s")
+
+    def record_hedge(self, won: bool = False):
+        """A hedged request for a slow chunk was sent, or (``won``) answered before the original."""
+        self._record(hedges=int(not won), hedges_won=int(won))
+
+    def cache_stats(self) -> dict:
+        lookups = self.cache_hits + self.cache_misses
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "hit_rate": self.cache_hits / lookups if lookups else 0.0,
         }
-        self.token_log.append(log_entry)
-        print(f"[{timestamp}] {event_type.upper():<6} | Tokens: {tokens:>4} | {log_entry['preview']}")
+
+    def usage_stats(self) -> dict:
+        """Usage recorded by this tracker alone."""
+        with _usage_lock:
+            return asdict(self.totals)
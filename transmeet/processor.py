@@ -1,64 +1,141 @@
 # cython: language_level=3
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from pydub import AudioSegment
-from typing import Optional
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, Optional, Sequence, Tuple
 
 from transmeet.utils.general_utils import get_logger
+from transmeet.utils.tracing import in_current_context, job, span
+from transmeet.utils.audio_formats import DEFAULT_UPLOAD_FORMAT
 from transmeet.utils.audio_utils import get_audio_size_mb
 from transmeet.llm.llm_tasks import (
     generate_meeting_minutes,
     create_podcast_dialogue,
     transform_transcript_to_mind_map,
-    segment_conversation_by_speaker
+    segment_conversation_by_speaker,
+    generate_meeting_minutes_async,
+    create_podcast_dialogue_async,
+    transform_transcript_to_mind_map_async,
+    segment_conversation_by_speaker_async,
+    generate_meeting_minutes_stream,
+    create_podcast_dialogue_stream,
+    generate_meeting_minutes_stream_async,
+    create_podcast_dialogue_stream_async,
+    ARTIFACT_TASKS,
+    MAP_REDUCE_TASKS,
+    generate_artifact,
+    generate_artifact_async,
+    fit_transcript_for_artifacts,
+    fit_transcript_for_artifacts_async,
+)
+from transmeet.llm.client_pool import async_client_scope, closes_async_clients
+from transmeet.llm.llm_manager import create_llm_manager
+from transmeet.clients.transcription_client import (
+    ChunkTranscript,
+    process_audio_transcription,
+    process_audio_stream_transcription,
+    process_audio_transcription_async,
 )
-from transmeet.clients.transcription_client import process_audio_transcription
 
 logger = get_logger(__name__)
 
+def _log_failed_chunks(result, audio_path):
+    if result.failed_chunks:
+        logger.warning(
+            f"{len(result.failed_chunks)} chunk(s) of {audio_path} could not be transcribed: "
+            f"{sorted(result.failed_chunks)}"
+        )
+
 def transcribe_audio_file(
     audio_path: str,
     llm_client: str = "groq",
     llm_model: str = "whisper-large-v3-turbo",
     audio_chunk_size_mb: int = 18,
-    audio_chunk_overlap: float = 0.5
+    audio_chunk_overlap: float = 2.0,
+    streaming: bool = False,
+    upload_format: str = DEFAULT_UPLOAD_FORMAT,
+    split_on_silence: bool = True,
+    max_silence_s: Optional[float] = None,
+    audio_chunk_seconds: Optional[float] = None,
+    on_chunk: Optional[Callable[[ChunkTranscript], None]] = None
 ) -> str:
     """
     Transcribes an audio file using the specified LLM provider.
 
     Args:
         audio_path (str): Path to the audio file.
-        llm_client (str): Transcription provider name.
+        llm_client (str): Transcription provider name, or several such as
+            "groq,openai:whisper-1" to spread chunks across them (see ``RoutingLLMManager``).
         llm_model (str): Model name.
         audio_chunk_size_mb (int): Chunk size for processing.
-        audio_chunk_overlap (float): Overlap between chunks.
+        audio_chunk_overlap (float): Seconds of audio shared by neighbouring chunks;
+            the overlapping text is aligned and de-duplicated when joining.
+        streaming (bool): Decode the file incrementally so memory use is bounded
+            by chunk size instead of recording length.
+        upload_format (str): Encoding used for uploaded chunks ("wav", "flac",
+            "mp3" or "opus"). Chunk sizes are computed on the encoded size.
+        split_on_silence (bool): Place chunk boundaries in pauses instead of
+            cutting at arbitrary offsets.
+        max_silence_s (Optional[float]): Shorten pauses longer than this many
+            seconds before upload. Disabled when None.
+        audio_chunk_seconds (Optional[float]): Cap on chunk duration, to fan a
+            recording out into many small parallel requests.
+        on_chunk (Optional[Callable[[ChunkTranscript], None]]): Called with each
+            chunk's text and source offsets, in order, as soon as every earlier
+            chunk is transcribed, so downstream work can start before the end.
 
     Returns:
         str: Transcribed text or error message.
     """
-    try:
-        audio_file_path = Path(audio_path)
-        audio = AudioSegment.from_file(audio_file_path)
-        file_size_mb = get_audio_size_mb(audio)
-
-        transcript = process_audio_transcription(
-            transcription_client=llm_client,
-            transcription_model=llm_model,
-            audio=audio,
-            file_size_mb=file_size_mb,
-            audio_chunk_size_mb=audio_chunk_size_mb,
-            audio_chunk_overlap=audio_chunk_overlap
-        )
-        return transcript
+    with job(), span("transcribe_file", audio=str(audio_path)):
+        try:
+            audio_file_path = Path(audio_path)
+            if streaming:
+                result = process_audio_stream_transcription(
+                    transcription_client=llm_client,
+                    transcription_model=llm_model,
+                    audio_path=audio_file_path,
+                    audio_chunk_size_mb=audio_chunk_size_mb,
+                    audio_chunk_overlap=audio_chunk_overlap,
+                    upload_format=upload_format,
+                    split_on_silence=split_on_silence,
+                    max_silence_s=max_silence_s,
+                    audio_chunk_seconds=audio_chunk_seconds,
+                    on_chunk=on_chunk
+                )
+            else:
+                with span("decode"):
+                    audio = AudioSegment.from_file(audio_file_path)
+                file_size_mb = get_audio_size_mb(audio)
 
-    except Exception as e:
-        logger.error(f"Error processing audio file {audio_path}: {e}", exc_info=True)
-        return f"Error: {e}"
+                result = process_audio_transcription(
+                    transcription_client=llm_client,
+                    transcription_model=llm_model,
+                    audio=audio,
+                    file_size_mb=file_size_mb,
+                    audio_chunk_size_mb=audio_chunk_size_mb,
+                    audio_chunk_overlap=audio_chunk_overlap,
+                    upload_format=upload_format,
+                    split_on_silence=split_on_silence,
+                    max_silence_s=max_silence_s,
+                    audio_chunk_seconds=audio_chunk_seconds,
+                    on_chunk=on_chunk
+                )
+
+            _log_failed_chunks(result, audio_path)
+            return result.text
+
+        except Exception as e:
+            logger.error(f"Error processing audio file {audio_path}: {e}", exc_info=True)
+            return f"Error: {e}"
 
 
 def generate_meeting_minutes_from_transcript(
     transcript: str,
     llm_client: str = "groq",
-    llm_model: str = "llama-3.3-70b-versatile"
+    llm_model: str = "llama-3.3-70b-versatile",
+    max_input_tokens: Optional[int] = None
 ) -> Optional[str]:
     """
     Generates meeting minutes from a transcript using LLM.
@@ -67,21 +144,113 @@ def generate_meeting_minutes_from_transcript(
         transcript (str): Raw meeting transcript.
         llm_client (str): LLM provider name.
         llm_model (str): Model name.
+        max_input_tokens (Optional[int]): When the transcript is longer than this,
+            summarize overlapping sections of it in parallel first and write the
+            minutes from the partial notes (map-reduce). Disabled when None.
 
     Returns:
         str: Generated meeting minutes markdown.
     """
     try:
-        return generate_meeting_minutes(llm_client, transcript, llm_model)
+        return generate_meeting_minutes(llm_client, transcript, llm_model, max_input_tokens=max_input_tokens)
     except Exception as e:
         logger.error(f"Error generating meeting minutes: {e}", exc_info=True)
         return f"Error: {e}"
 
 
+def generate_meeting_minutes_stream_from_transcript(
+    transcript: str,
+    llm_client: str = "groq",
+    llm_model: str = "llama-3.3-70b-versatile",
+    max_input_tokens: Optional[int] = None
+) -> Iterator[str]:
+    """
+    Generator form of ``generate_meeting_minutes_from_transcript``.
+
+    Args:
+        transcript (str): Raw meeting transcript.
+        llm_client (str): LLM provider name.
+        llm_model (str): Model name.
+        max_input_tokens (Optional[int]): Map-reduce threshold, as above.
+
+    Yields:
+        str: Pieces of the meeting minutes markdown as the model produces them.
+        Errors are logged and re-raised, as part of the text may already be out.
+    """
+    try:
+        yield from generate_meeting_minutes_stream(
+            llm_client, transcript, llm_model, max_input_tokens=max_input_tokens
+        )
+    except Exception as e:
+        logger.error(f"Error generating meeting minutes: {e}", exc_info=True)
+        raise
+
+
+def generate_meeting_transcript_and_minutes(
+    meeting_audio_file: str,
+    transcription_client: str = "groq",
+    transcription_model: str = "whisper-large-v3-turbo",
+    llm_client: str = "groq",
+    llm_model: str = "llama-3.3-70b-versatile",
+    audio_chunk_size_mb: int = 18,
+    audio_chunk_overlap: float = 2.0,
+    streaming: bool = False,
+    upload_format: str = DEFAULT_UPLOAD_FORMAT,
+    split_on_silence: bool = True,
+    max_silence_s: Optional[float] = None,
+    audio_chunk_seconds: Optional[float] = None,
+    max_input_tokens: Optional[int] = None
+) -> Tuple[str, Optional[str]]:
+    """
+    Transcribes a meeting recording and generates its minutes.
+
+    Args:
+        meeting_audio_file (str): Path to the audio file.
+        transcription_client (str): Transcription provider name.
+        transcription_model (str): Transcription model name.
+        llm_client (str): LLM provider used for the minutes.
+        llm_model (str): LLM model used for the minutes.
+        audio_chunk_size_mb (int): Chunk size for processing.
+        audio_chunk_overlap (float): Seconds of overlap between chunks.
+        streaming (bool): Decode the file incrementally.
+        upload_format (str): Encoding used for uploaded chunks.
+        split_on_silence (bool): Place chunk boundaries in pauses.
+        max_silence_s (Optional[float]): Shorten pauses longer than this.
+        audio_chunk_seconds (Optional[float]): Cap on chunk duration.
+        max_input_tokens (Optional[int]): Map-reduce threshold for the minutes.
+
+    Returns:
+        Tuple[str, Optional[str]]: Transcript and meeting minutes.
+    """
+    transcript = transcribe_audio_file(
+        audio_path=meeting_audio_file,
+        llm_client=transcription_client,
+        llm_model=transcription_model,
+        audio_chunk_size_mb=audio_chunk_size_mb,
+        audio_chunk_overlap=audio_chunk_overlap,
+        streaming=streaming,
+        upload_format=upload_format,
+        split_on_silence=split_on_silence,
+        max_silence_s=max_silence_s,
+        audio_chunk_seconds=audio_chunk_seconds
+    )
+    if transcript.startswith("Error:"):
+        raise RuntimeError(transcript)
+
+    meeting_minutes = generate_meeting_minutes_from_transcript(
+        transcript=transcript,
+        llm_client=llm_client,
+        llm_model=llm_model,
+        max_input_tokens=max_input_tokens
+    )
+    return transcript, meeting_minutes
+
+
 def generate_mind_map_from_transcript(
     transcript: str,
     llm_client: str = "groq",
-    llm_model: str = "llama-3.3-70b-versatile"
+    llm_model: str = "llama-3.3-70b-versatile",
+    max_input_tokens: Optional[int] = None
 ) -> dict:
     """
     Converts a transcript into a mind map JSON structure.
@@ -90,19 +259,21 @@ def generate_mind_map_from_transcript(
         transcript (str): Raw meeting transcript.
         llm_client (str): LLM provider.
         llm_model (str): Model name.
+        max_input_tokens (Optional[int]): Map-reduce threshold, as for the minutes.
 
     Returns:
         dict: Hierarchical JSON mind map.
     """
     try:
-        return transform_transcript_to_mind_map(llm_client, transcript, llm_model)
+        return transform_transcript_to_mind_map(llm_client, transcript, llm_model, max_input_tokens=max_input_tokens)
     except Exception as e:
         logger.error(f"Error generating mind map: {e}", exc_info=True)
         return {"error": str(e)}
 
 
 def generate_podcast_script_from_transcript(transcript: str, llm_client: str = "groq",
-                                            llm_model: str = "llama-3.3-70b-versatile"
+                                            llm_model: str = "llama-3.3-70b-versatile",
+                                            max_input_tokens: Optional[int] = None
                                             ) -> Optional[str]:
     """
     Creates a podcast script from the meeting transcript.
@@ -111,16 +282,35 @@ def generate_podcast_script_from_transcript(transcript: str, llm_client: str = "
         transcript (str): Meeting transcript.
         llm_client (str): LLM provider.
         llm_model (str): Model name.
+        max_input_tokens (Optional[int]): Map-reduce threshold, as for the minutes.
 
     Returns:
         Optional[str]: Podcast script or None in case of error.
     """
     try:
-        return create_podcast_dialogue(llm_client, transcript, llm_model)
+        return create_podcast_dialogue(llm_client, transcript, llm_model, max_input_tokens=max_input_tokens)
     except Exception as e:
         logger.error(f"Error generating podcast script: {e}", exc_info=True)
         return None
 
+def generate_podcast_script_stream_from_transcript(transcript: str, llm_client: str = "groq",
+                                                   llm_model: str = "llama-3.3-70b-versatile",
+                                                   max_input_tokens: Optional[int] = None
+                                                   ) -> Iterator[str]:
+    """
+    Generator form of ``generate_podcast_script_from_transcript``.
+
+    Yields:
+        str: Pieces of the podcast script as the model produces them.
+    """
+    try:
+        yield from create_podcast_dialogue_stream(
+            llm_client, transcript, llm_model, max_input_tokens=max_input_tokens
+        )
+    except Exception as e:
+        logger.error(f"Error generating podcast script: {e}", exc_info=True)
+        raise
+
 def segment_speech_by_speaker(transcript: str, llm_client: str = "groq",
                               llm_model: str = "llama-3.3-70b-versatile") -> Optional[str]:
     """
@@ -139,3 +329,269 @@ def segment_speech_by_speaker(transcript: str, llm_client: str = "groq",
     except Exception as e:
         logger.error(f"Error segmenting speech by speaker: {e}", exc_info=True)
         return f"Error: {e}"
+
+
+def _artifact_error(task_name, error):
+    # Same failure values as the single-artifact functions above.
+    logger.error(f"Error generating {task_name}: {error}", exc_info=error)
+    if task_name == "mind_map":
+        return {"error": str(error)}
+    if task_name == "podcast_script":
+        return None
+    return f"Error: {error}"
+
+
+def generate_artifacts(
+    transcript: str,
+    artifacts: Optional[Sequence[str]] = None,
+    llm_client: str = "groq",
+    llm_model: str = "llama-3.3-70b-versatile",
+    meeting_datetime=None,
+    max_input_tokens: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Generates several artifacts from one transcript concurrently.
+
+    All requests go through one ``LLMManager`` (one pooled client, one rate-limit
+    budget, one tokenization of the transcript). The transcript is sent as the
+    first message of every request so providers can reuse its cached prefix.
+    With ``max_input_tokens`` it is condensed once for all summarizing artifacts,
+    which then share the condensed transcript as that prefix.
+
+    Args:
+        transcript (str): Raw meeting transcript.
+        artifacts (Optional[Sequence[str]]): Any of "meeting_minutes", "mind_map",
+            "podcast_script" and "speaker_segmentation"; all of them when None.
+        llm_client (str): LLM provider, or several such as "groq,openai:gpt-4o-mini"
+            to spread the artifacts across them.
+        llm_model (str): Model name.
+        meeting_datetime: Meeting date used in the minutes.
+        max_input_tokens (Optional[int]): Map-reduce threshold for the summarizing
+            artifacts, as in ``generate_meeting_minutes_from_transcript``.
+
+    Returns:
+        Dict[str, Any]: Artifact name mapped to its result; failed artifacts hold
+        the same error value as the corresponding single-artifact function.
+    """
+    artifacts = list(artifacts or ARTIFACT_TASKS)
+    manager = create_llm_manager(provider=llm_client, model_name=llm_model)
+
+    with job(), ThreadPoolExecutor(max_workers=len(artifacts) + 1) as executor:
+        # Started alongside the tasks that do not need it, such as speaker segmentation.
+        condensed = executor.submit(in_current_context(fit_transcript_for_artifacts),
+                                    manager, artifacts, transcript, max_input_tokens)
+
+        def run(task_name):
+            try:
+                with span("artifact", task=task_name):
+                    text = condensed.result() if task_name in MAP_REDUCE_TASKS else transcript
+                    return generate_artifact(manager, task_name, text, meeting_datetime)
+            except Exception as e:
+                return _artifact_error(task_name, e)
+
+        return dict(zip(artifacts, executor.map(in_current_context(run), artifacts)))
+
+
+# ---------------------- Async API ---------------------- #
+
+@closes_async_clients
+async def transcribe_audio_file_async(
+    audio_path: str,
+    llm_client: str = "groq",
+    llm_model: str = "whisper-large-v3-turbo",
+    audio_chunk_size_mb: int = 18,
+    audio_chunk_overlap: float = 2.0,
+    streaming: bool = False,
+    upload_format: str = DEFAULT_UPLOAD_FORMAT,
+    split_on_silence: bool = True,
+    max_silence_s: Optional[float] = None,
+    audio_chunk_seconds: Optional[float] = None,
+    max_concurrency: int = 20,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    on_chunk: Optional[Callable[[ChunkTranscript], None]] = None
+) -> str:
+    """
+    Async counterpart of ``transcribe_audio_file``.
+
+    Chunks are uploaded with the providers' async clients on the running event
+    loop. Pass one ``semaphore`` to bound in-flight uploads across many meetings.
+
+    Returns:
+        str: Transcribed text or error message.
+    """
+    with job(), span("transcribe_file", audio=str(audio_path)):
+        try:
+            result = await process_audio_transcription_async(
+                transcription_client=llm_client,
+                transcription_model=llm_model,
+                audio_path=Path(audio_path),
+                audio_chunk_size_mb=audio_chunk_size_mb,
+                audio_chunk_overlap=audio_chunk_overlap,
+                upload_format=upload_format,
+                split_on_silence=split_on_silence,
+                max_silence_s=max_silence_s,
+                audio_chunk_seconds=audio_chunk_seconds,
+                streaming=streaming,
+                max_concurrency=max_concurrency,
+                semaphore=semaphore,
+                on_chunk=on_chunk
+            )
+            _log_failed_chunks(result, audio_path)
+            return result.text
+
+        except Exception as e:
+            logger.error(f"Error processing audio file {audio_path}: {e}", exc_info=True)
+            return f"Error: {e}"
+
+
+@closes_async_clients
+async def generate_meeting_minutes_from_transcript_async(
+    transcript: str,
+    llm_client: str = "groq",
+    llm_model: str = "llama-3.3-70b-versatile",
+    max_input_tokens: Optional[int] = None
+) -> Optional[str]:
+    """Async counterpart of ``generate_meeting_minutes_from_transcript``."""
+    try:
+        return await generate_meeting_minutes_async(
+            llm_client, transcript, llm_model, max_input_tokens=max_input_tokens
+        )
+    except Exception as e:
+        logger.error(f"Error generating meeting minutes: {e}", exc_info=True)
+        return f"Error: {e}"
+
+
+async def generate_meeting_minutes_stream_from_transcript_async(
+    transcript: str,
+    llm_client: str = "groq",
+    llm_model: str = "llama-3.3-70b-versatile",
+    max_input_tokens: Optional[int] = None
+) -> AsyncIterator[str]:
+    """Async generator form of ``generate_meeting_minutes_from_transcript``."""
+    async with async_client_scope():
+        try:
+            async for piece in generate_meeting_minutes_stream_async(
+                    llm_client, transcript, llm_model, max_input_tokens=max_input_tokens):
+                yield piece
+        except Exception as e:
+            logger.error(f"Error generating meeting minutes: {e}", exc_info=True)
+            raise
+
+
+@closes_async_clients
+async def generate_meeting_transcript_and_minutes_async(
+    meeting_audio_file: str,
+    transcription_client: str = "groq",
+    transcription_model: str = "whisper-large-v3-turbo",
+    llm_client: str = "groq",
+    llm_model: str = "llama-3.3-70b-versatile",
+    max_input_tokens: Optional[int] = None,
+    **transcription_options
+) -> Tuple[str, Optional[str]]:
+    """
+    Async counterpart of ``generate_meeting_transcript_and_minutes``. Extra keyword
+    arguments are passed to ``transcribe_audio_file_async``.
+    """
+    transcript = await transcribe_audio_file_async(
+        audio_path=meeting_audio_file,
+        llm_client=transcription_client,
+        llm_model=transcription_model,
+        **transcription_options
+    )
+    if transcript.startswith("Error:"):
+        raise RuntimeError(transcript)
+
+    meeting_minutes = await generate_meeting_minutes_from_transcript_async(
+        transcript=transcript,
+        llm_client=llm_client,
+        llm_model=llm_model,
+        max_input_tokens=max_input_tokens
+    )
+    return transcript, meeting_minutes
+
+
+@closes_async_clients
+async def generate_mind_map_from_transcript_async(
+    transcript: str,
+    llm_client: str = "groq",
+    llm_model: str = "llama-3.3-70b-versatile",
+    max_input_tokens: Optional[int] = None
+) -> dict:
+    """Async counterpart of ``generate_mind_map_from_transcript``."""
+    try:
+        return await transform_transcript_to_mind_map_async(
+            llm_client, transcript, llm_model, max_input_tokens=max_input_tokens
+        )
+    except Exception as e:
+        logger.error(f"Error generating mind map: {e}", exc_info=True)
+        return {"error": str(e)}
+
+
+@closes_async_clients
+async def generate_podcast_script_from_transcript_async(transcript: str, llm_client: str = "groq",
+                                                        llm_model: str = "llama-3.3-70b-versatile",
+                                                        max_input_tokens: Optional[int] = None
+                                                        ) -> Optional[str]:
+    """Async counterpart of ``generate_podcast_script_from_transcript``."""
+    try:
+        return await create_podcast_dialogue_async(
+            llm_client, transcript, llm_model, max_input_tokens=max_input_tokens
+        )
+    except Exception as e:
+        logger.error(f"Error generating podcast script: {e}", exc_info=True)
+        return None
+
+
+async def generate_podcast_script_stream_from_transcript_async(transcript: str, llm_client: str = "groq",
+                                                               llm_model: str = "llama-3.3-70b-versatile",
+                                                               max_input_tokens: Optional[int] = None
+                                                               ) -> AsyncIterator[str]:
+    """Async generator form of ``generate_podcast_script_from_transcript``."""
+    async with async_client_scope():
+        try:
+            async for piece in create_podcast_dialogue_stream_async(
+                    llm_client, transcript, llm_model, max_input_tokens=max_input_tokens):
+                yield piece
+        except Exception as e:
+            logger.error(f"Error generating podcast script: {e}", exc_info=True)
+            raise
+
+
+@closes_async_clients
+async def segment_speech_by_speaker_async(transcript: str, llm_client: str = "groq",
+                                          llm_model: str = "llama-3.3-70b-versatile") -> Optional[str]:
+    """Async counterpart of ``segment_speech_by_speaker``."""
+    try:
+        return await segment_conversation_by_speaker_async(llm_client, transcript, llm_model)
+    except Exception as e:
+        logger.error(f"Error segmenting speech by speaker: {e}", exc_info=True)
+        return f"Error: {e}"
+
+
+@closes_async_clients
+async def generate_artifacts_async(
+    transcript: str,
+    artifacts: Optional[Sequence[str]] = None,
+    llm_client: str = "groq",
+    llm_model: str = "llama-3.3-70b-versatile",
+    meeting_datetime=None,
+    max_input_tokens: Optional[int] = None
+) -> Dict[str, Any]:
+    """Async counterpart of ``generate_artifacts``."""
+    artifacts = list(artifacts or ARTIFACT_TASKS)
+    manager = create_llm_manager(provider=llm_client, model_name=llm_model)
+
+    async def run(task_name):
+        try:
+            with span("artifact", task=task_name):
+                text = await condensed if task_name in MAP_REDUCE_TASKS else transcript
+                return await generate_artifact_async(manager, task_name, text, meeting_datetime)
+        except Exception as e:
+            return _artifact_error(task_name, e)
+
+    with job():
+        condensed = asyncio.ensure_future(
+            fit_transcript_for_artifacts_async(manager, artifacts, transcript, max_input_tokens)
+        )
+        results = await asyncio.gather(*(run(task_name) for task_name in artifacts))
+    return dict(zip(artifacts, results))
@@ -0,0 +1,13 @@
+# cython: language_level=3
+# Upload encodings, kept free of audio-library imports so the CLI can offer
+# them without loading pydub and NumPy.
+
+# Whisper-style endpoints resample to 16 kHz mono anyway, so every format but
+# plain "wav" downmixes before encoding to cut upload size.
+UPLOAD_FORMATS = {
+    "wav": {"format": "wav"},
+    "flac": {"format": "flac", "frame_rate": 16000, "channels": 1},
+    "mp3": {"format": "mp3", "frame_rate": 16000, "channels": 1, "bitrate": "48k"},
+    "opus": {"format": "ogg", "codec": "libopus", "frame_rate": 16000, "channels": 1, "bitrate": "24k"},
+}
+DEFAULT_UPLOAD_FORMAT = "flac"
@@ -1,4 +1,46 @@
 # cython: language_level=3
+import io
+import subprocess
+import tempfile
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import numpy as np
+from pydub import AudioSegment
+from pydub.utils import mediainfo_json
+
+from transmeet.utils.audio_formats import UPLOAD_FORMATS
+
+PCM_SAMPLE_WIDTH = 2  # ffmpeg decodes to signed 16-bit little-endian PCM
+
+
+SILENCE_FRAME_MS = 20
+SILENCE_THRESHOLD_OFFSET_DB = 16  # below the recording's average level, as in pydub
+MIN_PAUSE_MS = 300
+PAUSE_SEARCH_MS = 30_000
+KEEP_SILENCE_MS = 500
+
+# (chunk_ms, source_ms) anchors: from chunk_ms onwards, positions map linearly from source_ms.
+OffsetMap = List[Tuple[int, int]]
+
+
+@dataclass
+class AudioChunk:
+    """A slice of a recording together with where it came from."""
+    audio: AudioSegment
+    start_ms: int
+    end_ms: int
+    offset_map: Optional[OffsetMap] = None
+
+    def to_source_ms(self, ms):
+        """Translate a position inside this chunk to a position in the source recording."""
+        if not self.offset_map:
+            return self.start_ms + ms
+        return map_to_source_ms(self.offset_map, ms)
+
+
+
 def get_audio_size_mb(audio_segment):
     return len(audio_segment.raw_data) / (1024 * 1024)
 
@@ -7,23 +49,342 @@ def export_temp_wav(chunk, prefix, index):
     chunk.export(filename, format="wav")
     return filename
 
-def split_audio_by_target_size(audio, target_mb, overlap=0.0):
-    """Split audio into chunks of approx. target MB without exceeding max size."""
+def get_upload_format(name):
+    """Return the encoder settings for an upload format name."""
+    try:
+        return UPLOAD_FORMATS[name.lower()]
+    except KeyError:
+        raise ValueError(
+            f"Unsupported upload format: {name}. Choose from {', '.join(UPLOAD_FORMATS)}"
+        )
+
+def upload_stream_format(upload_format, frame_rate, channels):
+    """Sample rate and channel count a chunk will have once prepared for upload."""
+    spec = get_upload_format(upload_format)
+    return spec.get("frame_rate", frame_rate), spec.get("channels", channels)
+
+def prepare_for_upload(chunk, upload_format):
+    """Resample/downmix a chunk to what the upload format expects."""
+    frame_rate, channels = upload_stream_format(upload_format, chunk.frame_rate, chunk.channels)
+    if chunk.frame_rate != frame_rate:
+        chunk = chunk.set_frame_rate(frame_rate)
+    if chunk.channels != channels:
+        chunk = chunk.set_channels(channels)
+    return chunk
+
+def encode_audio_chunk(chunk, upload_format="wav"):
+    """Encode an ``AudioSegment`` into an in-memory buffer named for upload."""
+    spec = get_upload_format(upload_format)
+    buffer = io.BytesIO()
+    prepare_for_upload(chunk, upload_format).export(
+        buffer,
+        format=spec["format"],
+        codec=spec.get("codec"),
+        bitrate=spec.get("bitrate"),
+    )
+    buffer.name = f"chunk.{spec['format']}"
+    buffer.seek(0)
+    return buffer
+
+def estimate_encoded_bytes_per_ms(upload_format, frame_rate, channels, sample=None, probe_ms=30_000):
+    """
+    Estimate the encoded size per millisecond of audio for an upload format.
+
+    Constant-bitrate codecs are computed from their bitrate. Lossless formats
+    are measured by encoding up to ``probe_ms`` of ``sample`` when one is
+    given, and otherwise bounded by the size of the PCM they are built from.
+    """
+    spec = get_upload_format(upload_format)
+    frame_rate, channels = upload_stream_format(upload_format, frame_rate, channels)
+    pcm_bytes_per_ms = frame_rate * channels * PCM_SAMPLE_WIDTH / 1000
+
+    bitrate = spec.get("bitrate")
+    if bitrate:
+        # Allow a little headroom for container overhead.
+        return int(bitrate.rstrip("k")) * 1000 / 8 / 1000 * 1.05
+
+    if spec["format"] == "wav" or sample is None or len(sample) < 1000:
+        return pcm_bytes_per_ms
+
+    start = max(0, (len(sample) - probe_ms) // 2)
+    probe = sample[start:start + probe_ms]
+    encoded_size = len(encode_audio_chunk(probe, upload_format).getvalue())
+    return min(pcm_bytes_per_ms, encoded_size / len(probe) * 1.1)
+
+def frame_levels_db(audio, frame_ms=SILENCE_FRAME_MS):
+    """Vectorized RMS level of each ``frame_ms`` frame of ``audio``, in dBFS."""
+    dtype = {1: np.uint8, 2: np.int16, 4: np.int32}[audio.sample_width]
+    samples = np.frombuffer(audio.raw_data, dtype=dtype).astype(np.float32)
+    if audio.sample_width == 1:
+        samples -= 128
+    if audio.channels > 1:
+        samples = samples[:len(samples) - len(samples) % audio.channels]
+        samples = samples.reshape(-1, audio.channels).mean(axis=1)
+
+    frame_length = max(1, int(audio.frame_rate * frame_ms / 1000))
+    num_frames = len(samples) // frame_length
+    if num_frames == 0:
+        return np.zeros(0, dtype=np.float32)
+
+    frames = samples[:num_frames * frame_length].reshape(num_frames, frame_length)
+    rms = np.sqrt(np.mean(np.square(frames), axis=1))
+    max_amplitude = float(1 << (8 * audio.sample_width - 1))
+    return 20 * np.log10(np.maximum(rms, 1e-9) / max_amplitude)
+
+def silence_threshold_db(levels, offset_db=SILENCE_THRESHOLD_OFFSET_DB):
+    """Level below which a frame counts as silence, relative to the average level."""
+    if len(levels) == 0:
+        return -np.inf
+    average_power = np.mean(np.power(10.0, levels / 10))
+    return 10 * np.log10(max(average_power, 1e-18)) - offset_db
+
+def _silent_runs(silent):
+    """Start/end frame indices of each run of ``True`` in a boolean array."""
+    edges = np.diff(np.concatenate(([0], silent.astype(np.int8), [0])))
+    return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
+def find_silences(audio, min_silence_ms=MIN_PAUSE_MS, frame_ms=SILENCE_FRAME_MS, silence_thresh_db=None):
+    """Return ``(start_ms, end_ms)`` of every pause of at least ``min_silence_ms``."""
+    levels = frame_levels_db(audio, frame_ms)
+    if silence_thresh_db is None:
+        silence_thresh_db = silence_threshold_db(levels)
+
+    starts, ends = _silent_runs(levels < silence_thresh_db)
+    keep = (ends - starts) * frame_ms >= min_silence_ms
+    return [(int(s) * frame_ms, int(e) * frame_ms) for s, e in zip(starts[keep], ends[keep])]
+
+def find_pause_boundary(levels, silence_thresh_db, start_ms, end_ms,
+                        search_ms=PAUSE_SEARCH_MS, frame_ms=SILENCE_FRAME_MS):
+    """
+    Move a chunk boundary at ``end_ms`` back to the middle of the longest pause
+    within the preceding ``search_ms``. Falls back to the quietest frame when
+    there is no pause, so a boundary never lands in the middle of loud speech.
+    """
+    first = max(start_ms + (end_ms - start_ms) // 2, end_ms - search_ms) // frame_ms
+    last = min(end_ms // frame_ms, len(levels))
+    if last - first < 2:
+        return end_ms
+
+    window = levels[first:last]
+    starts, ends = _silent_runs(window < silence_thresh_db)
+    if len(starts):
+        lengths = ends - starts
+        # Latest of the longest runs keeps chunks as close to the target size as possible.
+        best = len(lengths) - 1 - int(np.argmax(lengths[::-1]))
+        middle = (starts[best] + ends[best]) // 2
+    else:
+        middle = int(np.argmin(window))
+
+    return int(first + middle) * frame_ms
+
+def map_to_source_ms(offset_map, ms):
+    """Translate a position in silence-compressed audio back to the source."""
+    index = bisect_right(offset_map, (ms, float("inf"))) - 1
+    chunk_ms, source_ms = offset_map[max(index, 0)]
+    return source_ms + (ms - chunk_ms)
+
+def compress_silences(audio, max_silence_ms, keep_ms=KEEP_SILENCE_MS, frame_ms=SILENCE_FRAME_MS,
+                      silence_thresh_db=None):
+    """
+    Shorten every pause longer than ``max_silence_ms`` to ``keep_ms`` (0 drops it).
+
+    Returns the compressed audio and an offset map of ``(compressed_ms, source_ms)``
+    anchors for ``map_to_source_ms``.
+    """
+    silences = find_silences(audio, max_silence_ms, frame_ms, silence_thresh_db)
+    offset_map = [(0, 0)]
+    pieces = []
+    cursor = 0
+    position = 0
+    for silence_start, silence_end in silences:
+        cut_start = silence_start + keep_ms // 2
+        cut_end = silence_end - (keep_ms - keep_ms // 2)
+        if cut_end <= cut_start:
+            continue
+        pieces.append(audio[cursor:cut_start].raw_data)
+        position += cut_start - cursor
+        cursor = cut_end
+        offset_map.append((position, cursor))
+
+    if cursor == 0:
+        return audio, offset_map
+
+    pieces.append(audio[cursor:].raw_data)
+    return audio._spawn(b"".join(pieces)), offset_map
+
+def slice_offset_map(offset_map, start_ms, end_ms):
+    """Anchors covering ``[start_ms, end_ms)`` of compressed audio, rebased to a chunk."""
+    anchors = [(0, map_to_source_ms(offset_map, start_ms))]
+    anchors.extend(
+        (chunk_ms - start_ms, source_ms)
+        for chunk_ms, source_ms in offset_map
+        if start_ms < chunk_ms < end_ms
+    )
+    return anchors
+
+def split_audio_by_target_size(audio, target_mb, overlap=0.0, upload_format="wav",
+                               split_on_silence=True, max_silence_ms=None, max_chunk_ms=None):
+    """
+    Split audio into chunks whose encoded upload size is approx. target MB.
+
+    Every chunk after the first also starts ``overlap`` seconds before the
+    previous one ends, so boundary words can be stitched back together.
+    ``max_chunk_ms`` caps chunk duration to fan a file out into more requests.
+    With ``split_on_silence`` each boundary is moved back to a nearby pause so
+    words are not cut in half. With ``max_silence_ms`` long pauses are shortened
+    before splitting; every ``AudioChunk`` keeps the offsets into the original.
+    """
+    offset_map = None
+    if max_silence_ms:
+        audio, offset_map = compress_silences(audio, max_silence_ms)
+
     target_bytes = target_mb * 1024 * 1024
     total_duration_ms = len(audio)
-    chunk_duration_ms = (target_bytes / len(audio.raw_data)) * total_duration_ms
+    bytes_per_ms = estimate_encoded_bytes_per_ms(
+        upload_format, audio.frame_rate, audio.channels, sample=audio
+    )
+    chunk_duration_ms = max(1000, int(target_bytes / bytes_per_ms))
+    if max_chunk_ms:
+        chunk_duration_ms = max(1000, min(chunk_duration_ms, int(max_chunk_ms)))
+    overlap_ms = clamp_overlap_ms(overlap, chunk_duration_ms)
+
+    levels = threshold = None
+    if split_on_silence and total_duration_ms > chunk_duration_ms:
+        levels = frame_levels_db(audio)
+        threshold = silence_threshold_db(levels)
 
     chunks = []
     start = 0
     while start < total_duration_ms:
-        end = min(start + int(chunk_duration_ms), total_duration_ms)
-        chunk = audio[start:end]
-
-        while len(chunk.raw_data) > target_bytes:
-            end -= 1
-            chunk = audio[start:end]
-
-        chunks.append(chunk)
+        end = min(start + chunk_duration_ms, total_duration_ms)
+        if levels is not None and end < total_duration_ms:
+            end = find_pause_boundary(levels, threshold, start, end)
+        chunk_start = max(0, start - overlap_ms) if chunks else start
+        chunks.append(_make_chunk(audio, chunk_start, end, offset_map))
         start = end
 
     return chunks
+
+def clamp_overlap_ms(overlap_s, chunk_duration_ms):
+    """Overlap in ms, kept well below the chunk duration so chunks always advance."""
+    return max(0, min(int((overlap_s or 0) * 1000), chunk_duration_ms // 4))
+
+def _make_chunk(audio, start_ms, end_ms, offset_map=None, source_offset_ms=0):
+    if not offset_map:
+        return AudioChunk(audio[start_ms:end_ms], source_offset_ms + start_ms, source_offset_ms + end_ms)
+
+    anchors = [
+        (chunk_ms, source_offset_ms + source_ms)
+        for chunk_ms, source_ms in slice_offset_map(offset_map, start_ms, end_ms)
+    ]
+    return AudioChunk(
+        audio[start_ms:end_ms],
+        anchors[0][1],
+        source_offset_ms + map_to_source_ms(offset_map, end_ms),
+        anchors,
+    )
+
+def probe_audio(audio_path):
+    """
+    Read stream metadata with ffprobe without decoding the audio.
+    Returns a dict with ``frame_rate``, ``channels`` and ``duration_s``.
+    """
+    info = mediainfo_json(str(audio_path))
+    stream = next((s for s in info.get("streams", []) if s.get("codec_type") == "audio"), None)
+    if stream is None:
+        raise ValueError(f"No audio stream found in {audio_path}")
+
+    duration = stream.get("duration") or info.get("format", {}).get("duration") or 0
+    return {
+        "frame_rate": int(stream["sample_rate"]),
+        "channels": int(stream["channels"]),
+        "duration_s": float(duration),
+    }
+
+def chunk_duration_for_size(target_mb, frame_rate, channels, upload_format="wav"):
+    """Duration in ms of a chunk whose encoded upload is about ``target_mb``."""
+    bytes_per_ms = estimate_encoded_bytes_per_ms(upload_format, frame_rate, channels)
+    return max(1000, int((target_mb * 1024 * 1024) / bytes_per_ms))
+
+def _read_exact(stream, size):
+    """Read up to ``size`` bytes, only returning short at end of stream."""
+    buffer = bytearray()
+    while len(buffer) < size:
+        data = stream.read(size - len(buffer))
+        if not data:
+            break
+        buffer.extend(data)
+    return bytes(buffer)
+
+def stream_audio_chunks(audio_path, chunk_duration_ms, frame_rate, channels,
+                        split_on_silence=False, max_silence_ms=None, overlap=0.0):
+    """
+    Decode ``audio_path`` incrementally through an ffmpeg pipe and yield
+    ``AudioChunk`` windows of about ``chunk_duration_ms``.
+
+    Only one window of PCM is buffered here at a time, so memory use depends
+    on the window size rather than on the length of the recording. Overlap and
+    silence handling work as in ``split_audio_by_target_size``, window by window.
+    """
+    frame_width = channels * PCM_SAMPLE_WIDTH
+    window_bytes = max(1, int(chunk_duration_ms * frame_rate / 1000)) * frame_width
+    overlap_ms = clamp_overlap_ms(overlap, chunk_duration_ms)
+
+    command = [
+        AudioSegment.converter, "-nostdin", "-v", "error",
+        "-i", str(audio_path),
+        "-f", "s16le", "-acodec", "pcm_s16le",
+        "-ac", str(channels), "-ar", str(frame_rate),
+        "-",
+    ]
+    # A file rather than a pipe: ffmpeg could fill a stderr pipe with errors about a
+    # damaged input and block while this loop waits on stdout.
+    stderr_file = tempfile.TemporaryFile()
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=stderr_file)
+    completed = False
+    consumed_ms = 0  # source position of the first sample not yet emitted
+    head = b""  # tail of the previous window, repeated as overlap
+    carry = b""  # decoded audio after the previous boundary
+    try:
+        while True:
+            wanted = window_bytes - len(head) - len(carry)
+            fresh = _read_exact(process.stdout, wanted)
+            if not fresh and not carry:
+                break
+            at_end = len(fresh) < wanted
+            data = head + carry + fresh
+            data = data[:len(data) - len(data) % frame_width]
+            window = AudioSegment(
+                data=data,
+                sample_width=PCM_SAMPLE_WIDTH,
+                frame_rate=frame_rate,
+                channels=channels,
+            )
+            head_ms = len(window._spawn(head))
+            window_start_ms = consumed_ms - head_ms
+
+            end_ms = len(window)
+            if split_on_silence and not at_end:
+                levels = frame_levels_db(window)
+                end_ms = find_pause_boundary(levels, silence_threshold_db(levels), head_ms, end_ms)
+            carry = window[end_ms:].raw_data
+            window = window[:end_ms]
+            head = window[-overlap_ms:].raw_data if overlap_ms else b""
+            consumed_ms = window_start_ms + end_ms
+
+            offset_map = None
+            if max_silence_ms:
+                window, offset_map = compress_silences(window, max_silence_ms)
+            yield _make_chunk(window, 0, len(window), offset_map, source_offset_ms=window_start_ms)
+        completed = True
+    finally:
+        process.stdout.close()
+        if not completed:
+            process.kill()
+        process.wait()
+        stderr_file.seek(0)
+        stderr = stderr_file.read().decode(errors="replace")
+        stderr_file.close()
+
+    if process.returncode != 0:
+        raise RuntimeError(f"ffmpeg failed to decode {audio_path}: {stderr.strip()}")
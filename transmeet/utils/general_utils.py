@@ -1,9 +1,16 @@
 # cython: language_level=3
+import atexit
+import json
 import re
 import logging
+import logging.handlers
 import os
+import queue
 from pathlib import Path
 from datetime import datetime
+from threading import Lock
+
+from transmeet.utils.tracing import current_job_id
 
 ROOT_DIR = Path(__file__).resolve().parent.parent.parent
 
@@ -20,21 +27,111 @@ def extract_datetime_from_filename(filename: str):
     datetime_str = f"{date_part} {time_part} {am_pm}"    
     return datetime.strptime(datetime_str, "%m-%d-%Y %I-%M-%S %p")
 
+class _DelayedFileHandler(logging.FileHandler):
+    """File handler that creates its directory and file when the first record is written."""
+
+    def __init__(self, filename, mode="a"):
+        super().__init__(filename, mode=mode, delay=True)
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return super()._open()
+
+class _ModuleFileHandler(logging.Handler):
+    """Routes each record to ``logs/<logger name>/log.txt``."""
+
+    def __init__(self):
+        super().__init__()
+        self._handlers = {}
+
+    def setFormatter(self, fmt):
+        super().setFormatter(fmt)
+        for handler in self._handlers.values():
+            handler.setFormatter(fmt)
+
+    def emit(self, record):
+        handler = self._handlers.get(record.name)
+        if handler is None:
+            handler = self._handlers[record.name] = _DelayedFileHandler(f"logs/{record.name}/log.txt")
+            handler.setFormatter(self.formatter)
+        handler.emit(record)
+
+    def close(self):
+        for handler in self._handlers.values():
+            handler.close()
+        super().close()
+
+class _JobFilter(logging.Filter):
+    """Adds the current job id (see ``tracing.job``) to records, in the logging thread."""
+
+    def filter(self, record):
+        record.job_id = current_job_id()
+        record.job = f"[{record.job_id}] " if record.job_id else ""
+        return True
+
+class _JsonFormatter(logging.Formatter):
+    def format(self, record):
+        return json.dumps({
+            "time": self.formatTime(record, LOG_DATE_FORMAT),
+            "level": record.levelname,
+            "logger": record.name,
+            "job_id": getattr(record, "job_id", None),
+            "message": record.getMessage(),
+        })
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """Hands records to the background listener, starting it with the first one."""
+
+    def emit(self, record):
+        _start_log_listener()
+        super().emit(record)
+
+LOG_FORMAT = "%(asctime)s - %(levelname)s - %(job)s%(message)s"
+LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+_log_queue = queue.SimpleQueue()
+_file_handler = _ModuleFileHandler()
+_console_handler = logging.StreamHandler()
+_listener = None
+_listener_lock = Lock()
+
+def configure_logging(json_format: bool = False):
+    """Write log lines as text (the default) or as one JSON object per line."""
+    formatter = _JsonFormatter() if json_format else logging.Formatter(LOG_FORMAT, LOG_DATE_FORMAT)
+    _file_handler.setFormatter(formatter)
+    _console_handler.setFormatter(formatter)
+
+configure_logging(json_format=os.environ.get("TRANSMEET_LOG_FORMAT", "").lower() == "json")
+
+def _start_log_listener():
+    global _listener
+    if _listener is not None:
+        return
+    with _listener_lock:
+        if _listener is None:
+            _listener = logging.handlers.QueueListener(_log_queue, _file_handler, _console_handler)
+            _listener.start()
+
+def flush_logs():
+    """Write out every queued record. Logging resumes on the next record."""
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+
+atexit.register(flush_logs)
+
 def get_logger(name: str = __name__):
     logger = logging.getLogger(name)
     logger.setLevel(logging.INFO)
 
     if not logger.handlers:
-        log_dir = f"logs/{name}"
-        os.makedirs(log_dir, exist_ok=True)
-
-        file_handler = logging.FileHandler(f"{log_dir}/log.txt", mode='a')
-        formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s", "%Y-%m-%d %H:%M:%S")
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-        console_handler = logging.StreamHandler()
-        console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        # Worker threads only enqueue records; a single listener thread does the
+        # file and console I/O. Nothing is created on disk until the first record.
+        handler = _QueueHandler(_log_queue)
+        handler.addFilter(_JobFilter())
+        logger.addHandler(handler)
 
     logger.propagate = False
     return logger
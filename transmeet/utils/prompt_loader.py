@@ -1,5 +1,7 @@
 import os
+from functools import lru_cache
 
+@lru_cache(maxsize=None)
 def load_prompt(task_name, prompt_type):
     """
     Load prompt from a given task and type (system/user).
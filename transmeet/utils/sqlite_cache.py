@@ -0,0 +1,120 @@
+# cython: language_level=3
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from threading import Lock
+from typing import Optional
+
+CACHE_DIR_ENV = "TRANSMEET_CACHE_DIR"
+
+# Eviction scans the table, so it runs every few writes rather than on each one.
+EVICT_EVERY_WRITES = 64
+
+
+def default_cache_dir() -> Path:
+    """``$TRANSMEET_CACHE_DIR``, else ``$XDG_CACHE_HOME/transmeet``, else ``~/.cache/transmeet``."""
+    if os.environ.get(CACHE_DIR_ENV):
+        return Path(os.environ[CACHE_DIR_ENV])
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "transmeet"
+
+
+class SQLiteCache:
+    """
+    A small key/value store of text in one SQLite file, shared by threads and
+    processes. Entries older than ``max_age_s`` are dropped, and once the
+    stored text exceeds ``max_bytes`` the least recently used entries go first.
+    """
+
+    def __init__(self, path, max_bytes: Optional[int] = None, max_age_s: Optional[float] = None):
+        self.path = str(path)
+        self.max_bytes = max_bytes
+        self.max_age_s = max_age_s
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._writes = 0
+        self._lock = Lock()
+
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, value TEXT, size INTEGER, created REAL, accessed REAL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute("SELECT value, created FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is not None and self.max_age_s is not None and now - row[1] > self.max_age_s:
+                conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                row = None
+            if row is not None:
+                conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+        with self._lock:
+            if row is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return None if row is None else row[0]
+
+    def set(self, key: str, value: str):
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, created, accessed) VALUES (?, ?, ?, ?, ?)",
+                (key, value, len(value.encode("utf-8")), now, now),
+            )
+        with self._lock:
+            self._writes += 1
+            due = self._writes % EVICT_EVERY_WRITES == 1
+        if due:
+            self.evict()
+
+    def evict(self) -> int:
+        """Apply the age and size limits now; returns the number of entries removed."""
+        removed = 0
+        with self._connect() as conn:
+            if self.max_age_s is not None:
+                removed += conn.execute(
+                    "DELETE FROM entries WHERE created < ?", (time.time() - self.max_age_s,)
+                ).rowcount
+            if self.max_bytes is not None:
+                total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+                if total > self.max_bytes:
+                    # Walk from least recently used until enough has been freed.
+                    excess, keys = total - self.max_bytes, []
+                    for key, size in conn.execute("SELECT key, size FROM entries ORDER BY accessed"):
+                        keys.append((key,))
+                        excess -= size
+                        if excess <= 0:
+                            break
+                    conn.executemany("DELETE FROM entries WHERE key = ?", keys)
+                    removed += len(keys)
+        with self._lock:
+            self.evictions += removed
+        return removed
+
+    def clear(self):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM entries")
+
+    def stats(self) -> dict:
+        with self._connect() as conn:
+            entries, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "entries": entries, "bytes": size}
@@ -0,0 +1,209 @@
+# cython: language_level=3
+import contextvars
+import functools
+import json
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Optional
+
+DEFAULT_MAX_SPANS = 2048
+
+_job_id = contextvars.ContextVar("transmeet_job_id", default=None)
+
+
+@dataclass
+class Span:
+    """One timed stage: ``started_at`` is wall-clock epoch seconds."""
+    name: str
+    job_id: Optional[str]
+    started_at: float
+    duration_s: float
+    attributes: dict = field(default_factory=dict)
+    error: Optional[str] = None
+
+
+@dataclass
+class StageStats:
+    count: int = 0
+    errors: int = 0
+    total_s: float = 0.0
+    max_s: float = 0.0
+
+    def add(self, span: Span):
+        self.count += 1
+        self.errors += span.error is not None
+        self.total_s += span.duration_s
+        self.max_s = max(self.max_s, span.duration_s)
+
+
+class Tracer:
+    """
+    Collects spans from every thread. Per-stage totals cover the whole run;
+    only the most recent ``max_spans`` spans are kept individually.
+    """
+
+    def __init__(self, max_spans: int = DEFAULT_MAX_SPANS):
+        self.spans = deque(maxlen=max_spans)
+        self.stages: Dict[str, StageStats] = {}
+        self._lock = Lock()
+
+    def record(self, span: Span):
+        with self._lock:
+            self.spans.append(span)
+            self.stages.setdefault(span.name, StageStats()).add(span)
+
+    @contextmanager
+    def span(self, name: str, **attributes):
+        """
+        Time the enclosed block as stage ``name`` under the current job. The
+        attributes dict is yielded so the block can add to it.
+        """
+        started_at = time.time()
+        start = time.perf_counter()
+        error = None
+        try:
+            yield attributes
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            self.record(Span(name, _job_id.get(), started_at, time.perf_counter() - start, attributes, error))
+
+    def report(self, include_spans: bool = False) -> dict:
+        with self._lock:
+            stages = {
+                name: {**asdict(stats), "mean_s": stats.total_s / stats.count if stats.count else 0.0}
+                for name, stats in self.stages.items()
+            }
+            spans = [asdict(s) for s in self.spans] if include_spans else None
+        report = {"stages": stages}
+        if spans is not None:
+            report["spans"] = spans
+        return report
+
+    def reset(self):
+        with self._lock:
+            self.spans.clear()
+            self.stages.clear()
+
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    return _tracer
+
+
+def span(name: str, **attributes):
+    """``with span("encode", chunk=3): ...`` on the process-wide tracer."""
+    return _tracer.span(name, **attributes)
+
+
+def current_job_id() -> Optional[str]:
+    return _job_id.get()
+
+
+@contextmanager
+def job(job_id: Optional[str] = None):
+    """
+    Tag spans and log records in this context with ``job_id``. Without an id,
+    an enclosing job's id is kept, or a new one is generated.
+    """
+    token = _job_id.set(job_id or _job_id.get() or uuid.uuid4().hex[:12])
+    try:
+        yield _job_id.get()
+    finally:
+        _job_id.reset(token)
+
+
+def in_current_context(fn):
+    """
+    Wrap ``fn`` to run in a copy of the caller's context, so work submitted to
+    a thread pool keeps the current job id.
+    """
+    context = contextvars.copy_context()
+
+    @functools.wraps(fn)
+    def run(*args, **kwargs):
+        # A context can only be entered by one thread at a time, so each call gets its own copy.
+        return context.copy().run(fn, *args, **kwargs)
+    return run
+
+
+def run_report(include_spans: bool = False) -> dict:
+    """Per-stage timings plus the per-model usage totals from ``get_usage_stats``."""
+    from transmeet.llm.token_tracker import get_usage_stats
+
+    report = _tracer.report(include_spans=include_spans)
+    report["usage"] = get_usage_stats()
+    report["generated_at"] = time.time()
+    return report
+
+
+def _label(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_prometheus(report: dict) -> str:
+    """Render a ``run_report`` in the Prometheus text exposition format."""
+    lines = []
+
+    def metric(name, kind, help_text, samples):
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for labels, value in samples:
+            label_text = ",".join(f'{k}="{_label(v)}"' for k, v in labels.items())
+            lines.append(f"{name}{{{label_text}}} {value}")
+
+    stages = report.get("stages", {})
+    metric("transmeet_stage_seconds_total", "counter", "Time spent in each stage.",
+           [({"stage": n}, s["total_s"]) for n, s in stages.items()])
+    metric("transmeet_stage_calls_total", "counter", "Number of times each stage ran.",
+           [({"stage": n}, s["count"]) for n, s in stages.items()])
+    metric("transmeet_stage_errors_total", "counter", "Stage runs that raised.",
+           [({"stage": n}, s["errors"]) for n, s in stages.items()])
+    metric("transmeet_stage_max_seconds", "gauge", "Slowest single run of each stage.",
+           [({"stage": n}, s["max_s"]) for n, s in stages.items()])
+
+    usage = report.get("usage", {})
+
+    def usage_labels(key):
+        provider, _, model = key.partition("/")
+        return {"provider": provider, "model": model}
+
+    for field_name, metric_name, help_text in (
+            ("requests", "transmeet_requests_total", "Provider requests."),
+            ("prompt_tokens", "transmeet_prompt_tokens_total", "Prompt tokens."),
+            ("completion_tokens", "transmeet_completion_tokens_total", "Completion tokens."),
+            ("audio_seconds", "transmeet_audio_seconds_total", "Seconds of audio transcribed."),
+            ("hedges", "transmeet_hedged_requests_total", "Duplicate requests sent for straggling chunks."),
+            ("cost_usd", "transmeet_cost_usd_total", "Estimated cost in USD.")):
+        metric(metric_name, "counter", help_text,
+               [(usage_labels(key), totals[field_name]) for key, totals in usage.items()])
+    return "\n".join(lines) + "\n"
+
+
+def write_run_report(path, fmt: Optional[str] = None, include_spans: bool = True) -> dict:
+    """
+    Write the run report to ``path`` as JSON, or in Prometheus text format when
+    ``fmt`` is "prometheus" or the file name ends in ".prom".
+    """
+    path = Path(path)
+    fmt = fmt or ("prometheus" if path.suffix == ".prom" else "json")
+    report = run_report(include_spans=include_spans and fmt == "json")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        if fmt == "prometheus":
+            f.write(format_prometheus(report))
+        else:
+            json.dump(report, f, indent=2)
+    return report
+
+
+def reset_tracing():
+    _tracer.reset()
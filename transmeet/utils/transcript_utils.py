@@ -0,0 +1,83 @@
+# cython: language_level=3
+import math
+import re
+
+DEFAULT_OVERLAP_S = 2.0
+# Upper bound on speech rate, used to size the overlap search window.
+WORDS_PER_OVERLAP_SECOND = 4
+# Words at a chunk edge that may be cut off or garbled by the transcriber.
+EDGE_SLACK_WORDS = 2
+MIN_MATCH_WORDS = 2
+
+
+def _normalize_word(word: str) -> str:
+    return re.sub(r"[^\w']", "", word.lower())
+
+
+def overlap_window(overlap_s: float) -> int:
+    """Most words the shared audio of ``overlap_s`` seconds can hold on one side, edge words included."""
+    return math.ceil(max(0.0, overlap_s) * WORDS_PER_OVERLAP_SECOND) + EDGE_SLACK_WORDS
+
+
+def _matching_runs(tail, head, min_match):
+    """Every maximal run of equal words as ``(start in tail, start in head, length)``."""
+    for i in range(len(tail)):
+        for j in range(len(head)):
+            if tail[i] != head[j] or (i and j and tail[i - 1] == head[j - 1]):
+                continue
+            size = 0
+            while i + size < len(tail) and j + size < len(head) and tail[i + size] == head[j + size]:
+                size += 1
+            if size >= min_match:
+                yield i, j, size
+
+
+def merge_overlapping_words(left, right, overlap_s=DEFAULT_OVERLAP_S, min_match=MIN_MATCH_WORDS):
+    """
+    Merge two word lists whose boundary regions were transcribed from the same audio.
+
+    Only the last and first ``overlap_window(overlap_s)`` words are compared. A
+    matching run is accepted only if the run, the ``left`` words after it and the
+    ``right`` words before it (the words a cut there would drop) fit together in
+    that window. Among those, the run that drops the fewest words wins (then the
+    longest), so a phrase repeated nearby such as "I think that" cannot stand in
+    for the real overlap. The words are joined in the middle of the run, so
+    truncated words at either chunk edge are dropped.
+    Falls back to plain concatenation when no run qualifies.
+    """
+    window = overlap_window(overlap_s)
+    tail = [_normalize_word(w) for w in left[-window:]]
+    head = [_normalize_word(w) for w in right[:window]]
+
+    best = None
+    for i, j, size in _matching_runs(tail, head, min_match):
+        trailing = len(tail) - (i + size)  # left words after the run
+        leading = j  # right words before the run
+        # The run and the words it would drop together make up the implied overlap.
+        if trailing + leading + size > window:
+            continue
+        key = (trailing + leading, -size)
+        if best is None or key < best[0]:
+            best = (key, i, j, size)
+    if best is None:
+        return left + right
+
+    _, i, j, size = best
+    keep = size // 2
+    cut_left = len(left) - len(tail) + i + keep
+    cut_right = j + keep
+    return left[:cut_left] + right[cut_right:]
+
+
+def stitch_transcripts(texts, overlap_s=DEFAULT_OVERLAP_S, min_match=MIN_MATCH_WORDS) -> str:
+    """
+    Join chunk transcripts in order, removing words duplicated by chunk overlap.
+    ``overlap_s`` is the audio shared by neighbouring chunks, in seconds.
+    """
+    words = []
+    for text in texts:
+        chunk_words = (text or "").split()
+        if not chunk_words:
+            continue
+        words = merge_overlapping_words(words, chunk_words, overlap_s, min_match) if words else chunk_words
+    return " ".join(words)